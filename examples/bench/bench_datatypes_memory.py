@@ -0,0 +1,67 @@
+"""
+Resident memory and attribute access cost of a loan book scan result: slotted
+datatypes vs the same fields in plain dataclasses with a per-instance __dict__.
+
+    python examples/bench/bench_datatypes_memory.py [loans]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass, fields
+from time import perf_counter
+from ffsdk.lend.datatypes import (
+    UserLoanInfo,
+    UserLoanInfoBorrow,
+    UserLoanInfoCollateral,
+)
+
+
+def plain(cls):
+    """Returns a plain (unslotted) dataclass with the fields of cls"""
+    annotations = {f.name: f.type for f in fields(cls)}
+    return dataclass(type(f"Plain{cls.__name__}", (), {"__annotations__": annotations}))
+
+
+def scan(loanCls, collateralCls, borrowCls, count: int) -> list:
+    """Builds count loans with two collaterals and one borrow each"""
+    loans = []
+    for i in range(count):
+        collaterals = [
+            collateralCls(i, j, 10**14, 8000, 10**14, i, i, i, i, 10**15, 10**15)
+            for j in range(2)
+        ]
+        borrows = [
+            borrowCls(i, 2, 10**14, False, 12000, i, i, i, i, i, 0, 0, 10**16, 10**16)
+        ]
+        loans.append(
+            loanCls("A", "B", collaterals, borrows, 0, 0, i, i, i, i, i, 5000, 5000, 0)
+        )
+    return loans
+
+
+def measure(name: str, classes: tuple, count: int):
+    tracemalloc.start()
+    loans = scan(*classes, count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = perf_counter()
+    total = 0
+    for loan in loans:
+        total += loan.totalEffectiveCollateralBalanceValue
+        for c in loan.collaterals:
+            total += c.effectiveBalanceValue
+        for b in loan.borrows:
+            total += b.effectiveBorrowBalanceValue
+    elapsed = perf_counter() - start
+    print(f"{name:8} {size / 2**20:8.1f} MiB {elapsed * 1e3:8.1f} ms/pass")
+
+
+def main(count: int = 50_000):
+    slotted = (UserLoanInfo, UserLoanInfoCollateral, UserLoanInfoBorrow)
+    measure("plain", tuple(plain(cls) for cls in slotted), count)
+    measure("slotted", slotted, count)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
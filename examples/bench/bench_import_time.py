@@ -0,0 +1,53 @@
+"""
+Cold-start cost of the SDK: wall time of importing ffsdk modules and of first
+use of lazily loaded ABI contracts and lending configs, each in a fresh
+interpreter.
+
+    python examples/bench/bench_import_time.py [repeats]
+"""
+
+import subprocess
+import sys
+from statistics import median
+
+CASES = {
+    "python startup": "pass",
+    "import algosdk": "import algosdk.v2client.algod",
+    "import ffsdk": "import ffsdk",
+    "import ffsdk.client": "import ffsdk.client",
+    "import ffsdk.lend.loan": "import ffsdk.lend.loan",
+    "import ffsdk.router.client": "import ffsdk.router.client",
+    "import ffsdk.xalgo.consensus": "import ffsdk.xalgo.consensus",
+    "first use of loan ABI": (
+        "from ffsdk.lend.abi_contracts import loanABIContract;"
+        "loanABIContract.get_method_by_name('borrow')"
+    ),
+    "first use of mainnet config": (
+        "from ffsdk.config import Network;"
+        "from ffsdk.lend.lending_config import LENDING_CONFIGS;"
+        "LENDING_CONFIGS[Network.MAINNET]"
+    ),
+}
+
+TIMER = "import time; _t = time.perf_counter(); {stmt}; print(time.perf_counter() - _t)"
+
+
+def run_case(stmt: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", TIMER.format(stmt=stmt)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(out.split()[-1])
+
+
+def main(repeats: int = 5):
+    print(f"{'case':32} {'median ms':>10} {'min ms':>10}")
+    for name, stmt in CASES.items():
+        times = [run_case(stmt) for _ in range(repeats)]
+        print(f"{name:32} {median(times) * 1000:10.1f} {min(times) * 1000:10.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,70 @@
+"""
+Bulk transaction construction: AtomicTransactionComposer vs method call templates.
+
+    python examples/bench/bench_txn_templates.py [count]
+"""
+
+import sys
+from time import perf_counter
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.encoding import msgpack_encode
+from algosdk.transaction import SuggestedParams
+from ffsdk.config import Network
+from ffsdk.lend.abi_contracts import loanABIContract
+from ffsdk.lend.datatypes import LoanType
+from ffsdk.lend.lending_config import LENDING_CONFIGS
+from ffsdk.lend.loan import prepareAddCollateralToLoan
+from ffsdk.transaction_utils import signer, sp_fee, remove_signer_and_group
+
+config = LENDING_CONFIGS[Network.MAINNET]
+loanAppId = config.loans[LoanType.GENERAL]
+pool = config.pools["ALGO"]
+params = SuggestedParams(
+    1000, 1, 1001, "wGHE2Pwdvd7S12BL5FaOP20EGYesN73ktiC1qzkkit8=", "mainnet-v1.0"
+)
+users = [(generate_account()[1], generate_account()[1]) for _ in range(100)]
+
+
+def with_composer(userAddr: str, escrowAddr: str):
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        sender=userAddr,
+        signer=signer,
+        app_id=loanAppId,
+        method=loanABIContract.get_method_by_name("add_collateral"),
+        method_args=[
+            escrowAddr,
+            pool.fAssetId,
+            pool.appId,
+            pool.poolManagerIndex,
+            pool.loans[loanAppId],
+            config.pool_manager_app_id,
+        ],
+        sp=sp_fee(params, fee=2000),
+    )
+    return remove_signer_and_group(atc.build_group())[0]
+
+
+def with_template(userAddr: str, escrowAddr: str):
+    return prepareAddCollateralToLoan(
+        loanAppId, config.pool_manager_app_id, userAddr, escrowAddr, pool, params
+    )
+
+
+def main(count: int = 10_000):
+    for userAddr, escrowAddr in users:
+        assert msgpack_encode(with_composer(userAddr, escrowAddr)) == msgpack_encode(
+            with_template(userAddr, escrowAddr)
+        )
+
+    for build in (with_composer, with_template):
+        start = perf_counter()
+        for i in range(count):
+            build(*users[i % len(users)])
+        elapsed = perf_counter() - start
+        print(f"{build.__name__:15} {elapsed / count * 1e6:8.1f} us/txn")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -2,7 +2,7 @@ from algosdk.v2client.algod import AlgodClient
 from ffsdk.state_utils import AlgodIndexerCombo
 from ffsdk.client import FFMainnetClient
 from ffsdk.lend.constants.mainnet_constants import MainnetPactLPFarms
-from ffsdk.lend.deposit import retrievePoolManagerInfo, retrievePoolInfo
+from ffsdk.lend.deposit import retrievePoolManagerInfo
 from ffsdk.lend.deposit_staking import retrieveDepositStakingInfo
 from ffsdk.lend.formulae import calcWithdrawReturn
 from ffsdk.lend.utils import depositStakingProgramsInfo
@@ -28,6 +28,7 @@ oracle_prices = getOraclePrices(client.indexer, client.oracle)
 dpi = depositStakingProgramsInfo(dsi, pmi, client.pools, oracle_prices)
 pool_deposit_staking_info = {dspi.poolAppId: dspi for dspi in dpi}
 pools_by_asset = {pool.assetId: pool for name, pool in client.pools.items()}
+pools_info = client.retrieveAllPoolsInfo()
 
 print("~" * 45)
 print("Market              APR%     Total deposit($)")
@@ -35,7 +36,7 @@ print("~" * 45)
 
 # FolksFinance deposit staking programs
 for market_name, pool in client.pools.items():
-    pool_info = retrievePoolInfo(client.indexer, pool)
+    pool_info = pools_info[pool.appId]
     total_deposits = pool_info.interest.totalDeposits / ONE_6_DP
     usd_deposits = oracle_prices[pool.assetId].price * total_deposits / ONE_8_DP
     deposit_yield = pool_info.interest.depositInterestYield / ONE_14_DP
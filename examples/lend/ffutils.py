@@ -114,7 +114,7 @@ def user_loan_report(loan: UserLoanInfo, ltype: LoanType, lending_config: Lendin
     )
     print("~" * SEP)
     # get assets in user loan
-    lpAssets, baseAssetIds = getUserLoanAssets(pools, loan)
+    lpAssets, baseAssetIds = getUserLoanAssets(pools, loan, lending_config.pool_indexes)
     if lpAssets:
         raise ValueError("LP assets are not supported in loans yet")
 
@@ -1,7 +1,7 @@
 from ffsdk.client import FFMainnetClient
 from algosdk.v2client.algod import AlgodClient
 from algosdk.transaction import assign_group_id
-from ffsdk.state_utils import AlgodIndexerCombo, get_balances
+from ffsdk.state_utils import AlgodIndexerCombo
 from ffsdk.lend.datatypes import Account
 from ffsdk.lend.opup import prefixWithOpUp
 from ffsdk.xalgo.consensus import (
@@ -22,7 +22,9 @@ indexer = AlgodIndexerCombo(algod, "", "")
 # get xalgo subclient and fetch consensus state
 ff_client = FFMainnetClient(algod, indexer)
 client = ff_client.xalgo
-consensus_state = getConsensusState(client.algod, client.consensus_config)
+consensus_state = getConsensusState(
+    client.algod, client.consensus_config, ff_client.suggested_params.get()
+)
 
 # get user balances and ask stake amount
 DECIMALS = 6
@@ -53,7 +55,7 @@ print(f"calculated xALGO return: {calculated_return:_}")
 print(f"minimal xALGO amount: {min_to_receive:_}")
 
 # prepare stake transactions
-params = client.algod.suggested_params()
+params = ff_client.suggested_params.get()
 txns = prepareImmediateStakeTransactions(
     client.consensus_config,
     consensus_state,
@@ -0,0 +1,47 @@
+"""
+Checks the locally computed xALGO rate against the get_xalgo_rate simulation
+on mainnet and compares their latency.
+
+    python examples/xalgo/ff_xALGO_rate_parity.py [checks]
+"""
+
+import sys
+from time import perf_counter
+from algosdk.v2client.algod import AlgodClient
+from ffsdk.client import FFMainnetClient
+from ffsdk.state_utils import AlgodIndexerCombo
+from ffsdk.xalgo.consensus import checkXAlgoRateParity, getConsensusState
+
+algod_address = "https://mainnet-api.algonode.cloud"
+algod_token = ""
+algod = AlgodClient(algod_token, algod_address)
+indexer = AlgodIndexerCombo(algod, "", "")
+
+ff_client = FFMainnetClient(algod, indexer)
+client = ff_client.xalgo
+
+
+def main(checks: int = 10):
+    params = ff_client.suggested_params.get()
+    passed = retried = 0
+    for _ in range(checks):
+        try:
+            checkXAlgoRateParity(client.algod, client.consensus_config, params)
+            passed += 1
+        except ValueError as e:
+            if "retry" not in str(e):
+                raise  # rate mismatch
+            retried += 1
+    print(f"parity: {passed} passed, {retried} skipped (round changed)")
+
+    for name, kwargs in (
+        ("simulated", {"params": params}),
+        ("local", {"localRate": True}),
+    ):
+        start = perf_counter()
+        getConsensusState(client.algod, client.consensus_config, **kwargs)
+        print(f"{name:10} {(perf_counter() - start) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -1,7 +1,7 @@
 from ffsdk.client import FFMainnetClient
 from algosdk.v2client.algod import AlgodClient
 from algosdk.transaction import assign_group_id
-from ffsdk.state_utils import AlgodIndexerCombo, get_balances
+from ffsdk.state_utils import AlgodIndexerCombo
 from ffsdk.lend.datatypes import Account
 from ffsdk.lend.opup import prefixWithOpUp
 from ffsdk.xalgo.consensus import (
@@ -22,7 +22,9 @@ indexer = AlgodIndexerCombo(algod, "", "")
 # get xalgo subclient and fetch consensus state
 ff_client = FFMainnetClient(algod, indexer)
 client = ff_client.xalgo
-consensus_state = getConsensusState(client.algod, client.consensus_config)
+consensus_state = getConsensusState(
+    client.algod, client.consensus_config, ff_client.suggested_params.get()
+)
 
 # get user balances and ask unstake amount
 DECIMALS = 6
@@ -47,7 +49,7 @@ print(f"amount of xALGO to unstake: {burn_amount/10**DECIMALS}")
 print(f"calculated ALGO return: {min_to_receive/10**DECIMALS}")
 
 # prepare unstake transactions
-params = client.algod.suggested_params()
+params = ff_client.suggested_params.get()
 txns = prepareUnstakeTransactions(
     client.consensus_config,
     consensus_state,
@@ -1,11 +1,23 @@
-# imports
-from . import algo_liquid_governance
-from . import lend
-from . import xalgo
-from . import config
-from . import state_utils
-from . import transaction_utils
-from . import mathlib
+# imports (submodules are imported on first access)
+from .lazy import lazy_submodules
+
+__getattr__, __dir__ = lazy_submodules(
+    __name__,
+    [
+        "algo_liquid_governance",
+        "client",
+        "config",
+        "fee_sizing",
+        "lend",
+        "mathlib",
+        "metrics",
+        "readonly_calls",
+        "router",
+        "state_utils",
+        "transaction_utils",
+        "xalgo",
+    ],
+)
 
 # metadata
 __version__ = "0.3.15"
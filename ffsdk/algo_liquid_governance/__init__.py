@@ -1,3 +1,4 @@
-# imports
-from . import common
-from . import v2
+# imports (submodules are imported on first access)
+from ..lazy import lazy_submodules
+
+__getattr__, __dir__ = lazy_submodules(__name__, ["common", "v2"])
@@ -1,18 +1,18 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Dispenser:
     appId: int
     gAlgoId: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DispenserInfo:
     distributorAppIds: list[int]  # list of valid distributor app ids
     isMintingPaused: bool  # flag indicating if users can mint gALGO
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Distributor:
     appId: int
@@ -1,5 +1,6 @@
-# imports
-from . import client
-from . import constants
-from . import datatypes
-from . import governance
+# imports (submodules are imported on first access)
+from ...lazy import lazy_submodules
+
+__getattr__, __dir__ = lazy_submodules(
+    __name__, ["client", "constants", "datatypes", "governance"]
+)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class DistributorInfo:
     dispenserAppId: int  # id of dispenser app which mints gALGO
     premintEnd: int  # unix timestamp for the end of the pre-mint period
@@ -13,7 +13,7 @@ class DistributorInfo:
     isBurningPaused: bool  # flag to indicate if users can burn their ALGO for gALGO
 
 
-@dataclass
+@dataclass(slots=True)
 class UserCommitmentInfo:
     userAddress: str
     canDelegate: bool  # whether voting can be delegated to admin
@@ -22,7 +22,7 @@ class UserCommitmentInfo:
     nonCommitment: int  # amount of ALGOs the user has added after the commitment period
 
 
-@dataclass
+@dataclass(slots=True)
 class EscrowGovernaceInfo:
     version: int
     commitment: int
@@ -30,7 +30,7 @@ class EscrowGovernaceInfo:
     xGovControlAddress: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EscrowGovernanceStatus:
     balance: int
     isOnline: bool
@@ -1,6 +1,9 @@
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 from .config import Network
+from .fee_sizing import FeeSizer
+from .metrics import RequestMetrics, instrument
+from .suggested_params import SuggestedParamsProvider
 from .lend.client import LendingClient
 from .algo_liquid_governance.v2.client import AlgoLiquidGovernanceClient
 from .xalgo.client import XAlgoLiquidStakingClient
@@ -10,11 +13,27 @@ class FFClient:
     def __init__(self,
                  algod_client: AlgodClient,
                  indexer_client: IndexerClient,
-                 network: Network):
+                 network: Network,
+                 metrics: RequestMetrics | None = None,
+                 tracing: bool = False):
         self.algod = algod_client
         self.indexer = indexer_client
         self.network = network
 
+        # request metrics and OpenTelemetry spans of this client's requests
+        if metrics is None and tracing:
+            metrics = RequestMetrics()
+        self.metrics = metrics
+        if metrics is not None:
+            instrument(self.algod, metrics, tracing)
+            instrument(self.indexer, metrics, tracing)
+
+        # shared suggested params
+        self.suggested_params = SuggestedParamsProvider(self.algod)
+
+        # simulate-based fee and opup sizing
+        self.fee_sizer = FeeSizer(self.algod)
+
         # lending
         self.lending = LendingClient(self)
 
@@ -26,7 +45,8 @@ class FFClient:
 
 
 class FFTestnetClient(FFClient):
-    def __init__(self, algod_client=None, indexer_client=None):
+    def __init__(self, algod_client=None, indexer_client=None, metrics=None,
+                 tracing=False):
         if algod_client is None:
             algod_client = AlgodClient("", "https://testnet-api.4160.nodely.dev")
         if indexer_client is None:
@@ -37,12 +57,15 @@ class FFTestnetClient(FFClient):
         super().__init__(
                 algod_client,
                 indexer_client,
-                network=Network.TESTNET
+                network=Network.TESTNET,
+                metrics=metrics,
+                tracing=tracing,
         )
 
 
 class FFMainnetClient(FFClient):
-    def __init__(self, algod_client=None, indexer_client=None):
+    def __init__(self, algod_client=None, indexer_client=None, metrics=None,
+                 tracing=False):
         if algod_client is None:
             algod_client = AlgodClient("", "https://mainnet-api.algonode.cloud")
         if indexer_client is None:
@@ -51,5 +74,7 @@ class FFMainnetClient(FFClient):
         super().__init__(
                 algod_client,
                 indexer_client,
-                network=Network.MAINNET
+                network=Network.MAINNET,
+                metrics=metrics,
+                tracing=tracing,
         )
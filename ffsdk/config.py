@@ -4,6 +4,9 @@ ALGO_ASSET_ID = 0
 
 PAYOUTS_GO_ONLINE_FEE = 2_000_000
 
+# max extra opcode budget accepted by simulate
+MAX_EXTRA_OPCODE_BUDGET = 320_000
+
 
 # ENUMS
 
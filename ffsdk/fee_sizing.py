@@ -0,0 +1,182 @@
+import threading
+from copy import copy
+from math import ceil
+from algosdk.constants import MIN_TXN_FEE
+from algosdk.transaction import (
+    SignedTransaction,
+    SuggestedParams,
+    Transaction,
+    assign_group_id,
+)
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+from .config import MAX_EXTRA_OPCODE_BUDGET
+from .lend.datatypes import OpUp
+from .lend.opup import prefixWithOpUp
+
+# opcode budget added by each (top-level or inner) app call
+APP_CALL_BUDGET = 700
+# opcode budget provided by an opup prefix: 691 + 689 * num.inner.txns
+OPUP_BASE_BUDGET = 691
+OPUP_INNER_BUDGET = 689
+
+
+def group_shape_key(txns: list[Transaction]) -> tuple:
+    """
+    Returns a key identifying the shape of a transaction group: the transaction types,
+    called apps and methods, and the assets involved. Groups of the same shape need the
+    same fees and opcode budget.
+    """
+    key = []
+    for txn in txns:
+        app_args = getattr(txn, "app_args", None)
+        key.append(
+            (
+                txn.type,
+                getattr(txn, "index", None),
+                bytes(app_args[0]) if app_args else None,
+                tuple(getattr(txn, "foreign_assets", None) or ()),
+            )
+        )
+    return tuple(key)
+
+
+def _count_inner(inner_txns: list[dict]) -> tuple[int, int]:
+    """Returns the number of inner txns paid from the fee pool and of inner app calls"""
+    pooled = app_calls = 0
+    for inner in inner_txns:
+        txn = inner["txn"]["txn"]
+        if not txn.get("fee"):
+            pooled += 1
+        if txn["type"] == "appl":
+            app_calls += 1
+        p, a = _count_inner(inner.get("inner-txns", []))
+        pooled += p
+        app_calls += a
+    return pooled, app_calls
+
+
+class FeeSizer:
+    """
+    Sizes the fees and opup budget of transaction groups from a simulation, instead of
+    the fixed fees set by the prepare* functions.
+
+    Each group shape (see `group_shape_key`) is simulated once; the resulting fees and
+    opup inner transaction count are cached and applied to later groups of the same shape
+    without a network request.
+    """
+
+    def __init__(self, algod_client: AlgodClient, min_fee: int = MIN_TXN_FEE):
+        """
+        :param algod_client: algod client to simulate the groups with
+        :param min_fee: fee per transaction, including inner transactions
+        """
+        self.algod = algod_client
+        self.min_fee = min_fee
+        self._lock = threading.Lock()
+        # shape key -> (fee units per txn, num opup inner txns or None)
+        self._cache: dict[tuple, tuple[tuple[int, ...], int | None]] = {}
+
+    def simulate(self, txns: list[Transaction]) -> dict:
+        """Simulates the unsigned transaction group and returns the group result"""
+        group = assign_group_id([copy(txn) for txn in txns])
+        request = SimulateRequest(
+            txn_groups=[
+                SimulateRequestTransactionGroup(
+                    txns=[SignedTransaction(txn, None) for txn in group]
+                )
+            ],
+            allow_empty_signatures=True,
+            allow_unnamed_resources=True,
+            extra_opcode_budget=MAX_EXTRA_OPCODE_BUDGET,
+        )
+        result = self.algod.simulate_transactions(request)["txn-groups"][0]
+        if "failure-message" in result:
+            raise ValueError(f"Simulation failed: {result['failure-message']}")
+        return result
+
+    def _measure(
+        self, txns: list[Transaction], with_opup: bool
+    ) -> tuple[tuple[int, ...], int | None]:
+        result = self.simulate(txns)
+
+        units = []
+        budget = 0
+        for txn, txn_result in zip(txns, result["txn-results"]):
+            pooled, app_calls = _count_inner(
+                txn_result["txn-result"].get("inner-txns", [])
+            )
+            if txn.type == "appl":
+                app_calls += 1
+            units.append(1 + pooled)
+            budget += app_calls * APP_CALL_BUDGET
+
+        # fees of zero fee transactions (e.g. sent by escrows) are kept on the payer
+        payer = max(range(len(txns)), key=lambda i: txns[i].fee)
+        for i, txn in enumerate(txns):
+            if not txn.fee and i != payer:
+                units[payer] += units[i]
+                units[i] = 0
+
+        numInnerTransactions = None
+        deficit = result.get("app-budget-consumed", 0) - budget
+        if deficit > 0:
+            if not with_opup:
+                raise ValueError(f"Group needs {deficit} more opcode budget, use opup")
+            numInnerTransactions = max(
+                0, ceil((deficit - OPUP_BASE_BUDGET) / OPUP_INNER_BUDGET)
+            )
+        return tuple(units), numInnerTransactions
+
+    def size(
+        self,
+        txns: list[Transaction],
+        opup: OpUp | None = None,
+        userAddr: str | None = None,
+        key: tuple | None = None,
+    ) -> list[Transaction]:
+        """
+        Returns a copy of the transaction group with the fees set to the exact amounts
+        needed and, if the group exceeds its opcode budget, prefixed with the minimal opup.
+
+        :param txns: transaction group, e.g. returned by a prepare* function
+        :param opup: opup applications, required if the group needs more opcode budget
+        :param userAddr: account address for the user, sender of the opup transaction
+        :param key: cache key, defaults to the group shape key
+        :return: transaction group with sized fees (group id not assigned)
+        """
+        if key is None:
+            key = group_shape_key(txns)
+        with self._lock:
+            sizing = self._cache.get(key)
+        if sizing is None:
+            sizing = self._measure(txns, opup is not None)
+            with self._lock:
+                self._cache[key] = sizing
+        units, numInnerTransactions = sizing
+
+        sized = []
+        for txn, n in zip(txns, units):
+            txn = copy(txn)
+            txn.fee = n * self.min_fee
+            txn.group = None
+            sized.append(txn)
+        if numInnerTransactions is not None:
+            if opup is None or userAddr is None:
+                raise ValueError("Group needs opup, opup and userAddr required")
+            first = txns[0]
+            params = SuggestedParams(
+                0,
+                first.first_valid_round,
+                first.last_valid_round,
+                first.genesis_hash,
+                first.genesis_id,
+                flat_fee=True,
+            )
+            sized = prefixWithOpUp(opup, userAddr, sized, numInnerTransactions, params)
+        return sized
+
+    def clear(self) -> None:
+        """Forgets the cached sizings, e.g. after a contract update"""
+        with self._lock:
+            self._cache.clear()
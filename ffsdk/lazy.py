@@ -0,0 +1,74 @@
+import importlib
+import os
+import sys
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from algosdk.abi import Contract
+
+
+@cache
+def load_contract_file(path: str) -> "Contract":
+    """Loads ABI contract from JSON file, parsing each file only once"""
+    from algosdk.abi import Contract
+
+    with open(path, "r") as f:
+        return Contract.from_json(f.read())
+
+
+class LazyContract:
+    """
+    Stand-in for an ABI contract which is parsed from its JSON file on first use.
+
+    Behaves as the underlying algosdk Contract for attribute access,
+    e.g. `loanABIContract.get_method_by_name("borrow")`.
+    """
+
+    __slots__ = ("_path", "_contract")
+
+    def __init__(self, path: str):
+        self._path = path
+        self._contract = None
+
+    def load(self) -> "Contract":
+        if self._contract is None:
+            self._contract = load_contract_file(self._path)
+        return self._contract
+
+    def __getattr__(self, name):
+        # private names (e.g. an unset slot while unpickling) are never proxied
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyContract):
+            other = other.load()
+        return self.load() == other
+
+    def __hash__(self):
+        return hash(self._path)
+
+    def __repr__(self):
+        state = "loaded" if self._contract is not None else "not loaded"
+        return f"LazyContract({os.path.basename(self._path)!r}, {state})"
+
+
+def lazy_submodules(package: str, submodules: list[str]):
+    """
+    Returns module-level `__getattr__` and `__dir__` (PEP 562) which import
+    the given submodules of a package on first access.
+
+        __getattr__, __dir__ = lazy_submodules(__name__, ["client", "loan"])
+    """
+
+    def __getattr__(name: str):
+        if name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(submodules))
+
+    return __getattr__, __dir__
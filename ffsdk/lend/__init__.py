@@ -1,14 +1,22 @@
-# imports
-from . import abi_contracts
-from . import amm
-from . import constants
-from . import datatypes
-from . import deposit
-from . import deposit_staking
-from . import formulae
-from . import loan
-from . import lending_config
-from . import opup
-from . import oracle
-from . import utils
-from . import client
+# imports (submodules are imported on first access)
+from ..lazy import lazy_submodules
+
+__getattr__, __dir__ = lazy_submodules(
+    __name__,
+    [
+        "abi_contracts",
+        "amm",
+        "constants",
+        "datatypes",
+        "deposit",
+        "deposit_staking",
+        "formulae",
+        "loan",
+        "lending_config",
+        "opup",
+        "oracle",
+        "snapshot",
+        "utils",
+        "client",
+    ],
+)
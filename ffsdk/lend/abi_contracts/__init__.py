@@ -1,18 +1,26 @@
 import os
-from algosdk.abi import Contract
+from typing import TYPE_CHECKING
+from ...lazy import LazyContract, load_contract_file
 
+if TYPE_CHECKING:
+    from algosdk.abi import Contract
 
-def load_contract(fname_json: str) -> Contract:
+
+def load_contract(fname_json: str) -> "Contract":
     """Loads ABI contract from JSON file in the current direrctory"""
     path = os.path.dirname(os.path.abspath(__file__))
-    with open(os.path.join(path, fname_json), "r") as f:
-        contract = Contract.from_json(f.read())
-    return contract
+    return load_contract_file(os.path.join(path, fname_json))
+
+
+def lazy_contract(fname_json: str) -> LazyContract:
+    """ABI contract from JSON file in the current directory, parsed on first use"""
+    path = os.path.dirname(os.path.abspath(__file__))
+    return LazyContract(os.path.join(path, fname_json))
 
 
-depositsABIContract = load_contract("deposits.json")
-depositStakingABIContract = load_contract("deposit_staking.json")
-loanABIContract = load_contract("loan.json")
-lpTokenOracleABIContract = load_contract("lp_token_oracle.json")
-oracleAdapterABIContract = load_contract("oracle_adapter.json")
-poolABIContract = load_contract("pool.json")
+depositsABIContract = lazy_contract("deposits.json")
+depositStakingABIContract = lazy_contract("deposit_staking.json")
+loanABIContract = lazy_contract("loan.json")
+lpTokenOracleABIContract = lazy_contract("lp_token_oracle.json")
+oracleAdapterABIContract = lazy_contract("oracle_adapter.json")
+poolABIContract = lazy_contract("pool.json")
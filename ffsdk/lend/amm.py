@@ -1,4 +1,8 @@
 import json
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import monotonic
 from algosdk.v2client.indexer import IndexerClient
 from urllib.request import urlopen
 from ..state_utils import get_global_state, get_local_state_at_app, parse_uint64s
@@ -14,6 +18,74 @@ from .datatypes import (
     TinymanLendingPoolInfo,
 )
 
+PACT_POOL_URL = "https://api.pact.fi/api/pools/{}"
+TINYMAN_POOL_URL = "https://mainnet.analytics.tinyman.org/api/v1/pools/{}"
+
+
+def fetch_json(url: str) -> dict:
+    """Default fetcher of the off-chain AMM data"""
+    with urlopen(url) as response:
+        return json.load(response)
+
+
+class OffChainDataCache:
+    """
+    Thread-safe TTL cache of the off-chain AMM data (APRs, TVL) by url.
+    Concurrent requests of the same url share a single fetch.
+    """
+
+    def __init__(
+        self,
+        fetcher: Callable[[str], dict] = fetch_json,
+        ttl: float = 60.0,
+    ):
+        """
+        :param fetcher: function returning the json data of an url
+        :param ttl: seconds the fetched data stays valid
+        """
+        self.fetcher = fetcher
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: dict[str, tuple[float, Future]] = {}  # url -> (expiry, data)
+
+    def get(self, url: str) -> dict:
+        """Returns the (cached) data of the url"""
+        now = monotonic()
+        with self._lock:
+            entry = self._data.get(url)
+            if entry is not None and entry[0] > now:
+                future = entry[1]
+                owner = False
+            else:
+                future = Future()
+                self._data[url] = (now + self.ttl, future)
+                owner = True
+
+        if owner:
+            try:
+                future.set_result(self.fetcher(url))
+            except BaseException as e:
+                # do not cache failures
+                with self._lock:
+                    if self._data.get(url, (0, None))[1] is future:
+                        del self._data[url]
+                future.set_exception(e)
+        return future.result()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# shared by the calls of retrieveLendingPoolsInfo which are not given a cache
+DEFAULT_OFF_CHAIN_DATA = OffChainDataCache()
+
+
+def _fetchOffChainData(url: str, offChainData: OffChainDataCache | None) -> dict:
+    if offChainData is None:
+        return fetch_json(url)
+    return offChainData.get(url)
+
 
 def getDepositAndAdditionalInterest(
     lendingPool: LendingPool,
@@ -64,6 +136,7 @@ def retrievePactLendingPoolInfo(
     lendingPool: PactLendingPool,
     poolManagerInfo: PoolManagerInfo,
     additionalInterests: AssetsAdditionalInterest | None = None,
+    offChainData: OffChainDataCache | None = None,
 ) -> PactLendingPoolInfo:
     """
     Returns information regarding the given Pact lending pool.
@@ -72,6 +145,7 @@ def retrievePactLendingPoolInfo(
     @param lendingPool - Pact lending pool to query about
     @param poolManagerInfo - pool manager info which is returned by retrievePoolManagerInfo function
     @param additionalInterests - optional additional interest to consider
+    @param offChainData - optional cache of the off-chain pool data
     @returns Promise<LendingPoolInfo> lending pool info
     """
     state = get_global_state(client, lendingPool.lpPoolAppId)
@@ -82,8 +156,9 @@ def retrievePactLendingPoolInfo(
     ltcs = int(state.get("L", 0))
 
     # pact pool swap fee interest
-    with urlopen(f"https://api.pact.fi/api/pools/{lendingPool.lpPoolAppId}") as url:
-        pactPoolData = json.load(url)
+    pactPoolData = _fetchOffChainData(
+        PACT_POOL_URL.format(lendingPool.lpPoolAppId), offChainData
+    )
     swapFeeInterestRate = int(float(pactPoolData.get("apr_7d", 0)) * 1e16)
     tvlUsd = float(pactPoolData.get("tvl_usd", 0))
 
@@ -115,6 +190,7 @@ def retrieveTinymanLendingPoolInfo(
     lendingPool: TinymanLendingPool,
     poolManagerInfo: PoolManagerInfo,
     additionalInterests: AssetsAdditionalInterest | None = None,
+    offChainData: OffChainDataCache | None = None,
 ) -> TinymanLendingPoolInfo:
     """
     Returns information regarding the given Tinyman lending pool.
@@ -124,6 +200,7 @@ def retrieveTinymanLendingPoolInfo(
     @param lendingPool - Pact lending pool to query about
     @param poolManagerInfo - pool manager info which is returned by retrievePoolManagerInfo function
     @param additionalInterests - optional additional interest to consider
+    @param offChainData - optional cache of the off-chain pool data
     @returns Promise<LendingPoolInfo> lending pool info
     """
     state = get_local_state_at_app(client, tinymanAppId, lendingPool.lpPoolAppAddress)
@@ -136,10 +213,9 @@ def retrieveTinymanLendingPoolInfo(
     ltcs = state.get("issued_pool_tokens", 0)
 
     # pool swap fee interest
-    with urlopen(
-        f"https://mainnet.analytics.tinyman.org/api/v1/pools/{lendingPool.lpPoolAppAddress}"
-    ) as url:
-        tmPoolData = json.load(url)
+    tmPoolData = _fetchOffChainData(
+        TINYMAN_POOL_URL.format(lendingPool.lpPoolAppAddress), offChainData
+    )
 
     def zero_if_none(x):
         return 0 if x is None else x
@@ -177,3 +253,69 @@ def retrieveTinymanLendingPoolInfo(
         tvlUsd=tvlUsd,
         farmInterestYield=farmInterestYield,
     )
+
+
+def retrieveLendingPoolsInfo(
+    client: IndexerClient,
+    pactLendingPools: dict[str, PactLendingPool],
+    tinymanAppId: int,
+    tinymanLendingPools: dict[str, TinymanLendingPool],
+    poolManagerInfo: PoolManagerInfo,
+    additionalInterests: AssetsAdditionalInterest | None = None,
+    offChainData: OffChainDataCache | None = None,
+    max_workers: int = 16,
+) -> dict[str, PactLendingPoolInfo | TinymanLendingPoolInfo]:
+    """
+    Returns information regarding all the given lending pools. The on-chain state and
+    off-chain data of all pools are fetched concurrently.
+
+    @param client - Algorand client to query
+    @param pactLendingPools - Pact lending pools to query about
+    @param tinymanAppId - Tinyman application id where the Tinyman lending pools belong to
+    @param tinymanLendingPools - Tinyman lending pools to query about
+    @param poolManagerInfo - pool manager info which is returned by retrievePoolManagerInfo function
+    @param additionalInterests - optional additional interest to consider
+    @param offChainData - optional cache of the off-chain pool data, DEFAULT_OFF_CHAIN_DATA if not given
+    @param max_workers - max number of concurrent requests
+    @returns dict[str, LendingPoolInfo] lending pool info by lending pool name
+    """
+    if offChainData is None:
+        offChainData = DEFAULT_OFF_CHAIN_DATA
+    pactLendingPools = pactLendingPools or {}
+    tinymanLendingPools = tinymanLendingPools or {}
+
+    urls = [PACT_POOL_URL.format(lp.lpPoolAppId) for lp in pactLendingPools.values()]
+    urls += [
+        TINYMAN_POOL_URL.format(lp.lpPoolAppAddress)
+        for lp in tinymanLendingPools.values()
+    ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # start the off-chain requests, shared with the pool info retrievals below
+        for url in urls:
+            executor.submit(offChainData.get, url)
+
+        futures = {
+            name: executor.submit(
+                retrievePactLendingPoolInfo,
+                client,
+                lp,
+                poolManagerInfo,
+                additionalInterests,
+                offChainData,
+            )
+            for name, lp in pactLendingPools.items()
+        }
+        futures |= {
+            name: executor.submit(
+                retrieveTinymanLendingPoolInfo,
+                client,
+                tinymanAppId,
+                lp,
+                poolManagerInfo,
+                additionalInterests,
+                offChainData,
+            )
+            for name, lp in tinymanLendingPools.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
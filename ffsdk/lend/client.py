@@ -1,6 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 from ffsdk.config import Network
+from ffsdk.state_utils import AlgodIndexerCombo
+from .datatypes import PoolInfo
+from .deposit import retrievePoolInfo
 from .lending_config import LENDING_CONFIGS
 
 
@@ -27,3 +31,24 @@ class LendingClient:
         self.lending_pools = dict(
             **self.pact_lending_pools, **self.tinyman_lending_pools
         )
+
+    def current_round(self) -> int:
+        """Returns the latest round of the indexer (of algod for AlgodIndexerCombo)"""
+        if isinstance(self.indexer, AlgodIndexerCombo):
+            return self.algod.status()["last-round"]
+        return self.indexer.health()["round"]
+
+    def retrieveAllPoolsInfo(self, max_workers: int = 16) -> dict[int, PoolInfo]:
+        """
+        Returns information regarding all the pools, fetched concurrently.
+        Each pool is read at the latest round, which may differ between pools.
+
+        :param max_workers: max number of concurrent requests
+        :return: pool app id -> pool info
+        """
+        pools = list(self.pools.values())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            infos = executor.map(
+                lambda pool: retrievePoolInfo(self.indexer, pool), pools
+            )
+            return {pool.appId: info for pool, info in zip(pools, infos)}
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
@@ -11,7 +11,7 @@ class LPTokenProvider(Enum):
     PACT = 1
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class BaseLPToken:
     provider: LPTokenProvider
     lpAssetId: int
@@ -19,13 +19,13 @@ class BaseLPToken:
     asset1Id: int
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class TinymanLPToken(BaseLPToken):
     provider: LPTokenProvider = LPTokenProvider.TINYMAN
     lpPoolAddress: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class PactLPToken(BaseLPToken):
     provider: LPTokenProvider = LPTokenProvider.PACT
     lpPoolAppId: int
@@ -34,20 +34,20 @@ class PactLPToken(BaseLPToken):
 LPToken = TinymanLPToken | PactLPToken
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class BaseLendingPool(BaseLPToken):
     pool0AppId: int
     pool1AppId: int
     feeScale: int
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class PactLendingPool(BaseLendingPool):
     provider: LPTokenProvider = LPTokenProvider.PACT
     lpPoolAppId: int
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class TinymanLendingPool(BaseLendingPool):
     provider: LPTokenProvider = LPTokenProvider.TINYMAN
     lpPoolAppAddress: int
@@ -56,7 +56,7 @@ class TinymanLendingPool(BaseLendingPool):
 LendingPool = PactLendingPool | TinymanLendingPool
 
 
-@dataclass
+@dataclass(slots=True)
 class LendingPoolInterest:
     asset0DepositInterestRate: int  # 16 d.p.
     asset0DepositInterestYield: int  # approximation 16 d.p.
@@ -66,7 +66,7 @@ class LendingPoolInterest:
     additionalInterestYield: int | None  # approximation 16 d.p.
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseLendingPoolInfo:
     fAsset0Supply: int
     fAsset1Supply: int
@@ -83,12 +83,12 @@ class BaseLendingPoolInfo:
     tvlUsd: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PactLendingPoolInfo(BaseLendingPoolInfo):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TinymanLendingPoolInfo(BaseLendingPoolInfo):
     farmInterestYield: int  # 16 d.p.
 
@@ -96,14 +96,14 @@ class TinymanLendingPoolInfo(BaseLendingPoolInfo):
 # DEPOSIT TYPES
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolMetadataFromManager:
     oldVariableBorrowInterestIndex: int  # 14 d.p.
     oldDepositInterestIndex: int  # 14 d.p.
     oldTimestamp: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolStateFromManager:
     variableBorrowInterestRate: int  # 16 d.p.
     variableBorrowInterestYield: int  # approximation 16 d.p.
@@ -114,13 +114,13 @@ class PoolStateFromManager:
     metadata: PoolMetadataFromManager
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolManagerInfo:
     adminAddress: str
     pools: dict[int, PoolStateFromManager]  # poolAppId -> ...
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Pool:
     appId: int
     assetId: int
@@ -131,7 +131,7 @@ class Pool:
     loans: dict[int, int]  # loanAppId -> loanIndex
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolInfo_VariableBorrow:
     vr0: int  # 16 d.p.
     vr1: int  # 16 d.p.
@@ -142,7 +142,7 @@ class PoolInfo_VariableBorrow:
     variableBorrowInterestIndex: int  # 14 d.p.
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolInfo_StableBorrow:
     sr0: int  # 16 d.p.
     sr1: int  # 16 d.p.
@@ -158,7 +158,7 @@ class PoolInfo_StableBorrow:
     overallStableBorrowInterestAmount: int  # 16 d.p.
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolInfo_Interest:
     retentionRate: int  # 16 d.p.
     flashLoanFee: int  # 16 d.p.
@@ -170,13 +170,13 @@ class PoolInfo_Interest:
     latestUpdate: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolInfo_Caps:
     borrowCap: int  # $ value
     stableBorrowPercentageCap: int  # 16 d.p.
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolInfo_Config:
     depreciated: bool
     rewardsPaused: bool
@@ -184,7 +184,7 @@ class PoolInfo_Config:
     flashLoanSupported: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolInfo:
     poolManagerAppId: int
     poolAdminAddress: str
@@ -198,19 +198,19 @@ class PoolInfo:
     config: PoolInfo_Config
 
 
-@dataclass
+@dataclass(slots=True)
 class UserDepositHolding:
     fAssetId: int
     fAssetBalance: int
 
 
-@dataclass
+@dataclass(slots=True)
 class UserDepositInfo:
     escrowAddress: str
     holdings: list[UserDepositHolding]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserDepositFullHolding:
     fAssetId: int
     fAssetBalance: int
@@ -223,7 +223,7 @@ class UserDepositFullHolding:
     interestYield: int  # approximation 16 d.p.
 
 
-@dataclass
+@dataclass(slots=True)
 class UserDepositFullInfo:
     escrowAddress: str
     holdings: list[UserDepositFullHolding]
@@ -232,7 +232,7 @@ class UserDepositFullInfo:
 # DEPOSIT STAKING TYPES
 
 
-@dataclass
+@dataclass(slots=True)
 class DSInfoReward:
     rewardAssetId: int
     endTimestamp: int
@@ -240,7 +240,7 @@ class DSInfoReward:
     rewardPerToken: int  # 10 d.p.
 
 
-@dataclass
+@dataclass(slots=True)
 class DSInfoProgram:
     poolAppId: int
     totalStaked: int
@@ -250,12 +250,12 @@ class DSInfoProgram:
     rewards: list[DSInfoReward]
 
 
-@dataclass
+@dataclass(slots=True)
 class DepositStakingInfo:
     stakingPrograms: list[DSInfoProgram]
 
 
-@dataclass
+@dataclass(slots=True)
 class DSPInfoReward:
     rewardAssetId: int
     endTimestamp: int
@@ -265,7 +265,7 @@ class DSPInfoReward:
     rewardInterestRate: int  # 0 if past reward end timestamp, 16 d.p.
 
 
-@dataclass
+@dataclass(slots=True)
 class DepositStakingProgramInfo:
     poolAppId: int
     stakeIndex: int
@@ -280,7 +280,7 @@ class DepositStakingProgramInfo:
     rewards: list[DSPInfoReward]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserDepositStakingLocalState:
     userAddress: str
     escrowAddress: str
@@ -290,7 +290,7 @@ class UserDepositStakingLocalState:
     unclaimedRewards: list[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class UDSPInfoReward:
     rewardAssetId: int
     endTimestamp: int
@@ -300,7 +300,7 @@ class UDSPInfoReward:
     unclaimedRewardValue: int  # in $, 4 d.p.
 
 
-@dataclass
+@dataclass(slots=True)
 class UserDepositStakingProgramInfo:
     poolAppId: int
     fAssetId: int
@@ -314,7 +314,7 @@ class UserDepositStakingProgramInfo:
     rewards: list[UDSPInfoReward]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserDepositStakingInfo:
     userAddress: str
     escrowAddress: str
@@ -325,7 +325,7 @@ class UserDepositStakingInfo:
 # LOAN TYPES
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolLoanInfo:
     poolAppId: int
     assetId: int
@@ -347,7 +347,7 @@ class LoanType(Enum):
     ALGORAND_ECOSYSTEM = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class LoanInfo:
     adminAddress: str
     poolManagerAppId: int
@@ -356,13 +356,13 @@ class LoanInfo:
     pools: dict[int, PoolLoanInfo]  # poolAppId -> PoolLoanInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class LLSCollateral:
     poolAppId: int
     fAssetBalance: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LLSBorrow:
     poolAppId: int
     borrowedAmount: int
@@ -372,7 +372,7 @@ class LLSBorrow:
     latestStableChange: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LoanLocalState:
     userAddress: str
     escrowAddress: str
@@ -380,7 +380,7 @@ class LoanLocalState:
     borrows: list[LLSBorrow]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserLoanInfoCollateral:
     poolAppId: int
     assetId: int
@@ -395,7 +395,7 @@ class UserLoanInfoCollateral:
     interestYield: int  # approximation 16 d.p.
 
 
-@dataclass
+@dataclass(slots=True)
 class UserLoanInfoBorrow:
     poolAppId: int
     assetId: int
@@ -413,7 +413,7 @@ class UserLoanInfoBorrow:
     interestYield: int  # approximation 16 d.p.
 
 
-@dataclass
+@dataclass(slots=True)
 class UserLoanInfo:
     userAddress: str
     escrowAddress: str
@@ -431,7 +431,19 @@ class UserLoanInfo:
     liquidationMargin: int  # 4 d.p.
 
 
-@dataclass
+@dataclass(slots=True)
+class LoanLiquidation:
+    escrowAddr: str
+    collateralPool: Pool
+    borrowPool: Pool
+    lpAssets: list[LPToken]  # lp assets in loan
+    baseAssetIds: list[int]  # base asset ids in loan (non-lp assets)
+    repayAmount: int  # in terms of borrow pool asset
+    minCollateralAmount: int  # in terms of collateral pool f asset
+    isStable: bool
+
+
+@dataclass(slots=True)
 class AssetAdditionalInterest:
     rateBps: int  # 4 d.p.
     yieldBps: int  # 4 d.p.
@@ -443,13 +455,13 @@ AssetsAdditionalInterest = dict[int, AssetAdditionalInterest]  # assetId -> inte
 # ORACLE TYPES
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LPTokenOracle:
     appId: int
     tinymanValidatorAppId: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Oracle:
     oracle0AppId: int
     oracleAdapterAppId: int
@@ -458,7 +470,7 @@ class Oracle:
     lpTokenOracle: Optional[LPTokenOracle] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OraclePrice:
     price: int  # price in USD for amount 1 of asset in lowest denomination
     timestamp: int
@@ -467,16 +479,28 @@ class OraclePrice:
 OraclePrices = dict[int, OraclePrice]  # assetId -> OraclePrice
 
 
+# SNAPSHOT TYPES
+
+
+@dataclass(slots=True)
+class ProtocolSnapshot:
+    round: int  # latest round when the snapshot was taken
+    poolManagerInfo: PoolManagerInfo
+    loansInfo: dict[int, LoanInfo]  # loanAppId -> LoanInfo
+    oraclePrices: OraclePrices
+    loansLocalState: dict[int, list[LoanLocalState]]  # loanAppId -> loan book
+
+
 # EXTRA TYPES
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     addr: str
     sk: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OpUp:
     callerAppId: int
     baseAppId: int
@@ -485,7 +509,21 @@ class OpUp:
 # LENDING_CONFIG TYPES
 
 
-@dataclass
+@dataclass(slots=True)
+class PoolIndexes:
+    by_app_id: dict[int, Pool]  # pool app id -> Pool
+    by_fasset_id: dict[int, list[Pool]]  # fAsset id -> Pools (one if pools are valid)
+
+    @classmethod
+    def fromPools(cls, pools: dict[str, Pool]) -> "PoolIndexes":
+        indexes = cls({}, {})
+        for pool in pools.values():
+            indexes.by_app_id[pool.appId] = pool
+            indexes.by_fasset_id.setdefault(pool.fAssetId, []).append(pool)
+        return indexes
+
+
+@dataclass(slots=True)
 class LendingConfig:
     pool_manager_app_id: int
     deposits_app_id: int
@@ -497,3 +535,8 @@ class LendingConfig:
     reserve_address: str
     oracle: Oracle
     opup: OpUp
+    # derived from pools
+    pool_indexes: PoolIndexes = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.pool_indexes = PoolIndexes.fromPools(self.pools)
@@ -10,10 +10,6 @@ from algosdk.transaction import (
 from algosdk.logic import get_application_address
 from algosdk.account import generate_account
 from algosdk.encoding import encode_address
-from algosdk.atomic_transaction_composer import (
-    AtomicTransactionComposer,
-    TransactionWithSigner,
-)
 from ..mathlib import (
     ONE_16_DP,
     ONE_10_DP,
@@ -27,13 +23,12 @@ from .formulae import (
     calcDepositInterestIndex,
     calcWithdrawReturn,
 )
-from .utils import getEscrows
+from .utils import getEscrows, getPoolIndexes
 from .oracle import getOraclePrices
 from .abi_contracts import depositsABIContract, poolABIContract
+from ..method_templates import method_template
 from ..transaction_utils import (
-    signer,
     sp_fee,
-    remove_signer_and_group,
     transferAlgoOrAsset,
     addEscrowNoteTransaction,
     removeEscrowNoteTransaction,
@@ -46,6 +41,7 @@ from ..state_utils import (
 )
 from .datatypes import (
     Pool,
+    PoolIndexes,
     PoolMetadataFromManager,
     PoolStateFromManager,
     PoolManagerInfo,
@@ -234,6 +230,7 @@ def retrieveUserDepositsFullInfo(
     pools: dict[str, Pool],
     oracle: Oracle,
     userDepositsInfo: list[UserDepositInfo],
+    poolIndexes: PoolIndexes | None = None,
 ) -> list[UserDepositFullInfo]:
     """
     Returns full information regarding the given user's deposit escrows.
@@ -244,11 +241,13 @@ def retrieveUserDepositsFullInfo(
     @param pools - pools in pool manager (either MainnetPools or TestnetPools)
     @param oracle - oracle to query
     @param userDepositsInfo - user deposits info which is returned by retrieveUserDepositsInfo function
+    @param poolIndexes - indexes of the pools (e.g. LendingConfig.pool_indexes), built if not given
     @returns Promise<UserDepositFullInfo[]> user deposits full info
     """
     # get all prerequisites
     poolManagerInfo = retrievePoolManagerInfo(indexerClient, poolManagerAppId)
     prices = getOraclePrices(indexerClient, oracle)
+    poolsByFAssetId = getPoolIndexes(pools, poolIndexes).by_fasset_id
 
     # map from UserDepositInfo to ExtendedUserDepositInfo
     full_infos = []
@@ -259,7 +258,7 @@ def retrieveUserDepositsFullInfo(
             # filter out ALGO escrow holding
             if fAssetId == 0:
                 continue
-            matching_pools = [p for p in pools.values() if p.fAssetId == fAssetId]
+            matching_pools = poolsByFAssetId.get(fAssetId, [])
             if len(matching_pools) != 1:
                 raise ValueError(f"Error finding pool with fAsset {fAssetId}")
             else:
@@ -336,18 +335,14 @@ def prepareAddDepositEscrowToDeposits(
         userAddr, escrow.addr, depositsAppId, "da ", sp_fee(params, fee=2000)
     )
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        depositsABIContract, depositsAppId, "add_deposit_escrow", OnComplete.OptInOC
+    ).build(
         sender=escrow.addr,
-        signer=signer,
-        app_id=depositsAppId,
-        on_complete=OnComplete.OptInOC,
-        method=depositsABIContract.get_method_by_name("add_deposit_escrow"),
-        method_args=[TransactionWithSigner(userCall, signer)],
+        method_args=[userCall],
         rekey_to=get_application_address(depositsAppId),
         sp=sp_fee(params, fee=0),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns, escrow
 
 
@@ -374,12 +369,10 @@ def prepareOptDepositEscrowIntoAssetInDeposits(
     fAssetId = pool.fAssetId
     poolManagerIndex = pool.poolManagerIndex
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        depositsABIContract, depositsAppId, "opt_escrow_into_asset"
+    ).build(
         sender=userAddr,
-        signer=signer,
-        app_id=depositsAppId,
-        method=depositsABIContract.get_method_by_name("opt_escrow_into_asset"),
         method_args=[
             escrowAddr,
             poolManagerAppId,
@@ -389,7 +382,6 @@ def prepareOptDepositEscrowIntoAssetInDeposits(
         ],
         sp=sp_fee(params, fee=2000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -426,14 +418,10 @@ def prepareDepositIntoPool(
         sp_fee(params, fee=0),
     )
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    return method_template(poolABIContract, appId, "deposit").build(
         sender=userAddr,
-        signer=signer,
-        app_id=appId,
-        method=poolABIContract.get_method_by_name("deposit"),
         method_args=[
-            TransactionWithSigner(sendAsset, signer),
+            sendAsset,
             receiverAddr,
             assetId,
             fAssetId,
@@ -442,7 +430,6 @@ def prepareDepositIntoPool(
         sp=sp_fee(params, fee=4000),
         note=note,
     )
-    return remove_signer_and_group(atc.build_group())
 
 
 def prepareWithdrawFromDepositEscrowInDeposits(
@@ -477,12 +464,8 @@ def prepareWithdrawFromDepositEscrowInDeposits(
     fAssetId = pool.fAssetId
     poolManagerIndex = pool.poolManagerIndex
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(depositsABIContract, depositsAppId, "withdraw").build(
         sender=userAddr,
-        signer=signer,
-        app_id=depositsAppId,
-        method=depositsABIContract.get_method_by_name("withdraw"),
         method_args=[
             escrowAddr,
             receiverAddr,
@@ -497,7 +480,6 @@ def prepareWithdrawFromDepositEscrowInDeposits(
         ],
         sp=sp_fee(params, fee=2000 if remainDeposited else 6000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -534,14 +516,10 @@ def prepareWithdrawFromPool(
         sp_fee(params, fee=0),
     )
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    return method_template(poolABIContract, poolAppId, "withdraw").build(
         sender=userAddr,
-        signer=signer,
-        app_id=poolAppId,
-        method=poolABIContract.get_method_by_name("withdraw"),
         method_args=[
-            TransactionWithSigner(sendfAsset, signer),
+            sendfAsset,
             receivedAssetAmount,
             receiverAddr,
             assetId,
@@ -551,8 +529,6 @@ def prepareWithdrawFromPool(
         sp=sp_fee(params, fee=5000),
     )
 
-    return remove_signer_and_group(atc.build_group())
-
 
 def prepareUpdatePoolInterestIndexes(
     pool: Pool,
@@ -571,16 +547,13 @@ def prepareUpdatePoolInterestIndexes(
     """
     appId = pool.appId
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        poolABIContract, appId, "update_pool_interest_indexes"
+    ).build(
         sender=userAddr,
-        signer=signer,
-        app_id=appId,
-        method=poolABIContract.get_method_by_name("update_pool_interest_indexes"),
         method_args=[poolManagerAppId],
         sp=sp_fee(params, fee=2000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -604,16 +577,13 @@ def prepareOptOutDepositEscrowFromAssetInDeposits(
     poolAppId = pool.appId
     fAssetId = pool.fAssetId
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        depositsABIContract, depositsAppId, "close_out_escrow_from_asset"
+    ).build(
         sender=userAddr,
-        signer=signer,
-        app_id=depositsAppId,
-        method=depositsABIContract.get_method_by_name("close_out_escrow_from_asset"),
         method_args=[escrowAddr, get_application_address(poolAppId), fAssetId],
         sp=sp_fee(params, fee=2000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -632,16 +602,13 @@ def prepareRemoveDepositEscrowFromDeposits(
     @param params - suggested params for the transactions with the fees overwritten
     @returns Transaction[] remove and close out deposit escrow group transaction
     """
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        depositsABIContract, depositsAppId, "remove_deposit_escrow"
+    ).build(
         sender=userAddr,
-        signer=signer,
-        app_id=depositsAppId,
-        method=depositsABIContract.get_method_by_name("remove_deposit_escrow"),
         method_args=[escrowAddr],
         sp=sp_fee(params, fee=4000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     optOutTx = ApplicationCloseOutTxn(escrowAddr, sp_fee(params, fee=0), depositsAppId)
     closeToTx = removeEscrowNoteTransaction(
         escrowAddr, userAddr, "dr ", sp_fee(params, fee=0)
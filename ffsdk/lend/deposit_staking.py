@@ -7,10 +7,6 @@ from algosdk.transaction import (
 )
 from algosdk.logic import get_application_address
 from algosdk.account import generate_account
-from algosdk.atomic_transaction_composer import (
-    AtomicTransactionComposer,
-    TransactionWithSigner,
-)
 from base64 import b64decode
 from time import time
 from .utils import getEscrows, depositStakingLocalState
@@ -22,10 +18,9 @@ from .datatypes import (
     UserDepositStakingLocalState,
     Account,
 )
+from ..method_templates import method_template
 from ..transaction_utils import (
-    signer,
     sp_fee,
-    remove_signer_and_group,
     addEscrowNoteTransaction,
     removeEscrowNoteTransaction,
 )
@@ -186,18 +181,17 @@ def prepareAddDepositStakingEscrow(
         userAddr, escrow.addr, depositStakingAppId, "fa ", sp_fee(params, fee=2000)
     )
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        depositStakingABIContract,
+        depositStakingAppId,
+        "add_f_staking_escrow",
+        OnComplete.OptInOC,
+    ).build(
         sender=escrow.addr,
-        signer=signer,
-        app_id=depositStakingAppId,
-        on_complete=OnComplete.OptInOC,
-        method=depositStakingABIContract.get_method_by_name("add_f_staking_escrow"),
-        method_args=[TransactionWithSigner(userCall, signer)],
+        method_args=[userCall],
         rekey_to=get_application_address(depositStakingAppId),
         sp=sp_fee(params, fee=0),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns, escrow
 
 
@@ -223,16 +217,13 @@ def prepareOptDepositStakingEscrowIntoAsset(
     poolAppId = pool.appId
     fAssetId = pool.fAssetId
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        depositStakingABIContract, depositStakingAppId, "opt_escrow_into_asset"
+    ).build(
         sender=userAddr,
-        signer=signer,
-        app_id=depositStakingAppId,
-        method=depositStakingABIContract.get_method_by_name("opt_escrow_into_asset"),
         method_args=[escrowAddr, poolAppId, fAssetId, stakeIndex],
         sp=sp_fee(params, fee=2000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -258,18 +249,14 @@ def prepareSyncStakeInDepositStakingEscrow(
     poolAppId = pool.appId
     fAssetId = pool.fAssetId
 
-    atc = AtomicTransactionComposer()
-
-    atc.add_method_call(
+    txns = method_template(
+        depositStakingABIContract, depositStakingAppId, "sync_stake"
+    ).build(
         sender=userAddr,
-        signer=signer,
-        app_id=depositStakingAppId,
-        method=depositStakingABIContract.get_method_by_name("sync_stake"),
         method_args=[escrowAddr, poolAppId, fAssetId, stakeIndex],
         sp=sp_fee(params, fee=2000),
     )
 
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -294,17 +281,14 @@ def prepareClaimRewardsOfDepositStakingEscrow(
     @param params - suggested params for the transactions with the fees overwritten
     @returns Transaction withdraw from deposit staking escrow transaction
     """
-    atc = AtomicTransactionComposer()
 
-    atc.add_method_call(
+    txns = method_template(
+        depositStakingABIContract, depositStakingAppId, "claim_rewards"
+    ).build(
         sender=userAddr,
-        signer=signer,
-        app_id=depositStakingAppId,
-        method=depositStakingABIContract.get_method_by_name("claim_rewards"),
         method_args=[escrowAddr, receiverAddr, stakeIndex],
         sp=sp_fee(params, fee=4000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     txns[0].foreign_assets = rewardAssetIds
     return txns[0]
 
@@ -342,12 +326,10 @@ def prepareWithdrawFromDepositStakingEscrow(
     assetId = pool.assetId
     fAssetId = pool.fAssetId
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        depositStakingABIContract, depositStakingAppId, "withdraw_stake"
+    ).build(
         sender=userAddr,
-        signer=signer,
-        app_id=depositStakingAppId,
-        method=depositStakingABIContract.get_method_by_name("withdraw_stake"),
         method_args=[
             escrowAddr,
             receiverAddr,
@@ -362,7 +344,6 @@ def prepareWithdrawFromDepositStakingEscrow(
         ],
         sp=sp_fee(params, fee=6000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -386,18 +367,13 @@ def prepareOptOutDepositStakingEscrowFromAsset(
     poolAppId = pool.appId
     fAssetId = pool.fAssetId
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        depositStakingABIContract, depositStakingAppId, "close_out_escrow_from_asset"
+    ).build(
         sender=userAddr,
-        signer=signer,
-        app_id=depositStakingAppId,
-        method=depositStakingABIContract.get_method_by_name(
-            "close_out_escrow_from_asset"
-        ),
         method_args=[escrowAddr, get_application_address(poolAppId), fAssetId],
         sp=sp_fee(params, fee=3000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -416,16 +392,13 @@ def prepareRemoveDepositStakingEscrow(
     @param params - suggested params for the transactions with the fees overwritten
     @returns Transaction[] remove and close out deposit staking escrow group transaction
     """
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        depositStakingABIContract, depositStakingAppId, "remove_f_staking_escrow"
+    ).build(
         sender=userAddr,
-        signer=signer,
-        app_id=depositStakingAppId,
-        method=depositStakingABIContract.get_method_by_name("remove_f_staking_escrow"),
         method_args=[escrowAddr],
         sp=sp_fee(params, fee=2000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     optOutTx = ApplicationCloseOutTxn(escrowAddr, params, depositStakingAppId)
     closeToTx = removeEscrowNoteTransaction(escrowAddr, userAddr, "fr ", params)
     return [txns[0], optOutTx, closeToTx]
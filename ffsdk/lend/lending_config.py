@@ -1,3 +1,5 @@
+import threading
+from collections.abc import Mapping
 from ffsdk.config import Network
 from .datatypes import (
     LendingConfig,
@@ -8,30 +10,22 @@ from .datatypes import (
     Oracle,
     OpUp,
 )
-from .constants.mainnet_constants import (
-    MAINNET_POOL_MANAGER_APP_ID,
-    MAINNET_DEPOSITS_APP_ID,
-    MAINNET_DEPOSIT_STAKING_APP_ID,
-    MainnetPools,
-    MainnetLoans,
-    MainnetLendingPools,
-    MAINNET_RESERVE_ADDRESS,
-    MainnetOracle,
-    MainnetOpUp,
-)
-from .constants.testnet_constants import (
-    TESTNET_POOL_MANAGER_APP_ID,
-    TESTNET_DEPOSITS_APP_ID,
-    TestnetPools,
-    TestnetLoans,
-    TESTNET_RESERVE_ADDRESS,
-    TestnetOracle,
-    TestnetOpUp,
-)
 
 
-LENDING_CONFIGS = {
-    Network.MAINNET: LendingConfig(
+def mainnet_lending_config() -> LendingConfig:
+    from .constants.mainnet_constants import (
+        MAINNET_POOL_MANAGER_APP_ID,
+        MAINNET_DEPOSITS_APP_ID,
+        MAINNET_DEPOSIT_STAKING_APP_ID,
+        MainnetPools,
+        MainnetLoans,
+        MainnetLendingPools,
+        MAINNET_RESERVE_ADDRESS,
+        MainnetOracle,
+        MainnetOpUp,
+    )
+
+    return LendingConfig(
         MAINNET_POOL_MANAGER_APP_ID,
         MAINNET_DEPOSITS_APP_ID,
         MAINNET_DEPOSIT_STAKING_APP_ID,
@@ -50,8 +44,21 @@ LENDING_CONFIGS = {
         MAINNET_RESERVE_ADDRESS,
         Oracle(**MainnetOracle),
         OpUp(**MainnetOpUp),
-    ),
-    Network.TESTNET: LendingConfig(
+    )
+
+
+def testnet_lending_config() -> LendingConfig:
+    from .constants.testnet_constants import (
+        TESTNET_POOL_MANAGER_APP_ID,
+        TESTNET_DEPOSITS_APP_ID,
+        TestnetPools,
+        TestnetLoans,
+        TESTNET_RESERVE_ADDRESS,
+        TestnetOracle,
+        TestnetOpUp,
+    )
+
+    return LendingConfig(
         TESTNET_POOL_MANAGER_APP_ID,
         TESTNET_DEPOSITS_APP_ID,
         None,
@@ -62,5 +69,36 @@ LENDING_CONFIGS = {
         TESTNET_RESERVE_ADDRESS,
         Oracle(**TestnetOracle),
         OpUp(**TestnetOpUp),
-    ),
-}
+    )
+
+
+class LazyLendingConfigs(Mapping):
+    """Read-only mapping network -> LendingConfig, building each config on first access"""
+
+    def __init__(self, builders):
+        self._builders = builders
+        self._configs = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, network) -> LendingConfig:
+        config = self._configs.get(network)
+        if config is None:
+            with self._lock:
+                config = self._configs.get(network)
+                if config is None:
+                    config = self._configs[network] = self._builders[network]()
+        return config
+
+    def __iter__(self):
+        return iter(self._builders)
+
+    def __len__(self):
+        return len(self._builders)
+
+
+LENDING_CONFIGS = LazyLendingConfigs(
+    {
+        Network.MAINNET: mainnet_lending_config,
+        Network.TESTNET: testnet_lending_config,
+    }
+)
@@ -1,4 +1,5 @@
 from base64 import b64decode
+from copy import deepcopy
 from algosdk.v2client.indexer import IndexerClient
 from algosdk.transaction import (
     SuggestedParams,
@@ -6,14 +7,10 @@ from algosdk.transaction import (
     OnComplete,
     ApplicationCloseOutTxn,
 )
-from algosdk.atomic_transaction_composer import (
-    AtomicTransactionComposer,
-    TransactionWithSigner,
-)
 from algosdk.logic import get_application_address
 from algosdk.account import generate_account
 from algosdk.encoding import encode_address
-from .utils import getEscrows, loanLocalState, userLoanInfo
+from .utils import getEscrows, getPoolIndexes, loanLocalState, userLoanInfo
 from ..mathlib import divScale, mulScale, ONE_4_DP, ONE_10_DP
 from .formulae import (
     calcBorrowUtilisationRatio,
@@ -23,10 +20,9 @@ from .formulae import (
 from .deposit import retrievePoolManagerInfo
 from .oracle import getOraclePrices, prepareRefreshPricesInOracleAdapter
 from .abi_contracts import loanABIContract, poolABIContract
+from ..method_templates import method_template
 from ..transaction_utils import (
-    signer,
     sp_fee,
-    remove_signer_and_group,
     transferAlgoOrAsset,
     addEscrowNoteTransaction,
     removeEscrowNoteTransaction,
@@ -34,18 +30,20 @@ from ..transaction_utils import (
 from ..state_utils import (
     get_global_state,
     get_local_state_at_app,
-    format_state,
+    LazyState,
 )
 from .datatypes import (
     AssetsAdditionalInterest,
     LoanInfo,
     PoolLoanInfo,
+    LoanLiquidation,
     LoanLocalState,
     LPToken,
     UserLoanInfo,
     Oracle,
     OraclePrices,
     Pool,
+    PoolIndexes,
     PoolManagerInfo,
     Account,
 )
@@ -259,7 +257,7 @@ def retrieveLiquidatableLoans(
             user_local_state = account.get("apps-local-state", [])
             for app_local_state in user_local_state:
                 if app_local_state["id"] == loanAppId:
-                    state = format_state(app_local_state.get("key-value", []))
+                    state = LazyState(app_local_state.get("key-value", []))
                     localState = loanLocalState(state, loanAppId, escrowAddr)
                     loan = userLoanInfo(
                         localState, poolManagerInfo, loanInfo, oraclePrices
@@ -377,17 +375,24 @@ def getMaxBorrowForBorrowUtilisationRatio(
     return deltaAssetBalance
 
 
-def getUserLoanAssets(pools: dict[str, Pool], loan: UserLoanInfo) -> tuple[list, list]:
+def getUserLoanAssets(
+    pools: dict[str, Pool],
+    loan: UserLoanInfo,
+    poolIndexes: PoolIndexes | None = None,
+) -> tuple[list, list]:
     """
     Returns assets used in the loan: LP-assets and base assets
+
+    @param poolIndexes - indexes of the pools (e.g. LendingConfig.pool_indexes), built if not given
     """
     lpAssets: list[LPToken] = []
     baseAssetIds: list[int] = []
     # use set to remove duplicates (assets which are both collateral and borrow)
     loanPoolAppIds = set()
+    poolsByAppId = getPoolIndexes(pools, poolIndexes).by_app_id
 
     def getAssetFromAppId(pools: dict[str, Pool], appId: int):
-        pool = next(p for p in pools.values() if p.appId == appId)
+        pool = poolsByAppId.get(appId)
         if pool:
             return pool.assetId
         else:
@@ -430,18 +435,14 @@ def prepareCreateUserLoan(
         userAddr, escrow.addr, loanAppId, "la ", sp_fee(params, fee=2000)
     )
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        loanABIContract, loanAppId, "create_loan", OnComplete.OptInOC
+    ).build(
         sender=escrow.addr,
-        signer=signer,
-        app_id=loanAppId,
-        on_complete=OnComplete.OptInOC,
-        method=loanABIContract.get_method_by_name("create_loan"),
-        method_args=[TransactionWithSigner(userCall, signer)],
+        method_args=[userCall],
         rekey_to=get_application_address(loanAppId),
         sp=sp_fee(params, fee=0),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns, escrow
 
 
@@ -473,12 +474,8 @@ def prepareAddCollateralToLoan(
     if poolLoanIndex is None:
         raise ValueError("Pool is not in loan")
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(loanABIContract, loanAppId, "add_collateral").build(
         sender=userAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("add_collateral"),
         method_args=[
             escrowAddr,
             fAssetId,
@@ -489,7 +486,6 @@ def prepareAddCollateralToLoan(
         ],
         sp=sp_fee(params, fee=2000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -525,14 +521,10 @@ def prepareSyncCollateralInLoan(
         oracle, userAddr, lpAssets, baseAssetIds, params
     )
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(loanABIContract, loanAppId, "sync_collateral").build(
         sender=userAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("sync_collateral"),
         method_args=[
-            TransactionWithSigner(refreshPrices[-1], signer),
+            refreshPrices[-1],
             escrowAddr,
             fAssetId,
             poolAppId,
@@ -541,7 +533,6 @@ def prepareSyncCollateralInLoan(
         ],
         sp=sp_fee(params, fee=1000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return refreshPrices[:-1] + txns
 
 
@@ -585,14 +576,10 @@ def prepareReduceCollateralFromLoan(
         oracle, userAddr, lpAssets, baseAssetIds, params
     )
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(loanABIContract, loanAppId, "reduce_collateral").build(
         sender=userAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("reduce_collateral"),
         method_args=[
-            TransactionWithSigner(refreshPrices[-1], signer),
+            refreshPrices[-1],
             escrowAddr,
             receiverAddr,
             assetId,
@@ -605,7 +592,6 @@ def prepareReduceCollateralFromLoan(
         ],
         sp=sp_fee(params, fee=6000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return refreshPrices[:-1] + txns
 
 
@@ -641,12 +627,8 @@ def prepareSwapCollateralInLoanBegin(
     assetId = pool.assetId
     fAssetId = pool.fAssetId
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(loanABIContract, loanAppId, "swap_collateral_begin").build(
         sender=userAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("swap_collateral_begin"),
         method_args=[
             escrowAddr,
             receiverAddr,
@@ -660,7 +642,6 @@ def prepareSwapCollateralInLoanBegin(
         ],
         sp=sp_fee(params, fee=6000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -694,21 +675,16 @@ def prepareSwapCollateralInLoanEnd(
         oracle, userAddr, lpAssets, baseAssetIds, params
     )
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(loanABIContract, loanAppId, "swap_collateral_end").build(
         sender=userAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("swap_collateral_end"),
         method_args=[
-            TransactionWithSigner(refreshPrices[-1], signer),
+            refreshPrices[-1],
             escrowAddr,
             poolManagerAppId,
             oracleAdapterAppId,
         ],
         sp=sp_fee(params, fee=1000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return refreshPrices[:-1] + txns
 
 
@@ -732,16 +708,11 @@ def prepareRemoveCollateralFromLoan(
     poolAppId = pool.appId
     fAssetId = pool.fAssetId
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(loanABIContract, loanAppId, "remove_collateral").build(
         sender=userAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("remove_collateral"),
         method_args=[escrowAddr, fAssetId, poolAppId],
         sp=sp_fee(params, fee=2000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -790,14 +761,10 @@ def prepareBorrowFromLoan(
         oracle, userAddr, lpAssets, baseAssetIds, params
     )
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(loanABIContract, loanAppId, "borrow").build(
         sender=userAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("borrow"),
         method_args=[
-            TransactionWithSigner(refreshPrices[-1], signer),
+            refreshPrices[-1],
             escrowAddr,
             receiverAddr,
             assetId,
@@ -811,7 +778,6 @@ def prepareBorrowFromLoan(
         ],
         sp=sp_fee(params, fee=8000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return refreshPrices[:-1] + txns
 
 
@@ -839,16 +805,11 @@ def prepareSwitchBorrowTypeInLoan(
     poolAppId = pool.appId
     assetId = pool.assetId
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(loanABIContract, loanAppId, "switch_borrow_type").build(
         sender=userAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("switch_borrow_type"),
         method_args=[escrowAddr, assetId, maxStableRate, poolAppId, poolManagerAppId],
         sp=sp_fee(params, fee=6000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -891,14 +852,10 @@ def prepareRepayLoanWithTxn(
         sp_fee(params, fee=0),
     )
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    return method_template(loanABIContract, loanAppId, "repay_with_txn").build(
         sender=userAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("repay_with_txn"),
         method_args=[
-            TransactionWithSigner(sendAsset, signer),
+            sendAsset,
             escrowAddr,
             receiverAddr,
             reserveAddr,
@@ -910,7 +867,6 @@ def prepareRepayLoanWithTxn(
         ],
         sp=sp_fee(params, fee=10000),
     )
-    return remove_signer_and_group(atc.build_group())
 
 
 def prepareRepayLoanWithCollateral(
@@ -945,12 +901,8 @@ def prepareRepayLoanWithCollateral(
     fAssetId = pool.fAssetId
     frAssetId = pool.frAssetId
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(loanABIContract, loanAppId, "repay_with_collateral").build(
         sender=userAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("repay_with_collateral"),
         method_args=[
             escrowAddr,
             receiverAddr,
@@ -965,7 +917,6 @@ def prepareRepayLoanWithCollateral(
         ],
         sp=sp_fee(params, fee=14000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -1022,17 +973,12 @@ def prepareLiquidateLoan(
         sp_fee(params, fee=0),
     )
 
-    atc = AtomicTransactionComposer()
-
-    atc.add_method_call(
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("liquidate"),
+    return method_template(loanABIContract, loanAppId, "liquidate").build(
         sender=liquidatorAddr,
         sp=sp_fee(params, fee=10000),
-        signer=signer,
         method_args=[
-            TransactionWithSigner(refreshPrices[-1], signer),
-            TransactionWithSigner(sendAsset, signer),
+            refreshPrices[-1],
+            sendAsset,
             escrowAddr,
             reserveAddr,
             assetId,
@@ -1046,7 +992,96 @@ def prepareLiquidateLoan(
         ],
     )
 
-    return remove_signer_and_group(atc.build_group())
+
+def prepareLiquidateLoans(
+    loanAppId: int,
+    poolManagerAppId: int,
+    liquidatorAddr: str,
+    reserveAddr: str,
+    oracle: Oracle,
+    liquidations: list[LoanLiquidation],
+    params: SuggestedParams,
+) -> list[list[Transaction]]:
+    """
+    Returns the liquidate group transactions of many loan escrows.
+    Same as calling prepareLiquidateLoan for each liquidation, but the refresh prices
+    transactions and the suggested params are only built once and copied into each group.
+
+    @param loanAppId - loan application to repay borrows in
+    @param poolManagerAppId - pool manager application
+    @param liquidatorAddr - account address for the liquidator
+    @param reserveAddr - account address to receive the protocol revenue from the percentage of the accrued interest
+    @param oracle - oracle application to retrieve asset prices from
+    @param liquidations - loan escrows, pools and amounts to liquidate
+    @param params - suggested params for the transactions with the fees overwritten
+    @returns Transaction[][] liquidate group transactions, in the order of liquidations
+    """
+    oracleAdapterAppId = oracle.oracleAdapterAppId
+    template = method_template(loanABIContract, loanAppId, "liquidate")
+    sendParams = sp_fee(params, fee=0)
+    liquidateParams = sp_fee(params, fee=10000)
+
+    # refresh prices txn per loan assets, deep copied into each group so that
+    # groups share no mutable state (app args, foreign arrays, boxes)
+    refreshPricesByAssets: dict[tuple, list[Transaction]] = {}
+    poolAddresses: dict[int, str] = {}
+
+    groups = []
+    for liquidation in liquidations:
+        colPoolAppId = liquidation.collateralPool.appId
+        fAssetId = liquidation.collateralPool.fAssetId
+        borPoolAppId = liquidation.borrowPool.appId
+        assetId = liquidation.borrowPool.assetId
+
+        assets = (
+            tuple(lp.lpAssetId for lp in liquidation.lpAssets),
+            tuple(liquidation.baseAssetIds),
+        )
+        refreshPrices = refreshPricesByAssets.get(assets)
+        if refreshPrices is None:
+            refreshPrices = prepareRefreshPricesInOracleAdapter(
+                oracle,
+                liquidatorAddr,
+                liquidation.lpAssets,
+                liquidation.baseAssetIds,
+                params,
+            )
+            refreshPricesByAssets[assets] = refreshPrices
+
+        poolAddress = poolAddresses.get(borPoolAppId)
+        if poolAddress is None:
+            poolAddress = get_application_address(borPoolAppId)
+            poolAddresses[borPoolAppId] = poolAddress
+
+        sendAsset = transferAlgoOrAsset(
+            assetId,
+            liquidatorAddr,
+            poolAddress,
+            liquidation.repayAmount,
+            sendParams,
+        )
+
+        txns = template.build(
+            sender=liquidatorAddr,
+            sp=liquidateParams,
+            method_args=[
+                deepcopy(refreshPrices[-1]),
+                sendAsset,
+                liquidation.escrowAddr,
+                reserveAddr,
+                assetId,
+                fAssetId,
+                liquidation.minCollateralAmount,
+                liquidation.isStable,
+                colPoolAppId,
+                borPoolAppId,
+                poolManagerAppId,
+                oracleAdapterAppId,
+            ],
+        )
+        groups.append(txns)
+
+    return groups
 
 
 def prepareRebalanceUpLoan(
@@ -1071,16 +1106,11 @@ def prepareRebalanceUpLoan(
     poolAppId = pool.appId
     assetId = pool.assetId
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(loanABIContract, loanAppId, "rebalance_up").build(
         sender=rebalancerAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("rebalance_up"),
         method_args=[escrowAddr, assetId, poolAppId, poolManagerAppId],
         sp=sp_fee(params, fee=5000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -1106,16 +1136,11 @@ def prepareRebalanceDownLoan(
     poolAppId = pool.appId
     assetId = pool.assetId
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(loanABIContract, loanAppId, "rebalance_down").build(
         sender=rebalancerAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("rebalance_down"),
         method_args=[escrowAddr, assetId, poolAppId, poolManagerAppId],
         sp=sp_fee(params, fee=5000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -1134,16 +1159,11 @@ def prepareRemoveUserLoan(
     @param params - suggested params for the transactions with the fees overwritten
     @returns Transaction[] remove and close out loan escrow group transaction
     """
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(loanABIContract, loanAppId, "remove_loan").build(
         sender=userAddr,
-        signer=signer,
-        app_id=loanAppId,
-        method=loanABIContract.get_method_by_name("remove_loan"),
         method_args=[escrowAddr],
         sp=sp_fee(params, fee=4000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     optOutTx = ApplicationCloseOutTxn(escrowAddr, sp_fee(params, fee=0), loanAppId)
     closeToTx = removeEscrowNoteTransaction(
         escrowAddr, userAddr, "lr ", sp_fee(params, fee=0)
@@ -1174,16 +1194,11 @@ def prepareFlashLoanBegin(
     appId = pool.appId
     assetId = pool.assetId
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(poolABIContract, appId, "flash_loan_begin").build(
         sender=userAddr,
-        signer=signer,
-        app_id=appId,
-        method=poolABIContract.get_method_by_name("flash_loan_begin"),
         method_args=[borrowAmount, txnIndexForFlashLoanEnd, receiverAddr, assetId],
         sp=sp_fee(params, fee=2000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -1216,16 +1231,11 @@ def prepareFlashLoanEnd(
         sp_fee(params, fee=0),
     )
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    return method_template(poolABIContract, appId, "flash_loan_end").build(
         sender=userAddr,
-        signer=signer,
-        app_id=appId,
-        method=poolABIContract.get_method_by_name("flash_loan_end"),
-        method_args=[TransactionWithSigner(sendAsset, signer), reserveAddr, assetId],
+        method_args=[sendAsset, reserveAddr, assetId],
         sp=sp_fee(params, fee=3000),
     )
-    return remove_signer_and_group(atc.build_group())
 
 
 def wrapWithFlashLoan(
@@ -1,12 +1,12 @@
 from algosdk.v2client.indexer import IndexerClient
 from algosdk.encoding import encode_as_bytes
 from algosdk.transaction import Transaction, SuggestedParams
-from algosdk.atomic_transaction_composer import AtomicTransactionComposer
 from base64 import b64decode
 from .datatypes import Oracle, OraclePrice, OraclePrices, LPToken
 from .abi_contracts import oracleAdapterABIContract
 from ..state_utils import get_global_state
-from ..transaction_utils import sp_fee, signer, remove_signer_and_group
+from ..method_templates import method_template
+from ..transaction_utils import sp_fee
 
 
 def parseOracleValue(base64Value: str) -> OraclePrice:
@@ -91,20 +91,17 @@ def prepareRefreshPricesInOracleAdapter(
     if len(lpAssets) > 0:
         raise ValueError("Refresh LP assets unsupported")
 
-    atc = AtomicTransactionComposer()
-
     # prepare refresh prices arguments
     oracle1AppId = oracle.oracle1AppId if oracle.oracle1AppId else 0
     lpTokenOracleAppId = lpTokenOracle.appId if lpTokenOracle else 0
     lpAssetIds = [lpa.lpAssetId for lpa in lpAssets]
 
     # refresh prices
-    atc.add_method_call(
-        app_id=oracleAdapterAppId,
-        method=oracleAdapterABIContract.get_method_by_name("refresh_prices"),
+    return method_template(
+        oracleAdapterABIContract, oracleAdapterAppId, "refresh_prices"
+    ).build(
         sender=userAddr,
         sp=sp_fee(params, fee=1000),
-        signer=signer,
         method_args=[
             lpAssetIds,
             baseAssetIds,
@@ -113,6 +110,3 @@ def prepareRefreshPricesInOracleAdapter(
             lpTokenOracleAppId,
         ],
     )
-
-    # build
-    return remove_signer_and_group(atc.build_group())
@@ -0,0 +1,320 @@
+"""
+Protocol snapshots shared between processes.
+
+A single publisher fetches and decodes the pool manager, loans, oracle prices and
+loan book once per round, and writes the snapshot into a named shared memory block.
+Worker processes attach to the block by name and read the latest snapshot without
+fetching anything.
+
+Layout of the shared memory block:
+
+    header       magic, layout version, slot size, generation, active slot
+    slot headers seq, round, length, generation (one per slot)
+    slots        two pickled snapshots (double buffered)
+
+The publisher writes the inactive slot and then flips the active one. Each slot is
+guarded by a seqlock: its seq is odd while being written and is bumped again once
+written, so readers detect and retry torn reads. The generation counts the published
+snapshots and is what readers poll to be notified of a new one. It is also written in
+the slot header, so a reader seeing a header half updated (new generation, previous
+active slot) detects the mismatch and retries.
+
+Readers unpickle the snapshot straight from the block, without copying it first, once
+per generation: the block saves each worker the requests and the decoding of the
+protocol state, not building its own Python objects.
+
+Snapshots are pickled: only attach to blocks published by trusted processes.
+"""
+
+import io
+import os
+import pickle
+import struct
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, is_dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from operator import attrgetter
+from time import monotonic, sleep
+from algosdk.v2client.indexer import IndexerClient
+from .datatypes import LoanLocalState, Oracle, ProtocolSnapshot
+from .deposit import retrievePoolManagerInfo
+from .loan import retrieveLoanInfo
+from .oracle import getOraclePrices
+from .utils import getAppEscrowsWithState, loanLocalState
+
+MAGIC = b"FFSS"
+LAYOUT_VERSION = 2
+NUM_SLOTS = 2
+DEFAULT_SLOT_SIZE = 32 * 2**20  # bytes
+
+_HEADER = struct.Struct("<4sIQQI4x")  # magic, version, slot size, generation, active
+_SLOT_HEADER = struct.Struct("<QQQQ")  # seq, round, length, generation
+_DATA_OFFSET = 128
+
+
+def _slotHeaderOffset(slot: int) -> int:
+    return _HEADER.size + slot * _SLOT_HEADER.size
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """Pickles dataclasses as constructor calls: smaller and faster than slot states"""
+
+    _getters: dict[type, Callable | None] = {}
+
+    def reducer_override(self, obj):
+        cls = type(obj)
+        getter = self._getters.get(cls, NotImplemented)
+        if getter is NotImplemented:
+            getter = None
+            if is_dataclass(cls) and all(f.init for f in fields(cls)):
+                names = [f.name for f in fields(cls)]
+                if len(names) > 1:
+                    getter = attrgetter(*names)
+                else:
+                    getter = lambda obj: tuple(getattr(obj, n) for n in names)
+            self._getters[cls] = getter
+        if getter is None:
+            return NotImplemented
+        return cls, getter(obj)
+
+
+def _dumps(snapshot: ProtocolSnapshot) -> bytes:
+    buf = io.BytesIO()
+    _SnapshotPickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(snapshot)
+    return buf.getvalue()
+
+
+def retrieveProtocolSnapshot(
+    indexerClient: IndexerClient,
+    poolManagerAppId: int,
+    loanAppIds: list[int],
+    oracle: Oracle,
+    round: int,
+    max_workers: int = 16,
+) -> ProtocolSnapshot:
+    """
+    Returns the pool manager info, loans info, oracle prices and loan book, fetched
+    concurrently. Each part is read at the latest round when its request is served,
+    so parts may be a few rounds apart: the snapshot is not pinned to the given round.
+
+    @param indexerClient - Algorand indexer client to query
+    @param poolManagerAppId - pool manager application to query about
+    @param loanAppIds - loan applications to query about
+    @param oracle - oracle to query
+    @param round - round to label the snapshot with (see LendingClient.current_round)
+    @param max_workers - max number of concurrent requests
+    @returns ProtocolSnapshot protocol snapshot
+    """
+
+    def loanBook(loanAppId: int) -> list[LoanLocalState]:
+        return [
+            loanLocalState(state, loanAppId, escrowAddr)
+            for escrowAddr, state in getAppEscrowsWithState(indexerClient, loanAppId)
+        ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        poolManagerInfo = executor.submit(
+            retrievePoolManagerInfo, indexerClient, poolManagerAppId
+        )
+        oraclePrices = executor.submit(getOraclePrices, indexerClient, oracle)
+        loansInfo = {
+            appId: executor.submit(retrieveLoanInfo, indexerClient, appId)
+            for appId in loanAppIds
+        }
+        loansLocalState = {
+            appId: executor.submit(loanBook, appId) for appId in loanAppIds
+        }
+        return ProtocolSnapshot(
+            round=round,
+            poolManagerInfo=poolManagerInfo.result(),
+            loansInfo={k: v.result() for k, v in loansInfo.items()},
+            oraclePrices=oraclePrices.result(),
+            loansLocalState={k: v.result() for k, v in loansLocalState.items()},
+        )
+
+
+class SnapshotPublisher:
+    """Writes protocol snapshots into a named shared memory block. Single writer."""
+
+    def __init__(self, name: str | None = None, slot_size: int = DEFAULT_SLOT_SIZE):
+        """
+        :param name: name of the shared memory block, a random one if None
+        :param slot_size: max size in bytes of a pickled snapshot
+        """
+        self.slot_size = slot_size
+        self._shm = SharedMemory(
+            name, create=True, size=_DATA_OFFSET + NUM_SLOTS * slot_size
+        )
+        self._generation = 0
+        self._active = 0
+        _HEADER.pack_into(self._shm.buf, 0, MAGIC, LAYOUT_VERSION, slot_size, 0, 0)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block, to attach readers to"""
+        return self._shm.name
+
+    @property
+    def generation(self) -> int:
+        """Number of published snapshots"""
+        return self._generation
+
+    def publish(self, snapshot: ProtocolSnapshot) -> int:
+        """
+        Writes the snapshot and makes it the latest one.
+
+        :param snapshot: protocol snapshot
+        :return: generation of the snapshot
+        """
+        data = _dumps(snapshot)
+        if len(data) > self.slot_size:
+            raise ValueError(
+                f"Snapshot of {len(data)} bytes exceeds the slot size {self.slot_size}"
+            )
+
+        buf = self._shm.buf
+        slot = 1 - self._active if self._generation else 0
+        headerOffset = _slotHeaderOffset(slot)
+        dataOffset = _DATA_OFFSET + slot * self.slot_size
+        seq = _SLOT_HEADER.unpack_from(buf, headerOffset)[0]
+        generation = self._generation + 1
+
+        # odd seq while writing
+        _SLOT_HEADER.pack_into(
+            buf, headerOffset, seq + 1, snapshot.round, len(data), generation
+        )
+        buf[dataOffset : dataOffset + len(data)] = data
+        _SLOT_HEADER.pack_into(
+            buf, headerOffset, seq + 2, snapshot.round, len(data), generation
+        )
+
+        self._generation = generation
+        self._active = slot
+        _HEADER.pack_into(
+            buf, 0, MAGIC, LAYOUT_VERSION, self.slot_size, generation, slot
+        )
+        return generation
+
+    def close(self, unlink: bool = True) -> None:
+        """Detaches from the block and, by default, destroys it"""
+        self._shm.close()
+        if unlink:
+            if sys.version_info < (3, 13) and os.name == "posix":
+                # readers sharing our resource tracker may have unregistered the block
+                resource_tracker.register(self._shm._name, "shared_memory")
+            self._shm.unlink()
+
+    def __enter__(self) -> "SnapshotPublisher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class SnapshotReader:
+    """Reads the latest protocol snapshot from a block written by a SnapshotPublisher"""
+
+    def __init__(self, name: str, max_retries: int = 100):
+        """
+        :param name: name of the shared memory block
+        :param max_retries: max number of retries of a read torn by the publisher
+        """
+        # the publisher owns the block: do not unlink it when this process exits
+        if sys.version_info >= (3, 13):
+            self._shm = SharedMemory(name, track=False)
+        else:
+            self._shm = SharedMemory(name)
+            if os.name == "posix":
+                resource_tracker.unregister(self._shm._name, "shared_memory")
+        magic, version, slot_size, _, _ = _HEADER.unpack_from(self._shm.buf, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION:
+            self._shm.close()
+            raise ValueError(f"Not a protocol snapshot block (layout {version})")
+        self.slot_size = slot_size
+        self.max_retries = max_retries
+        self._cached: tuple[int, ProtocolSnapshot] | None = None
+
+    @property
+    def generation(self) -> int:
+        """Number of snapshots published so far"""
+        return _HEADER.unpack_from(self._shm.buf, 0)[3]
+
+    @property
+    def round(self) -> int | None:
+        """Round of the latest snapshot, None if none published"""
+        buf = self._shm.buf
+        for _ in range(self.max_retries):
+            _, _, _, generation, active = _HEADER.unpack_from(buf, 0)
+            if not generation:
+                return None
+            _, round, _, slotGeneration = _SLOT_HEADER.unpack_from(
+                buf, _slotHeaderOffset(active)
+            )
+            if slotGeneration == generation:
+                return round
+        raise RuntimeError("Could not read a consistent snapshot header")
+
+    def _readLatest(self) -> tuple[int, ProtocolSnapshot]:
+        buf = self._shm.buf
+        for _ in range(self.max_retries):
+            _, _, _, generation, active = _HEADER.unpack_from(buf, 0)
+            if not generation:
+                raise LookupError("No snapshot published yet")
+            if self._cached is not None and self._cached[0] == generation:
+                return self._cached
+
+            headerOffset = _slotHeaderOffset(active)
+            dataOffset = _DATA_OFFSET + active * self.slot_size
+            seq, _, length, slotGeneration = _SLOT_HEADER.unpack_from(buf, headerOffset)
+            if seq & 1 or slotGeneration != generation:
+                continue  # being written, or header read half updated
+            try:
+                with buf[dataOffset : dataOffset + length] as data:
+                    snapshot = pickle.loads(data)
+            except Exception:
+                if _SLOT_HEADER.unpack_from(buf, headerOffset)[0] == seq:
+                    raise
+                continue  # garbled by an overwrite while decoding
+            if _SLOT_HEADER.unpack_from(buf, headerOffset)[0] != seq:
+                continue  # overwritten while decoding
+            self._cached = (generation, snapshot)
+            return self._cached
+        raise RuntimeError("Could not read a consistent snapshot")
+
+    def read(self) -> ProtocolSnapshot:
+        """Returns the latest snapshot, decoded once per generation"""
+        return self._readLatest()[1]
+
+    def wait(
+        self,
+        generation: int = 0,
+        timeout: float | None = None,
+        poll_interval: float = 0.05,
+    ) -> tuple[int, ProtocolSnapshot] | None:
+        """
+        Waits for a snapshot newer than the given generation.
+
+        :param generation: generation already seen, 0 waits for the first snapshot
+        :param timeout: max seconds to wait, forever if None
+        :param poll_interval: seconds between polls of the header
+        :return: generation and latest snapshot, None on timeout
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        while self.generation <= generation:
+            if deadline is not None and monotonic() >= deadline:
+                return None
+            sleep(poll_interval)
+        return self._readLatest()
+
+    def close(self) -> None:
+        self._cached = None
+        self._shm.close()
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -3,7 +3,11 @@ from algosdk.logic import get_application_address
 from algosdk.encoding import encode_address
 from time import time
 from base64 import b64decode
-from ..state_utils import parse_uint64s, format_state, get_accounts_opted_into_app
+from ..state_utils import (
+    LazyState,
+    parse_uint64s,
+    get_accounts_opted_into_app,
+)
 from ..mathlib import (
     ONE_10_DP,
     ONE_12_DP,
@@ -34,6 +38,7 @@ from .datatypes import (
     LLSBorrow,
     OraclePrices,
     Pool,
+    PoolIndexes,
     PoolManagerInfo,
     UserDepositStakingInfo,
     UserDepositStakingLocalState,
@@ -45,6 +50,18 @@ from .datatypes import (
 )
 
 
+def getPoolIndexes(
+    pools: dict[str, Pool], poolIndexes: PoolIndexes | None = None
+) -> PoolIndexes:
+    """
+    Returns the given indexes of the pools (e.g. LendingConfig.pool_indexes), otherwise
+    indexes built for the given pools.
+    """
+    if poolIndexes is not None:
+        return poolIndexes
+    return PoolIndexes.fromPools(pools)
+
+
 def getEscrows(
     indexer: IndexerClient,
     userAddr: str,
@@ -88,11 +105,12 @@ def getEscrows(
 def getAppEscrowsWithState(
     indexer: IndexerClient,
     appId: int,
-) -> list[tuple[str, dict]]:
+) -> list[tuple[str, LazyState]]:
     """
     Returns all escrow accounts opted into a given app with their local state.
+    The states are read-only mappings decoding keys on access.
     """
-    all_escrows: list[tuple[str, dict]] = []
+    all_escrows: list[tuple[str, LazyState]] = []
 
     for account in get_accounts_opted_into_app(
         indexer, appId, exclude="assets,created-assets,created-apps"
@@ -101,7 +119,7 @@ def getAppEscrowsWithState(
         user_local_state = account.get("apps-local-state", [])
         for app_local_state in user_local_state:
             if app_local_state["id"] == appId:
-                state = format_state(app_local_state.get("key-value", []))
+                state = LazyState(app_local_state.get("key-value", []))
                 all_escrows.append((escrow_addr, state))
 
     return all_escrows
@@ -157,6 +175,7 @@ def depositStakingProgramsInfo(
     poolManagerInfo: PoolManagerInfo,
     pools: dict[str, Pool],
     oraclePrices: OraclePrices,
+    poolIndexes: PoolIndexes | None = None,
 ) -> list[DepositStakingProgramInfo]:
     """
     Derives deposit staking programs info from deposit staking info.
@@ -166,11 +185,13 @@ def depositStakingProgramsInfo(
     @param poolManagerInfo - pool manager info which is returned by retrievePoolManagerInfo function
     @param pools - pools in pool manager (either MainnetPools or TestnetPools)
     @param oraclePrices - oracle prices which is returned by getOraclePrices function
+    @param poolIndexes - indexes of the pools (e.g. LendingConfig.pool_indexes), built if not given
     @returns Promise<DepositStakingProgramInfo[]> deposit staking programs info
     """
 
     stakingPrograms: list[DepositStakingProgramInfo] = []
     poolManagerPools = poolManagerInfo.pools
+    poolsByAppId = getPoolIndexes(pools, poolIndexes).by_app_id
     prices = oraclePrices
 
     for sp in filter(lambda x: x.poolAppId != 0, depositStakingInfo.stakingPrograms):
@@ -180,7 +201,7 @@ def depositStakingProgramsInfo(
         stakeIndex = sp.stakeIndex
         rewards = sp.rewards
 
-        pool = next((x for x in pools.values() if x.appId == poolAppId), None)
+        pool = poolsByAppId.get(poolAppId)
         poolInfo = poolManagerPools.get(poolAppId)
         if pool is None or poolInfo is None:
             raise KeyError(f"Could not find pool {poolAppId}")
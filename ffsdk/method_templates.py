@@ -0,0 +1,199 @@
+from algosdk import abi
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    populate_foreign_array,
+)
+from algosdk.encoding import encode_address
+from algosdk.transaction import (
+    ApplicationCallTxn,
+    OnComplete,
+    SuggestedParams,
+    Transaction,
+)
+
+# kinds of method arguments
+_TXN = 0
+_ACCOUNT = 1
+_ASSET = 2
+_APPLICATION = 3
+_VALUE = 4
+
+_UINT8 = abi.UintType(8)
+
+
+def _value_encoder(abi_type: abi.ABIType):
+    """Returns function encoding a value of the given ABI type"""
+    if isinstance(abi_type, abi.UintType):
+        size = abi_type.bit_size // 8
+        limit = 1 << abi_type.bit_size
+
+        def encode_uint(value: int) -> bytes:
+            if not isinstance(value, int) or not 0 <= value < limit:
+                # defer to algosdk for the error message
+                return abi_type.encode(value)
+            return value.to_bytes(size, "big")
+
+        return encode_uint
+    return abi_type.encode
+
+
+class MethodCallTemplate:
+    """
+    Precomputed ABI method call of an application.
+
+    Method lookup, selector and argument encoders are computed once, so that
+    building a call only encodes the changing arguments. The built transactions
+    are identical to the ones produced by `AtomicTransactionComposer.add_method_call`
+    followed by `remove_signer_and_group`.
+    """
+
+    def __init__(
+        self,
+        contract: abi.Contract,
+        app_id: int,
+        method_name: str,
+        on_complete: OnComplete = OnComplete.NoOpOC,
+    ):
+        self.app_id = app_id
+        self.method = contract.get_method_by_name(method_name)
+        self.selector = self.method.get_selector()
+        self.on_complete = on_complete
+
+        self._args = []  # (kind, ABI type of transaction or value argument)
+        types = []
+        for arg in self.method.args:
+            if abi.is_abi_transaction_type(arg.type):
+                self._args.append((_TXN, arg.type))
+            elif arg.type == abi.ABIReferenceType.ACCOUNT:
+                self._args.append((_ACCOUNT, None))
+                types.append(_UINT8)
+            elif arg.type == abi.ABIReferenceType.ASSET:
+                self._args.append((_ASSET, None))
+                types.append(_UINT8)
+            elif arg.type == abi.ABIReferenceType.APPLICATION:
+                self._args.append((_APPLICATION, None))
+                types.append(_UINT8)
+            else:
+                self._args.append((_VALUE, arg.type))
+                types.append(arg.type)
+
+        # more than 15 arguments are compacted into a tuple in the last app arg
+        limit = AtomicTransactionComposer.MAX_APP_ARG_LIMIT - 2
+        self._compact = len(types) > limit + 1
+        if self._compact:
+            self._encoders = [_value_encoder(t) for t in types[:limit]]
+            self._encoders.append(abi.TupleType(types[limit:]).encode)
+            self._n_plain = limit
+        else:
+            self._encoders = [_value_encoder(t) for t in types]
+            self._n_plain = len(types)
+
+    def build(
+        self,
+        sender: str,
+        sp: SuggestedParams,
+        method_args: list,
+        accounts: list[str] | None = None,
+        foreign_apps: list[int] | None = None,
+        foreign_assets: list[int] | None = None,
+        boxes: list[tuple[int, bytes]] | None = None,
+        note: bytes | None = None,
+        lease: bytes | None = None,
+        rekey_to: str | None = None,
+    ) -> list[Transaction]:
+        """
+        Builds the method call.
+
+        :param sender: address of the sender
+        :param sp: suggested params for the application call
+        :param method_args: method arguments, transaction arguments are given as Transaction
+        :return: transaction arguments followed by the application call (ungrouped)
+        """
+        if len(method_args) != len(self._args):
+            raise ValueError(
+                "number of method arguments do not match the method signature"
+            )
+        accounts = accounts[:] if accounts else []
+        foreign_apps = foreign_apps[:] if foreign_apps else []
+        foreign_assets = foreign_assets[:] if foreign_assets else []
+
+        txns = []
+        values = []
+        for (kind, arg_type), value in zip(self._args, method_args):
+            if kind == _VALUE:
+                values.append(value)
+            elif kind == _ACCOUNT:
+                if isinstance(value, bytes):
+                    value = encode_address(value)
+                values.append(populate_foreign_array(value, accounts, sender))
+            elif kind == _ASSET:
+                values.append(populate_foreign_array(int(value), foreign_assets))
+            elif kind == _APPLICATION:
+                values.append(
+                    populate_foreign_array(int(value), foreign_apps, self.app_id)
+                )
+            else:
+                if not abi.check_abi_transaction_type(arg_type, value):
+                    raise ValueError(
+                        f"expected Transaction type {arg_type} as method argument, "
+                        f"but received: {value.type}"
+                    )
+                txns.append(value)
+
+        n = self._n_plain
+        encoders = self._encoders
+        app_args = [self.selector]
+        app_args += [encoders[i](values[i]) for i in range(n)]
+        if self._compact:
+            app_args.append(encoders[n](values[n:]))
+
+        txns.append(
+            ApplicationCallTxn(
+                sender=sender,
+                sp=sp,
+                index=self.app_id,
+                on_complete=self.on_complete,
+                app_args=app_args,
+                accounts=accounts,
+                foreign_apps=foreign_apps,
+                foreign_assets=foreign_assets,
+                note=note,
+                lease=lease,
+                rekey_to=rekey_to,
+                boxes=boxes[:] if boxes else [],
+            )
+        )
+        return txns
+
+
+# caches keyed by id of the contract (algosdk contracts are not hashable), holding
+# the contract to keep its id from being reused and to check identity on lookup
+_templates: dict[tuple, tuple[abi.Contract, MethodCallTemplate]] = {}
+_selectors: dict[tuple, tuple[abi.Contract, bytes]] = {}
+
+
+def method_template(
+    contract: abi.Contract,
+    app_id: int,
+    method_name: str,
+    on_complete: OnComplete = OnComplete.NoOpOC,
+) -> MethodCallTemplate:
+    """Returns the (cached) method call template of an application method"""
+    key = (id(contract), app_id, method_name, on_complete)
+    entry = _templates.get(key)
+    if entry is not None and entry[0] is contract:
+        return entry[1]
+    template = MethodCallTemplate(contract, app_id, method_name, on_complete)
+    _templates[key] = (contract, template)
+    return template
+
+
+def method_selector(contract: abi.Contract, method_name: str) -> bytes:
+    """Returns the (cached) selector of a contract method"""
+    key = (id(contract), method_name)
+    entry = _selectors.get(key)
+    if entry is not None and entry[0] is contract:
+        return entry[1]
+    selector = contract.get_method_by_name(method_name).get_selector()
+    _selectors[key] = (contract, selector)
+    return selector
@@ -0,0 +1,255 @@
+import json
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from algosdk.error import AlgodResponseError
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+
+@dataclass
+class RequestStats:
+    requests: int = 0
+    errors: int = 0
+    bytesSent: int = 0
+    bytesReceived: int = 0
+    latency: float = 0.0  # total seconds
+    maxLatency: float = 0.0  # seconds
+
+    def add(self, other: "RequestStats") -> None:
+        self.requests += other.requests
+        self.errors += other.errors
+        self.bytesSent += other.bytesSent
+        self.bytesReceived += other.bytesReceived
+        self.latency += other.latency
+        self.maxLatency = max(self.maxLatency, other.maxLatency)
+
+
+@dataclass
+class RequestBudget:
+    """Network usage of a block of code, filled in when the block exits."""
+
+    total: RequestStats = field(default_factory=RequestStats)
+    byEndpoint: dict[str, RequestStats] = field(default_factory=dict)
+    byCaller: dict[str, RequestStats] = field(default_factory=dict)
+
+
+# path segments which are replaced by placeholders to group requests per endpoint
+_ENDPOINT_PATTERNS = [
+    (re.compile(r"/[A-Z2-7]{58}(?=/|$)"), "/{address}"),
+    (re.compile(r"/[A-Z2-7]{52}(?=/|$)"), "/{txid}"),
+    (re.compile(r"/\d+(?=/|$)"), "/{id}"),
+]
+
+
+def endpoint_name(method: str, requrl: str) -> str:
+    """Normalises request url to an endpoint name, e.g. `GET /applications/{id}`."""
+    path = requrl.split("?", 1)[0]
+    for pattern, placeholder in _ENDPOINT_PATTERNS:
+        path = pattern.sub(placeholder, path)
+    return f"{method} {path}"
+
+
+def calling_function() -> str:
+    """Returns the outermost ffsdk function in the current call stack."""
+    caller = "<external>"
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        name = frame.f_code.co_name
+        if (
+            module.startswith("ffsdk.")
+            and module != __name__
+            and not name.startswith("_")
+            and name != "<module>"
+        ):
+            caller = f"{module}.{name}"
+        frame = frame.f_back
+    return caller
+
+
+class RequestMetrics:
+    """
+    Thread-safe counters of requests, bytes and latency of algod/indexer calls,
+    aggregated per endpoint and per calling ffsdk function.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = RequestStats()
+        self.byEndpoint: dict[str, RequestStats] = {}
+        self.byCaller: dict[str, RequestStats] = {}
+        self._budgets: list[RequestBudget] = []
+
+    def record(self, endpoint: str, caller: str, stats: RequestStats) -> None:
+        with self._lock:
+            targets = [(self.total, self.byEndpoint, self.byCaller)]
+            targets += [(b.total, b.byEndpoint, b.byCaller) for b in self._budgets]
+            for total, byEndpoint, byCaller in targets:
+                total.add(stats)
+                byEndpoint.setdefault(endpoint, RequestStats()).add(stats)
+                byCaller.setdefault(caller, RequestStats()).add(stats)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.total = RequestStats()
+            self.byEndpoint = {}
+            self.byCaller = {}
+
+    @contextmanager
+    def budget(self):
+        """
+        Context manager reporting the requests made inside a block of code.
+
+            with metrics.budget() as used:
+                retrieveUserLoansInfo(...)
+            print(used.total.requests, used.byEndpoint)
+        """
+        budget = RequestBudget()
+        with self._lock:
+            self._budgets.append(budget)
+        try:
+            yield budget
+        finally:
+            with self._lock:
+                self._budgets.remove(budget)
+
+    def report(self) -> str:
+        """Returns a plain text table of the collected metrics, slowest first."""
+        lines = []
+        for title, stats in (("endpoint", self.byEndpoint), ("caller", self.byCaller)):
+            lines.append(
+                f"{title:60} {'requests':>9} {'errors':>7} {'kB recv':>10} {'latency s':>10}"
+            )
+            for key, s in sorted(stats.items(), key=lambda kv: -kv[1].latency):
+                lines.append(
+                    f"{key:60} {s.requests:9} {s.errors:7} "
+                    f"{s.bytesReceived / 1024:10.1f} {s.latency:10.3f}"
+                )
+        return "\n".join(lines)
+
+
+def _algod_transfer(request):
+    """
+    Returns function calling algod_request for the raw body, to count its bytes, and
+    decoding it like algod_request does.
+    """
+
+    def transfer(
+        stats: RequestStats,
+        method,
+        requrl,
+        params=None,
+        data=None,
+        headers=None,
+        response_format="json",
+        **kwargs,
+    ):
+        stats.bytesSent += len(data or b"")
+        body = request(
+            method,
+            requrl,
+            params=params,
+            data=data,
+            headers=headers,
+            response_format="msgpack",  # any format but json returns the raw body
+            **kwargs,
+        )
+        stats.bytesReceived += len(body)
+        if response_format != "json":
+            return body
+        if not body:
+            return {}  # some algod responses are 200 OK with an empty body
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            raise AlgodResponseError("Failed to parse JSON response from algod") from e
+
+    return transfer
+
+
+def _indexer_transfer(request):
+    """
+    Returns function calling indexer_request, which only returns the decoded json: the
+    bytes received are estimated as the size of its compact json encoding.
+    """
+
+    def transfer(stats: RequestStats, method, requrl, params=None, data=None, **kwargs):
+        stats.bytesSent += len(data or b"")
+        result = request(method, requrl, params, data, **kwargs)
+        encoded = json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+        stats.bytesReceived += len(encoded.encode())
+        return result
+
+    return transfer
+
+
+def _instrumented(transfer, metrics: RequestMetrics, tracer, service: str):
+    def wrapper(method, requrl, *args, **kwargs):
+        endpoint = f"{service} {endpoint_name(method, requrl)}"
+        caller = calling_function()
+        stats = RequestStats(requests=1)
+        span = None
+        if tracer is not None:
+            span = tracer.start_span(endpoint)
+            span.set_attribute("ffsdk.endpoint", endpoint)
+            span.set_attribute("ffsdk.caller", caller)
+
+        start = perf_counter()
+        try:
+            return transfer(stats, method, requrl, *args, **kwargs)
+        except Exception as e:
+            stats.errors = 1
+            if span is not None:
+                span.record_exception(e)
+            raise
+        finally:
+            stats.latency = stats.maxLatency = perf_counter() - start
+            metrics.record(endpoint, caller, stats)
+            if span is not None:
+                span.set_attribute("ffsdk.bytes_received", stats.bytesReceived)
+                span.end()
+
+    wrapper._ffsdk_metrics = metrics
+    return wrapper
+
+
+def instrument(
+    client: AlgodClient | IndexerClient,
+    metrics: RequestMetrics,
+    tracing: bool = False,
+) -> AlgodClient | IndexerClient:
+    """
+    Records every request made by the given algod or indexer client into metrics.
+    Only this client instance is instrumented.
+
+    :param client: algod or indexer client to instrument (modified in place)
+    :param metrics: metrics collector
+    :param tracing: whether to emit an OpenTelemetry span per request
+        (requires the opentelemetry-api package)
+    :return: the instrumented client
+    """
+    tracer = None
+    if tracing:
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError("Tracing requires the opentelemetry-api package") from e
+        tracer = trace.get_tracer("ffsdk")
+
+    if isinstance(client, AlgodClient):
+        attr, service, transfer = "algod_request", "algod", _algod_transfer
+    elif isinstance(client, IndexerClient):
+        attr, service, transfer = "indexer_request", "indexer", _indexer_transfer
+    else:
+        raise TypeError(f"Cannot instrument {type(client).__name__}")
+
+    request = getattr(client, attr)
+    if getattr(request, "_ffsdk_metrics", None) is metrics:
+        return client  # already instrumented
+
+    setattr(client, attr, _instrumented(transfer(request), metrics, tracer, service))
+    return client
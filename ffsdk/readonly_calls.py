@@ -0,0 +1,237 @@
+import threading
+from base64 import b64decode
+from copy import copy
+from dataclasses import dataclass, field
+from typing import Any
+from algosdk import abi
+from algosdk.transaction import (
+    SignedTransaction,
+    SuggestedParams,
+    Transaction,
+    assign_group_id,
+)
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+from .config import MAX_EXTRA_OPCODE_BUDGET
+from .method_templates import method_template
+from .suggested_params import SuggestedParamsProvider
+
+# ARC-4 return value log prefix
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+# max number of transactions in a simulated group
+MAX_GROUP_SIZE = 16
+
+
+@dataclass
+class ReadOnlyCall:
+    contract: abi.Contract
+    appId: int
+    methodName: str
+    methodArgs: list = field(default_factory=list)
+
+
+def _decode_return(method: abi.Method, txn_result: dict) -> Any:
+    if method.returns.type == abi.Returns.VOID:
+        return None
+    logs = txn_result.get("logs")
+    if not logs:
+        raise ValueError(f"No return value logged by {method.name}")
+    log = b64decode(logs[-1])
+    if log[:4] != RETURN_PREFIX:
+        raise ValueError(f"No return value logged by {method.name}")
+    return method.returns.type.decode(log[4:])
+
+
+def _simulate_group(
+    algodClient: AlgodClient,
+    methods: list[abi.Method],
+    txns: list[Transaction],
+) -> tuple[int, list[Any]]:
+    group = assign_group_id([copy(txn) for txn in txns])
+    request = SimulateRequest(
+        txn_groups=[
+            SimulateRequestTransactionGroup(
+                txns=[SignedTransaction(txn, None) for txn in group]
+            )
+        ],
+        allow_empty_signatures=True,
+        allow_unnamed_resources=True,
+        extra_opcode_budget=MAX_EXTRA_OPCODE_BUDGET,
+    )
+    response = algodClient.simulate_transactions(request)
+    result = response["txn-groups"][0]
+    if "failure-message" in result:
+        raise ValueError(f"Simulation failed: {result['failure-message']}")
+    values = [
+        _decode_return(method, txn_result["txn-result"])
+        for method, txn_result in zip(methods, result["txn-results"])
+    ]
+    return response["last-round"], values
+
+
+def _simulate_calls(
+    algodClient: AlgodClient,
+    methods: list[abi.Method],
+    txns: list[Transaction],
+    return_exceptions: bool = False,
+) -> tuple[int, list[Any]]:
+    """
+    Simulates the calls in groups of 16. The calls of a failed group are simulated
+    one by one, so that a failing call only fails itself.
+
+    :return: round of the last simulation and return values (or errors)
+    """
+    round = 0
+    results = []
+    for i in range(0, len(txns), MAX_GROUP_SIZE):
+        chunk = slice(i, i + MAX_GROUP_SIZE)
+        try:
+            simulated, values = _simulate_group(
+                algodClient, methods[chunk], txns[chunk]
+            )
+        except ValueError:
+            simulated, values = 0, []
+            for method, txn in zip(methods[chunk], txns[chunk]):
+                try:
+                    single, (value,) = _simulate_group(algodClient, [method], [txn])
+                    simulated = max(simulated, single)
+                except ValueError as e:
+                    if not return_exceptions:
+                        raise ValueError(f"{method.name} of app {txn.index}: {e}")
+                    value = e
+                values.append(value)
+        round = max(round, simulated)
+        results += values
+    return round, results
+
+
+def _build_calls(
+    sender: str, calls: list[ReadOnlyCall], params: SuggestedParams
+) -> tuple[list[abi.Method], list[Transaction]]:
+    methods = []
+    txns = []
+    for call in calls:
+        template = method_template(call.contract, call.appId, call.methodName)
+        methods.append(template.method)
+        txns.append(template.build(sender, params, call.methodArgs)[-1])
+    return methods, txns
+
+
+def _call_key(txn: Transaction) -> tuple:
+    # reference args are encoded as indexes into the foreign arrays
+    return (
+        txn.index,
+        tuple(txn.app_args or ()),
+        tuple(txn.accounts or ()),
+        tuple(txn.foreign_assets or ()),
+        tuple(txn.foreign_apps or ()),
+        tuple((box.app_index, box.name) for box in txn.boxes or ()),
+    )
+
+
+def call_readonly(
+    algodClient: AlgodClient,
+    sender: str,
+    calls: list[ReadOnlyCall],
+    params: SuggestedParams,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Calls many read-only ABI methods, possibly of different apps, by simulating them
+    together: one simulate request per 16 calls. If a group of calls fails, its calls
+    are simulated one by one.
+
+    :param algodClient: algod client to simulate the calls with
+    :param sender: sender of the calls, must hold enough algo for the fees
+    :param calls: read-only method calls
+    :param params: suggested params for the calls
+    :param return_exceptions: whether to return the error of a failing call in place
+        of its return value instead of raising it
+    :return: decoded return values, in the order of the calls
+    """
+    methods, txns = _build_calls(sender, calls, params)
+    return _simulate_calls(algodClient, methods, txns, return_exceptions)[1]
+
+
+class ReadOnlyCaller:
+    """
+    Caller of read-only ABI methods which caches the return values for the current round,
+    so polling a view (e.g. the xALGO rate) costs one simulate request per block.
+
+    Cached values are labelled with the round algod simulated them at (the last-round
+    of the simulate response), which is also reported to the suggested params provider.
+    They expire when the provider's estimate of the current round, a local estimate
+    from the elapsed time, moves past that round. Calls which are not cached are
+    batched into one simulate request.
+    """
+
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        sender: str,
+        suggested_params: SuggestedParamsProvider | None = None,
+    ):
+        """
+        :param algod_client: algod client to simulate the calls with
+        :param sender: sender of the calls, must hold enough algo for the fees
+        :param suggested_params: provider of suggested params and current round
+        """
+        self.algod = algod_client
+        self.sender = sender
+        if suggested_params is None:
+            suggested_params = SuggestedParamsProvider(algod_client)
+        self.suggested_params = suggested_params
+
+        self._lock = threading.Lock()
+        self._round = -1
+        self._cache: dict[tuple, Any] = {}  # call key -> return value
+
+    def call(self, calls: list[ReadOnlyCall]) -> list[Any]:
+        """
+        Returns the return values of the read-only method calls in the current round.
+
+        :param calls: read-only method calls
+        :return: decoded return values, in the order of the calls
+        """
+        params = self.suggested_params.get()
+        methods, txns = _build_calls(self.sender, calls, params)
+        keys = [_call_key(txn) for txn in txns]
+
+        values = {}
+        missing = {}  # key -> index of the call
+        with self._lock:
+            if self.suggested_params.current_round() > self._round:
+                self._cache.clear()
+            for i, key in enumerate(keys):
+                if key in self._cache:
+                    values[key] = self._cache[key]
+                else:
+                    missing.setdefault(key, i)
+
+        if missing:
+            round, fetched = _simulate_calls(
+                self.algod,
+                [methods[i] for i in missing.values()],
+                [txns[i] for i in missing.values()],
+            )
+            values.update(zip(missing.keys(), fetched))
+            self.suggested_params.notify_round(round)
+            with self._lock:
+                if round > self._round:
+                    self._round = round
+                    self._cache.clear()
+                if round == self._round:
+                    self._cache.update(zip(missing.keys(), fetched))
+
+        return [values[key] for key in keys]
+
+    def call_one(
+        self,
+        contract: abi.Contract,
+        appId: int,
+        methodName: str,
+        methodArgs: list | None = None,
+    ) -> Any:
+        """Returns the return value of a read-only method call in the current round"""
+        calls = [ReadOnlyCall(contract, appId, methodName, methodArgs or [])]
+        return self.call(calls)[0]
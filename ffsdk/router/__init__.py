@@ -1,8 +1,18 @@
-# imports
-from . import abi_contracts
-from . import client
-from . import constants
-from . import datatypes
-from . import referrer
-from . import swap_admin
-from . import checks
+# imports (submodules are imported on first access)
+from ..lazy import lazy_submodules
+
+__getattr__, __dir__ = lazy_submodules(
+    __name__,
+    [
+        "abi_contracts",
+        "async_client",
+        "client",
+        "constants",
+        "curve",
+        "datatypes",
+        "quote_cache",
+        "referrer",
+        "swap_admin",
+        "checks",
+    ],
+)
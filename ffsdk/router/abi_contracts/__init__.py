@@ -1,13 +1,21 @@
 import os
-from algosdk.abi import Contract
+from typing import TYPE_CHECKING
+from ...lazy import LazyContract, load_contract_file
 
+if TYPE_CHECKING:
+    from algosdk.abi import Contract
 
-def load_contract(fname_json: str) -> Contract:
+
+def load_contract(fname_json: str) -> "Contract":
     """Loads ABI contract from JSON file in the current direrctory"""
     path = os.path.dirname(os.path.abspath(__file__))
-    with open(os.path.join(path, fname_json), "r") as f:
-        contract = Contract.from_json(f.read())
-    return contract
+    return load_contract_file(os.path.join(path, fname_json))
+
+
+def lazy_contract(fname_json: str) -> LazyContract:
+    """ABI contract from JSON file in the current directory, parsed on first use"""
+    path = os.path.dirname(os.path.abspath(__file__))
+    return LazyContract(os.path.join(path, fname_json))
 
 
-routerABIContract = load_contract("router.json")
+routerABIContract = lazy_contract("router.json")
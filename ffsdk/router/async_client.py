@@ -0,0 +1,191 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.v2client.algod import AlgodClient
+from ffsdk.config import Network
+from .client import BASE_URL, FolksRouterClient
+from .curve import PriceImpactCurve, geometricLadder
+from .quote_cache import QuoteCache
+from .datatypes import (
+    DiscountTiers,
+    SwapExecution,
+    SwapMode,
+    SwapParams,
+    SwapQuote,
+    SwapTransactions,
+)
+
+
+class AsyncFolksRouterClient:
+    """
+    Asyncio version of FolksRouterClient with the same API.
+
+    Requests run in worker threads over a shared pool of connections, so that many quotes
+    can be fetched concurrently (see `fetchSwapQuotes`).
+    """
+
+    def __init__(
+        self,
+        network: Network,
+        api_key=None,
+        timeout: float | None = 10.0,
+        max_concurrency: int = 16,
+        quote_cache: QuoteCache | None = None,
+        retries: int = 0,
+        base_url: str = BASE_URL,
+    ):
+        """
+        :param network: network to use
+        :param api_key: optional api key for the pro api
+        :param timeout: timeout in seconds of each request
+        :param max_concurrency: max number of concurrent requests and pooled connections
+        :param quote_cache: optional cache of the swap quotes
+        :param retries: number of retries of requests failing with a server error
+        :param base_url: url of the router api, e.g. of a local stand-in server
+        """
+        self.client = FolksRouterClient(
+            network,
+            api_key,
+            timeout=timeout,
+            pool_size=max_concurrency,
+            quote_cache=quote_cache,
+            retries=retries,
+            base_url=base_url,
+        )
+        self.network_type = self.client.network_type
+        self.network = self.client.network
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_concurrency)
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def fetchDiscountTiers(self) -> DiscountTiers:
+        return await self._run(self.client.fetchDiscountTiers)
+
+    async def fetchUserDiscount(self, userAddress: str) -> int:
+        return await self._run(self.client.fetchUserDiscount, userAddress)
+
+    async def fetchSwapQuote(
+        self,
+        params: SwapParams,
+        maxGroupSize: int | None = None,
+        feeBps: int | None = None,
+        userFeeDiscount: int | None = None,
+        referrer: str | None = None,
+    ) -> SwapQuote:
+        return await self._run(
+            self.client.fetchSwapQuote,
+            params,
+            maxGroupSize,
+            feeBps,
+            userFeeDiscount,
+            referrer,
+        )
+
+    async def fetchSwapQuotes(
+        self,
+        paramsList: list[SwapParams],
+        maxGroupSize: int | None = None,
+        feeBps: int | None = None,
+        userFeeDiscount: int | None = None,
+        referrer: str | None = None,
+        return_exceptions: bool = False,
+    ) -> list[SwapQuote | BaseException]:
+        """
+        Fetches the swap quotes of many pairs and amounts concurrently, at most
+        max_concurrency requests at a time.
+
+        :param paramsList: swap params of the quotes
+        :param return_exceptions: whether to return failed requests' exceptions in place
+            of their quotes instead of raising the first one
+        :return: quotes in the order of the params
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(params: SwapParams) -> SwapQuote:
+            async with semaphore:
+                return await self.fetchSwapQuote(
+                    params, maxGroupSize, feeBps, userFeeDiscount, referrer
+                )
+
+        return await asyncio.gather(
+            *(fetch(params) for params in paramsList),
+            return_exceptions=return_exceptions,
+        )
+
+    async def fetchPriceImpactCurve(
+        self,
+        fromAssetId: int,
+        toAssetId: int,
+        swapMode: SwapMode,
+        minAmount: int,
+        maxAmount: int,
+        numPoints: int = 16,
+        maxGroupSize: int | None = None,
+        feeBps: int | None = None,
+        ttl: float = 2.8,
+    ) -> PriceImpactCurve:
+        """
+        Samples the swap quotes of a pair over a geometric ladder of amounts, concurrently,
+        and returns the interpolated price impact curve.
+        """
+        amounts = geometricLadder(minAmount, maxAmount, numPoints)
+        quotes = await self.fetchSwapQuotes(
+            [SwapParams(fromAssetId, toAssetId, a, swapMode) for a in amounts],
+            maxGroupSize,
+            feeBps,
+        )
+        params = SwapParams(fromAssetId, toAssetId, 0, swapMode)
+        return PriceImpactCurve.fromQuotes(params, amounts, quotes, ttl)
+
+    async def prepareSwapTransactions(
+        self,
+        params: SwapParams,
+        userAddress: str,
+        slippageBps: int,
+        swapQuote: SwapQuote,
+    ) -> SwapTransactions:
+        return await self._run(
+            self.client.prepareSwapTransactions,
+            params,
+            userAddress,
+            slippageBps,
+            swapQuote,
+        )
+
+    async def executeSwap(
+        self,
+        algod: AlgodClient,
+        params: SwapParams,
+        userAddress: str,
+        slippageBps: int,
+        signer: TransactionSigner | dict[str, TransactionSigner],
+        swapQuote: SwapQuote | None = None,
+        maxGroupSize: int | None = None,
+        feeBps: int | None = None,
+        userFeeDiscount: int | None = None,
+        referrer: str | None = None,
+        waitRounds: int = 0,
+    ) -> SwapExecution:
+        """Quotes, prepares, checks, signs and submits a swap, see FolksRouterClient"""
+        return await self._run(
+            self.client.executeSwap,
+            algod,
+            params,
+            userAddress,
+            slippageBps,
+            signer,
+            swapQuote,
+            maxGroupSize,
+            feeBps,
+            userFeeDiscount,
+            referrer,
+            waitRounds,
+        )
+
+    def close(self) -> None:
+        """Closes the worker threads and pooled connections"""
+        self._executor.shutdown()
+        self.client.api.close()
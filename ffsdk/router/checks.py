@@ -4,15 +4,163 @@ from algosdk import abi
 from algosdk.logic import get_application_address
 from algosdk.transaction import Transaction, OnComplete
 from algosdk.constants import PAYMENT_TXN, ASSETTRANSFER_TXN, APPCALL_TXN
-from .datatypes import SwapMode, SwapParams, SwapQuote
+from .datatypes import SwapMode, SwapParams, SwapQuote, SwapValidationResult
 from .abi_contracts import routerABIContract
 from .constants.mainnet_constants import MAINNET_FOLKS_ROUTER_APP_ID
 from .constants.testnet_constants import TESTNET_FOLKS_ROUTER_APP_ID
 from ..mathlib import mulScale, ONE_4_DP
+from ..method_templates import method_selector
 
 
 def getHexSelector(method: str):
-    return routerABIContract.get_method_by_name(method).get_selector().hex()
+    return method_selector(routerABIContract, method).hex()
+
+
+class SwapTransactionsValidator:
+    """
+    Validator of the swap transactions prepared by the router API, with the router
+    address and method selectors of the network computed once.
+    """
+
+    def __init__(self, network: Network):
+        if network == Network.MAINNET:
+            self.folksRouterAppId = MAINNET_FOLKS_ROUTER_APP_ID
+        elif network == Network.TESTNET:
+            self.folksRouterAppId = TESTNET_FOLKS_ROUTER_APP_ID
+        else:
+            raise ValueError(f"Unknown network type: {network}")
+        self.network = network
+        self.folksRouterAddr = get_application_address(self.folksRouterAppId)
+        self.swapForwardSelector = method_selector(routerABIContract, "swap_forward")
+        self.fiEndSwapSelector = method_selector(routerABIContract, "fi_end_swap")
+        self.foEndSwapSelector = method_selector(routerABIContract, "fo_end_swap")
+
+    def validate(
+        self,
+        unsignedTxns: list[Transaction],
+        params: SwapParams,
+        userAddress: str,
+        slippageBps: int,
+        swapQuote: SwapQuote,
+    ) -> None:
+        """Checks the swap transactions, raising ValueError if they are invalid"""
+        fromAssetId, toAssetId, amount, swapMode = astuple(params)
+        folksRouterAppId = self.folksRouterAppId
+
+        sendAssetTxn = unsignedTxns[0]
+        swapForwardTxns = unsignedTxns[1:-1]
+        swapEndTxn = unsignedTxns[-1]
+        if not swapForwardTxns:
+            raise ValueError("Missing swap forward transactions")
+
+        # send algo/asset
+        if sendAssetTxn.rekey_to is not None:
+            raise ValueError("Unexpected rekey")
+        if sendAssetTxn.sender != userAddress:
+            raise ValueError("Incorrect sender")
+        if sendAssetTxn.receiver != self.folksRouterAddr:
+            raise ValueError("Incorrect receiver")
+
+        if sendAssetTxn.type == PAYMENT_TXN:
+            if fromAssetId != 0:
+                raise ValueError("Sending algo instead of the asset")
+            if sendAssetTxn.close_remainder_to is not None:
+                raise ValueError("Unexpected close remainder to")
+            sendAmount = sendAssetTxn.amt
+        elif sendAssetTxn.type == ASSETTRANSFER_TXN:
+            if fromAssetId != sendAssetTxn.index:
+                raise ValueError("Sending incorrect asset")
+            if sendAssetTxn.close_assets_to is not None:
+                raise ValueError("Unexpected close assets to")
+            sendAmount = sendAssetTxn.amount
+        else:
+            raise ValueError("Incorrect type of the first transaction")
+
+        # swap forward txns
+        for txn in swapForwardTxns:
+            if txn.sender != userAddress:
+                raise ValueError("Incorrect sender (swap_forward)")
+            if not (txn.type == APPCALL_TXN and txn.on_complete == OnComplete.NoOpOC):
+                raise ValueError("Incorrect transaction type")
+            if txn.index != folksRouterAppId:
+                raise ValueError(f"Incorrect application index: {txn.index}")
+            if txn.app_args[0] != self.swapForwardSelector:
+                raise ValueError("Incorrect selector")
+
+        # receive algo/asset
+        if swapEndTxn.sender != userAddress:
+            raise ValueError("Incorrect sender (end_swap)")
+        if not (
+            swapEndTxn.type == APPCALL_TXN
+            and swapEndTxn.on_complete == OnComplete.NoOpOC
+        ):
+            raise ValueError("Incorrect closing transaction type")
+        if swapEndTxn.index != folksRouterAppId:
+            raise ValueError("Incorrect application index")
+        swapEndSelector = swapEndTxn.app_args[0]
+        isFixedInput = swapEndSelector == self.fiEndSwapSelector
+        isFixedOutput = swapEndSelector == self.foEndSwapSelector
+        if not (
+            (isFixedInput and swapMode == SwapMode.FIXED_INPUT)
+            or (isFixedOutput and swapMode == SwapMode.FIXED_OUTPUT)
+        ):
+            raise ValueError("Incorrect swap end selector")
+
+        if _decodeUint64(swapEndTxn.app_args[1]) != toAssetId:
+            raise ValueError("Receiving incorrect algo/asset")
+        receiveAmount = _decodeUint64(swapEndTxn.app_args[2])
+
+        # check amounts
+        slippageAmount = mulScale(swapQuote.quoteAmount, int(slippageBps), ONE_4_DP)
+        if isFixedInput:
+            if amount != sendAmount:
+                raise ValueError("Sending incorrect fixed input amount")
+            if (swapQuote.quoteAmount - slippageAmount) != receiveAmount:
+                raise ValueError("Receiving incorrect fixed input amount")
+        if isFixedOutput:
+            if (swapQuote.quoteAmount + slippageAmount) != sendAmount:
+                raise ValueError("Sending incorrect fixed output amount")
+            if amount != receiveAmount:
+                raise ValueError("Receiving incorrect fixed output amount")
+
+    def validateMany(
+        self,
+        swaps: list[tuple[list[Transaction], SwapParams, str, int, SwapQuote]],
+    ) -> list[SwapValidationResult]:
+        """
+        Checks many prepared swaps.
+
+        :param swaps: (unsignedTxns, params, userAddress, slippageBps, swapQuote) of each swap
+        :return: validation result of each swap
+        """
+        results = []
+        for i, swap in enumerate(swaps):
+            try:
+                self.validate(*swap)
+            except (ValueError, IndexError, AttributeError) as e:
+                results.append(SwapValidationResult(i, False, str(e)))
+            else:
+                results.append(SwapValidationResult(i, True))
+        return results
+
+
+def _decodeUint64(value: bytes) -> int:
+    if len(value) != 8:
+        # defer to algosdk for the error message
+        return abi.UintType(64).decode(value)
+    return int.from_bytes(value, "big")
+
+
+_validators: dict[Network, SwapTransactionsValidator] = {}
+
+
+def swapTransactionsValidator(network: Network) -> SwapTransactionsValidator:
+    """Returns the (cached) swap transactions validator of the network"""
+    validator = _validators.get(network)
+    if validator is None:
+        validator = SwapTransactionsValidator(network)
+        _validators[network] = validator
+    return validator
 
 
 def checkSwapTransactions(
@@ -23,89 +171,6 @@ def checkSwapTransactions(
     slippageBps: int,
     swapQuote: SwapQuote,
 ) -> None:
-    fromAssetId, toAssetId, amount, swapMode = astuple(params)
-
-    if network == Network.MAINNET:
-        folksRouterAppId = MAINNET_FOLKS_ROUTER_APP_ID
-    elif network == Network.TESTNET:
-        folksRouterAppId = TESTNET_FOLKS_ROUTER_APP_ID
-    else:
-        raise ValueError(f"Unknown network type: {network}")
-    folksRouterAddr = get_application_address(folksRouterAppId)
-
-    sendAssetTxn = unsignedTxns[0]
-    swapForwardTxns = unsignedTxns[1:-1]
-    swapEndTxn = unsignedTxns[-1]
-    if not swapForwardTxns:
-        raise ValueError("Missing swap forward transactions")
-
-    # send algo/asset
-    if sendAssetTxn.rekey_to is not None:
-        raise ValueError("Unexpected rekey")
-    if sendAssetTxn.sender != userAddress:
-        raise ValueError("Incorrect sender")
-    if sendAssetTxn.receiver != folksRouterAddr:
-        raise ValueError("Incorrect receiver")
-
-    if sendAssetTxn.type == PAYMENT_TXN:
-        if fromAssetId != 0:
-            raise ValueError("Sending algo instead of the asset")
-        if sendAssetTxn.close_remainder_to is not None:
-            raise ValueError("Unexpected close remainder to")
-        sendAmount = sendAssetTxn.amt
-    elif sendAssetTxn.type == ASSETTRANSFER_TXN:
-        if fromAssetId != sendAssetTxn.index:
-            raise ValueError("Sending incorrect asset")
-        if sendAssetTxn.close_assets_to is not None:
-            raise ValueError("Unexpected close assets to")
-        sendAmount = sendAssetTxn.amount
-    else:
-        raise ValueError("Incorrect type of the first transaction")
-
-    # swap forward txns
-    SWAP_FORWARD_SELECTOR = getHexSelector("swap_forward")
-    for txn in swapForwardTxns:
-        if txn.sender != userAddress:
-            raise ValueError("Incorrect sender (swap_forward)")
-        if not (txn.type == APPCALL_TXN and txn.on_complete == OnComplete.NoOpOC):
-            raise ValueError("Incorrect transaction type")
-        if txn.index != folksRouterAppId:
-            raise ValueError(f"Incorrect application index: {txn.index}")
-        if txn.app_args[0].hex() != SWAP_FORWARD_SELECTOR:
-            raise ValueError("Incorrect selector")
-
-    # receive algo/asset
-    if swapEndTxn.sender != userAddress:
-        raise ValueError("Incorrect sender (end_swap)")
-    if not (
-        swapEndTxn.type == APPCALL_TXN
-        and swapEndTxn.on_complete == OnComplete.NoOpOC
-    ):
-        raise ValueError("Incorrect closing transaction type")
-    if swapEndTxn.index != folksRouterAppId:
-        raise ValueError("Incorrect application index")
-    swapEndSelector = swapEndTxn.app_args[0].hex()
-    isFixedInput = swapEndSelector == getHexSelector("fi_end_swap")
-    isFixedOutput = swapEndSelector == getHexSelector("fo_end_swap")
-    if not (
-        (isFixedInput and swapMode == SwapMode.FIXED_INPUT)
-        or (isFixedOutput and swapMode == SwapMode.FIXED_OUTPUT)
-    ):
-        raise ValueError("Incorrect swap end selector")
-
-    if abi.UintType(64).decode(swapEndTxn.app_args[1]) != toAssetId:
-        raise ValueError("Receiving incorrect algo/asset")
-    receiveAmount = abi.UintType(64).decode(swapEndTxn.app_args[2])
-
-    # check amounts
-    slippageAmount = mulScale(swapQuote.quoteAmount, int(slippageBps), ONE_4_DP)
-    if isFixedInput:
-        if amount != sendAmount:
-            raise ValueError("Sending incorrect fixed input amount")
-        if (swapQuote.quoteAmount - slippageAmount) != receiveAmount:
-            raise ValueError("Receiving incorrect fixed input amount")
-    if isFixedOutput:
-        if (swapQuote.quoteAmount + slippageAmount) != sendAmount:
-            raise ValueError("Sending incorrect fixed output amount")
-        if amount != receiveAmount:
-            raise ValueError("Receiving incorrect fixed output amount")
+    swapTransactionsValidator(network).validate(
+        unsignedTxns, params, userAddress, slippageBps, swapQuote
+    )
@@ -1,18 +1,53 @@
 from ffsdk.config import Network
+from algosdk.atomic_transaction_composer import TransactionSigner
 from algosdk.encoding import msgpack_decode
+from algosdk.transaction import wait_for_confirmation
+from algosdk.v2client.algod import AlgodClient
 from dataclasses import astuple
-from .datatypes import DiscountTiers, SwapParams, SwapQuote, SwapTransactions, Tier
+from .datatypes import (
+    DiscountTiers,
+    SwapExecution,
+    SwapParams,
+    SwapQuote,
+    SwapTransactions,
+    Tier,
+)
 from .checks import checkSwapTransactions
+from .quote_cache import QuoteCache
+from ..transaction_utils import encode_signed_group
+from time import perf_counter
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = "https://api.folksrouter.io"
 NETWORK_NAMES = {Network.MAINNET: "mainnet", Network.TESTNET: "testnet"}
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 
 
 class FolksRouterClient:
-    def __init__(self, network: Network, api_key=None):
-        """Constructor for the client used to interact with FolksFinance router"""
-        url = BASE_URL
+    def __init__(
+        self,
+        network: Network,
+        api_key=None,
+        timeout: float | None = None,
+        pool_size: int = 10,
+        quote_cache: QuoteCache | None = None,
+        retries: int = 0,
+        base_url: str = BASE_URL,
+    ):
+        """
+        Constructor for the client used to interact with FolksFinance router
+
+        :param network: network to use
+        :param api_key: optional api key for the pro api
+        :param timeout: timeout in seconds of each request
+        :param pool_size: max number of pooled connections to the router api
+        :param quote_cache: optional cache of the swap quotes
+        :param retries: number of retries of requests failing with a server error
+        :param base_url: url of the router api, e.g. of a local stand-in server
+        """
+        url = base_url
         if network == Network.TESTNET:
             url += "/testnet"
         url += "/v2"
@@ -25,6 +60,19 @@ class FolksRouterClient:
         self.url = url
         self.api = requests.Session()
         self.api.headers.update({"x-api-key": api_key})
+        adapter = HTTPAdapter(
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=0.1,
+                status_forcelist=RETRY_STATUSES,
+                raise_on_status=False,
+            ),
+        )
+        self.api.mount("https://", adapter)
+        self.api.mount("http://", adapter)
+        self.timeout = timeout
+        self.quote_cache = quote_cache
 
     def fetchDiscountTiers(self) -> DiscountTiers:
         r = self.api.get(
@@ -32,6 +80,7 @@ class FolksRouterClient:
             params={
                 "network": self.network,
             },
+            timeout=self.timeout,
         )
         r.raise_for_status()
 
@@ -49,6 +98,7 @@ class FolksRouterClient:
                 "network": self.network,
                 "userAddress": userAddress,
             },
+            timeout=self.timeout,
         )
         r.raise_for_status()
         data = r.json()["result"]
@@ -61,6 +111,29 @@ class FolksRouterClient:
         feeBps: int | None = None,
         userFeeDiscount: int | None = None,
         referrer: str | None = None,
+    ) -> SwapQuote:
+        if self.quote_cache is not None:
+            key = self.quote_cache.key(
+                self.network, params, maxGroupSize, feeBps, userFeeDiscount, referrer
+            )
+            quote = self.quote_cache.get(key, params)
+            if quote is not None:
+                return quote
+
+        quote = self._requestSwapQuote(
+            params, maxGroupSize, feeBps, userFeeDiscount, referrer
+        )
+        if self.quote_cache is not None:
+            self.quote_cache.put(key, params, quote)
+        return quote
+
+    def _requestSwapQuote(
+        self,
+        params: SwapParams,
+        maxGroupSize: int | None,
+        feeBps: int | None,
+        userFeeDiscount: int | None,
+        referrer: str | None,
     ) -> SwapQuote:
         fromAssetId, toAssetId, amount, swapMode = astuple(params)
 
@@ -77,6 +150,7 @@ class FolksRouterClient:
                 "userFeeDiscount": userFeeDiscount,
                 "referrer": referrer,
             },
+            timeout=self.timeout,
         )
         r.raise_for_status()
 
@@ -89,14 +163,15 @@ class FolksRouterClient:
             data["txnPayload"],
         )
 
-    def prepareSwapTransactions(
+    def _fetchSwapTransactions(
         self,
-        params: SwapParams,
         userAddress: str,
         slippageBps: int,
         swapQuote: SwapQuote,
     ) -> SwapTransactions:
-        # fetch transactions
+        if swapQuote.txnPayload is None:
+            raise ValueError("Approximate swap quote from cache, fetch an exact quote")
+
         r = self.api.get(
             self.url + "/prepare/swap",
             params={
@@ -104,15 +179,121 @@ class FolksRouterClient:
                 "slippageBps": slippageBps,
                 "txnPayload": swapQuote.txnPayload,
             },
+            timeout=self.timeout,
         )
         r.raise_for_status()
-        data = r.json()
+        return r.json()["result"]
+
+    def prepareSwapTransactions(
+        self,
+        params: SwapParams,
+        userAddress: str,
+        slippageBps: int,
+        swapQuote: SwapQuote,
+    ) -> SwapTransactions:
+        # fetch transactions
+        base64Txns = self._fetchSwapTransactions(userAddress, slippageBps, swapQuote)
 
         # check transactions
-        unsignedTxns = [msgpack_decode(txn) for txn in data["result"]]
+        unsignedTxns = [msgpack_decode(txn) for txn in base64Txns]
         checkSwapTransactions(
             self.network_type, unsignedTxns, params, userAddress, slippageBps, swapQuote
         )
 
         # return
-        return data["result"]
+        return base64Txns
+
+    def executeSwap(
+        self,
+        algod: AlgodClient,
+        params: SwapParams,
+        userAddress: str,
+        slippageBps: int,
+        signer: TransactionSigner | dict[str, TransactionSigner],
+        swapQuote: SwapQuote | None = None,
+        maxGroupSize: int | None = None,
+        feeBps: int | None = None,
+        userFeeDiscount: int | None = None,
+        referrer: str | None = None,
+        waitRounds: int = 0,
+    ) -> SwapExecution:
+        """
+        Quotes, prepares, checks, signs and submits a swap in one go, recording the
+        duration of each stage.
+
+        The quote is served from the quote cache if any, but an approximate quote
+        (from a nearby amount, without txnPayload) is replaced by an exact one.
+
+        :param algod: algod client to submit the swap with
+        :param signer: signer of all the transactions of the swap group, e.g. a KeySigner
+            created beforehand, or sender address -> signer of its transactions
+        :param swapQuote: quote to execute, fetched if not given
+        :param waitRounds: number of rounds to wait for the confirmation, 0 to not wait
+        :return: executed quote, transaction id and stage timings
+        """
+        timings = {}
+        start = perf_counter()
+
+        if swapQuote is None or swapQuote.txnPayload is None:
+            if swapQuote is None:
+                swapQuote = self.fetchSwapQuote(
+                    params, maxGroupSize, feeBps, userFeeDiscount, referrer
+                )
+            if swapQuote.txnPayload is None:
+                swapQuote = self._requestSwapQuote(
+                    params, maxGroupSize, feeBps, userFeeDiscount, referrer
+                )
+                if self.quote_cache is not None:
+                    # later nearby quotes are scaled from the exact one
+                    key = self.quote_cache.key(
+                        self.network,
+                        params,
+                        maxGroupSize,
+                        feeBps,
+                        userFeeDiscount,
+                        referrer,
+                    )
+                    self.quote_cache.put(key, params, swapQuote)
+            timings["quote"] = perf_counter() - start
+            start = perf_counter()
+
+        base64Txns = self._fetchSwapTransactions(userAddress, slippageBps, swapQuote)
+        timings["prepare"] = perf_counter() - start
+        start = perf_counter()
+
+        unsignedTxns = [msgpack_decode(txn) for txn in base64Txns]
+        timings["decode"] = perf_counter() - start
+        start = perf_counter()
+
+        checkSwapTransactions(
+            self.network_type, unsignedTxns, params, userAddress, slippageBps, swapQuote
+        )
+        timings["check"] = perf_counter() - start
+        start = perf_counter()
+
+        if isinstance(signer, dict):
+            signedTxns = []
+            for i, txn in enumerate(unsignedTxns):
+                if txn.sender not in signer:
+                    raise KeyError(f"No signer for sender {txn.sender}")
+                signedTxns += signer[txn.sender].sign_transactions(unsignedTxns, [i])
+        else:
+            signedTxns = signer.sign_transactions(
+                unsignedTxns, list(range(len(unsignedTxns)))
+            )
+        rawGroup = encode_signed_group(signedTxns)
+        timings["sign"] = perf_counter() - start
+        start = perf_counter()
+
+        txId = algod.send_raw_transaction(rawGroup)
+        timings["submit"] = perf_counter() - start
+
+        confirmedRound = None
+        if waitRounds:
+            start = perf_counter()
+            confirmedRound = wait_for_confirmation(algod, txId, waitRounds)[
+                "confirmed-round"
+            ]
+            timings["confirm"] = perf_counter() - start
+
+        return SwapExecution(swapQuote, txId, confirmedRound, timings)
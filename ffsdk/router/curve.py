@@ -0,0 +1,158 @@
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import monotonic
+from .client import FolksRouterClient
+from .datatypes import SwapMode, SwapParams, SwapQuote
+
+
+@dataclass
+class CurvePoint:
+    amount: int
+    quoteAmount: int
+    priceImpact: float
+    microalgoTxnsFee: int
+
+
+def geometricLadder(minAmount: int, maxAmount: int, numPoints: int) -> list[int]:
+    """Returns numPoints distinct amounts from minAmount to maxAmount in geometric progression"""
+    if not 0 < minAmount <= maxAmount or numPoints < 1:
+        raise ValueError("Invalid ladder bounds")
+    if numPoints == 1:
+        return [maxAmount]
+    ratio = (maxAmount / minAmount) ** (1 / (numPoints - 1))
+    amounts = [round(minAmount * ratio**i) for i in range(numPoints - 1)]
+    return sorted(set(amounts + [maxAmount]))
+
+
+class PriceImpactCurve:
+    """
+    Output vs input curve of a swap, linearly interpolated between sampled quotes.
+    Sizing questions are answered locally until the curve expires.
+    """
+
+    def __init__(
+        self,
+        params: SwapParams,
+        points: list[CurvePoint],
+        ttl: float = 2.8,
+    ):
+        """
+        :param params: swap params of the pair (amount is ignored)
+        :param points: sampled quotes, in increasing amount
+        :param ttl: seconds the curve stays valid, defaults to the block time
+        """
+        if not points:
+            raise ValueError("No curve points")
+        self.params = params
+        self.points = points
+        self.amounts = [p.amount for p in points]
+        self.expiry = monotonic() + ttl
+
+    @classmethod
+    def fromQuotes(
+        cls,
+        params: SwapParams,
+        amounts: list[int],
+        quotes: list[SwapQuote],
+        ttl: float = 2.8,
+    ) -> "PriceImpactCurve":
+        points = [
+            CurvePoint(amount, q.quoteAmount, q.priceImpact, q.microalgoTxnsFee)
+            for amount, q in zip(amounts, quotes)
+        ]
+        return cls(params, points, ttl)
+
+    @property
+    def expired(self) -> bool:
+        return monotonic() >= self.expiry
+
+    def _segment(self, amount: int) -> tuple[CurvePoint, CurvePoint, float]:
+        if amount > self.amounts[-1]:
+            raise ValueError("Amount above the sampled range")
+        i = bisect_right(self.amounts, amount)
+        if i == 0:
+            # below the sampled range, interpolate from zero
+            first = self.points[0]
+            p0 = CurvePoint(0, 0, first.priceImpact, first.microalgoTxnsFee)
+            return p0, first, amount / first.amount
+        if i == len(self.points):
+            return self.points[-1], self.points[-1], 0.0
+        p0, p1 = self.points[i - 1], self.points[i]
+        return p0, p1, (amount - p0.amount) / (p1.amount - p0.amount)
+
+    def quoteAmount(self, amount: int) -> int:
+        """Returns the interpolated quote amount (output for FIXED_INPUT, input for FIXED_OUTPUT)"""
+        p0, p1, t = self._segment(amount)
+        value = p0.quoteAmount + t * (p1.quoteAmount - p0.quoteAmount)
+        # round in the unfavourable direction
+        if self.params.swapMode == SwapMode.FIXED_INPUT:
+            return int(value)
+        return -int(-value // 1)
+
+    def priceImpact(self, amount: int) -> float:
+        """Returns the interpolated price impact"""
+        p0, p1, t = self._segment(amount)
+        return p0.priceImpact + t * (p1.priceImpact - p0.priceImpact)
+
+    def microalgoTxnsFee(self, amount: int) -> int:
+        """Returns the transactions fee of the next sampled amount (the larger route)"""
+        p0, p1, t = self._segment(amount)
+        return max(p0.microalgoTxnsFee, p1.microalgoTxnsFee)
+
+    def maxAmountForPriceImpact(self, maxPriceImpact: float) -> int:
+        """
+        Returns the largest amount whose interpolated price impact does not exceed the
+        given one, 0 if none, assuming the price impact increases with the amount.
+        """
+        points = self.points
+        if points[0].priceImpact > maxPriceImpact:
+            return 0
+        for p0, p1 in zip(points, points[1:]):
+            if p1.priceImpact > maxPriceImpact:
+                t = (maxPriceImpact - p0.priceImpact) / (
+                    p1.priceImpact - p0.priceImpact
+                )
+                return p0.amount + int(t * (p1.amount - p0.amount))
+        return points[-1].amount
+
+
+def fetchPriceImpactCurve(
+    client: FolksRouterClient,
+    fromAssetId: int,
+    toAssetId: int,
+    swapMode: SwapMode,
+    minAmount: int,
+    maxAmount: int,
+    numPoints: int = 16,
+    maxGroupSize: int | None = None,
+    feeBps: int | None = None,
+    ttl: float = 2.8,
+    max_workers: int = 8,
+) -> PriceImpactCurve:
+    """
+    Samples the swap quotes of a pair over a geometric ladder of amounts, concurrently,
+    and returns the interpolated price impact curve.
+
+    :param client: router client
+    :param minAmount: smallest sampled amount
+    :param maxAmount: largest sampled amount
+    :param numPoints: number of sampled amounts
+    :param ttl: seconds the curve stays valid
+    :param max_workers: max number of concurrent quote requests
+    :return: price impact curve
+    """
+    amounts = geometricLadder(minAmount, maxAmount, numPoints)
+    params = SwapParams(fromAssetId, toAssetId, 0, swapMode)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        quotes = list(
+            executor.map(
+                lambda amount: client.fetchSwapQuote(
+                    SwapParams(fromAssetId, toAssetId, amount, swapMode),
+                    maxGroupSize,
+                    feeBps,
+                ),
+                amounts,
+            )
+        )
+    return PriceImpactCurve.fromQuotes(params, amounts, quotes, ttl)
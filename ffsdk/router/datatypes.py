@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ReferrerTransaction:
     unsignedTxn: str  # msgpack encoded, base64 format
     lsig: Optional[str] = None
@@ -12,13 +12,13 @@ class ReferrerTransaction:
 ReferrerGroupTransaction = list[ReferrerTransaction]
 
 
-@dataclass
+@dataclass(slots=True)
 class Tier:
     amount: int
     discount: float  # 0 d.p. (20=20%)
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscountTiers:
     assetId: int
     tiers: list[Tier]
@@ -29,7 +29,7 @@ class SwapMode(Enum):
     FIXED_OUTPUT = "FIXED_OUTPUT"
 
 
-@dataclass
+@dataclass(slots=True)
 class SwapParams:
     fromAssetId: int
     toAssetId: int
@@ -37,12 +37,27 @@ class SwapParams:
     swapMode: SwapMode
 
 
-@dataclass
+@dataclass(slots=True)
 class SwapQuote:
     quoteAmount: int
     priceImpact: float
     microalgoTxnsFee: int
-    txnPayload: str
+    txnPayload: Optional[str]  # None for approximate quotes from cache
 
 
 SwapTransactions = list[str]
+
+
+@dataclass(slots=True)
+class SwapExecution:
+    quote: SwapQuote
+    txId: str  # id of the first transaction of the swap group
+    confirmedRound: Optional[int]  # None if not waited for
+    timings: dict[str, float]  # stage -> seconds
+
+
+@dataclass(slots=True)
+class SwapValidationResult:
+    index: int  # index of the swap in the validated swaps
+    valid: bool
+    error: Optional[str] = None  # reason if invalid
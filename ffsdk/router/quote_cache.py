@@ -0,0 +1,117 @@
+import threading
+from collections import OrderedDict
+from math import log
+from time import monotonic
+from .datatypes import SwapMode, SwapParams, SwapQuote
+
+
+class QuoteCache:
+    """
+    LRU cache of router swap quotes, with a TTL of about one block.
+
+    Quotes are keyed by network, pair, swap mode, amount bucket and quote options.
+    With amount bucketing, a quote cached for a nearby amount of the same bucket is
+    scaled linearly to the requested amount. Such approximate quotes have no txnPayload,
+    so they cannot be used to prepare the swap transactions.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 2.8,
+        amount_bucket_bps: int = 0,
+    ):
+        """
+        :param maxsize: max number of cached quotes
+        :param ttl: seconds a quote stays valid, defaults to the block time
+        :param amount_bucket_bps: relative width of the amount buckets in basis points,
+            0 caches exact amounts only
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.amount_bucket_bps = amount_bucket_bps
+        self._log_base = log(1 + amount_bucket_bps / 10_000) if amount_bucket_bps else 0
+
+        self._lock = threading.Lock()
+        # key -> (expiry, amount, quote)
+        self._quotes: OrderedDict[tuple, tuple[float, int, SwapQuote]] = OrderedDict()
+        self._round = None
+        self.hits = 0
+        self.misses = 0
+
+    def bucket(self, amount: int) -> int:
+        """Returns the bucket of an amount"""
+        if not self._log_base or amount <= 0:
+            return amount
+        return int(log(amount) / self._log_base)
+
+    def key(
+        self,
+        network: str,
+        params: SwapParams,
+        maxGroupSize: int | None = None,
+        feeBps: int | None = None,
+        userFeeDiscount: int | None = None,
+        referrer: str | None = None,
+    ) -> tuple:
+        """Returns the cache key of a quote request"""
+        return (
+            network,
+            params.fromAssetId,
+            params.toAssetId,
+            params.swapMode,
+            self.bucket(params.amount),
+            maxGroupSize,
+            feeBps,
+            userFeeDiscount,
+            referrer,
+        )
+
+    def get(self, key: tuple, params: SwapParams) -> SwapQuote | None:
+        """Returns the cached quote for the request, or None"""
+        now = monotonic()
+        with self._lock:
+            entry = self._quotes.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._quotes[key]
+                self.misses += 1
+                return None
+            self._quotes.move_to_end(key)
+            self.hits += 1
+        _, amount, quote = entry
+        if amount == params.amount:
+            return quote
+
+        # approximate quote for a different amount of the same bucket
+        if params.swapMode == SwapMode.FIXED_INPUT:
+            quoteAmount = quote.quoteAmount * params.amount // amount
+        else:
+            quoteAmount = -(-quote.quoteAmount * params.amount // amount)
+        return SwapQuote(quoteAmount, quote.priceImpact, quote.microalgoTxnsFee, None)
+
+    def put(self, key: tuple, params: SwapParams, quote: SwapQuote) -> None:
+        """Caches the quote of the request"""
+        with self._lock:
+            self._quotes[key] = (monotonic() + self.ttl, params.amount, quote)
+            self._quotes.move_to_end(key)
+            if len(self._quotes) > self.maxsize:
+                self._quotes.popitem(last=False)
+
+    def notify_round(self, round: int) -> None:
+        """Reports a new round, invalidating the quotes of previous rounds"""
+        with self._lock:
+            if round != self._round:
+                self._round = round
+                self._quotes.clear()
+
+    def clear(self) -> None:
+        """Removes all cached quotes"""
+        with self._lock:
+            self._quotes.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        """Ratio of the requests served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -1,13 +1,8 @@
 from algosdk.logic import get_application_address
 from algosdk.transaction import Transaction, SuggestedParams, assign_group_id
-from algosdk.atomic_transaction_composer import AtomicTransactionComposer
 from .abi_contracts import routerABIContract
-from ..transaction_utils import (
-    signer,
-    sp_fee,
-    remove_signer_and_group,
-    transferAlgoOrAsset,
-)
+from ..method_templates import method_template
+from ..transaction_utils import sp_fee, transferAlgoOrAsset
 
 
 def prepareEnableAssetToBeSwapped(
@@ -23,15 +18,10 @@ def prepareEnableAssetToBeSwapped(
     )
 
     # opt in txn
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(routerABIContract, appId, "opt_into_assets").build(
         sender=senderAddr,
-        signer=signer,
-        app_id=appId,
-        method=routerABIContract.get_method_by_name("opt_into_assets"),
         method_args=[assetIds],
         foreign_assets=assetIds,
         sp=sp_fee(params, fee=(1 + len(assetIds)) * 1000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return assign_group_id([paymentTxn, txns[0]])
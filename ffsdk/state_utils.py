@@ -2,9 +2,13 @@
 # Copyright (c) 2021 Algofi, Inc.
 
 # IMPORTS
+import msgpack
+from algosdk.error import AlgodHTTPError
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
-from base64 import b64decode
+from base64 import b64decode, b64encode
+from collections.abc import Mapping
+from struct import unpack_from
 from .config import ALGO_ASSET_ID
 
 
@@ -77,7 +81,160 @@ def format_state(state, decode_byte_values=False, decode_byte_keys=True):
     return formatted_state
 
 
-def get_local_states(indexer, address, decode_byte_values=False, block=None):
+# base64 encoding of str keys, shared by all lazy states (keys are few and fixed)
+_b64_keys: dict[str, str] = {}
+MAX_CACHED_KEYS = 4096
+
+
+def _b64_key(key: str) -> str:
+    b64_key = _b64_keys.get(key)
+    if b64_key is None:
+        b64_key = b64encode(key.encode()).decode()
+        if len(_b64_keys) < MAX_CACHED_KEYS:
+            _b64_keys[key] = b64_key
+    return b64_key
+
+
+class LazyState(Mapping):
+    """Read-only equivalent of format_state, decoding only the requested keys.
+
+    The raw state is indexed by base64 key up front; looked up keys are encoded
+    to base64 instead of decoding every key of the state.
+    """
+
+    __slots__ = ("_raw", "_decode_byte_values", "_decode_byte_keys", "_keys")
+
+    def __init__(self, state, decode_byte_values=False, decode_byte_keys=True):
+        """
+        :param state: state list of base64 key -> value dicts
+        :type state: list
+        :param decode_byte_values: whether to decode base64 bytes values to utf-8
+        :type decode_byte_values: bool
+        :param decode_byte_keys: whether to decode keys to utf-8
+        :type decode_byte_keys: bool
+        """
+        self._raw = {item["key"]: item["value"] for item in state}
+        self._decode_byte_values = decode_byte_values
+        self._decode_byte_keys = decode_byte_keys
+        self._keys = None
+
+    def _raw_key(self, key) -> str | None:
+        if isinstance(key, str):
+            return _b64_key(key) if self._decode_byte_keys else None
+        if isinstance(key, bytes):
+            if self._decode_byte_keys:
+                # utf-8 keys are str in format_state
+                try:
+                    key.decode("utf-8")
+                    return None
+                except UnicodeDecodeError:
+                    pass
+            return b64encode(key).decode()
+        return None
+
+    def __getitem__(self, key):
+        value = self._raw.get(self._raw_key(key))
+        if value is None:
+            raise KeyError(key)
+        if value["type"] != 1:
+            # integer
+            return value["uint"]
+        # byte string
+        if self._decode_byte_values:
+            try:
+                return b64decode(value["bytes"]).decode("utf-8")
+            except:
+                pass
+        return value["bytes"]
+
+    def __iter__(self):
+        if self._keys is None:
+            keys = []
+            for key in self._raw:
+                formatted_key = b64decode(key)
+                if self._decode_byte_keys:
+                    try:
+                        formatted_key = formatted_key.decode("utf-8")
+                    except UnicodeDecodeError:
+                        pass
+                keys.append(formatted_key)
+            self._keys = keys
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return f"LazyState({dict(self)!r})"
+
+
+def format_teal_key_value(tkv, decode_byte_values=False, decode_byte_keys=True):
+    """Format msgpack state map like format_state, keeping bytes values raw.
+
+    :param tkv: state map of raw key -> {"tt": type, "tb": bytes, "ui": uint}
+    :type tkv: dict
+    :param decode_byte_values: whether to decode bytes values to utf-8
+    :type decode_byte_values: bool
+    :return: formatted state dict, with bytes instead of base64 values
+    :rtype: dict
+    """
+
+    formatted_state = {}
+    for key, value in tkv.items():
+        if decode_byte_keys:
+            try:
+                key = key.decode("utf-8")
+            except UnicodeDecodeError:
+                pass
+
+        if value.get(b"tt") == 1:
+            # byte string
+            formatted_value = value.get(b"tb", b"")
+            if decode_byte_values:
+                try:
+                    formatted_value = formatted_value.decode("utf-8")
+                except UnicodeDecodeError:
+                    pass
+        else:
+            # integer
+            formatted_value = value.get(b"ui", 0)
+        formatted_state[key] = formatted_value
+    return formatted_state
+
+
+def _msgpack_algod(client, block=None) -> AlgodClient:
+    if block is not None:
+        raise ValueError("msgpack response format reads the latest round, not a block")
+    if isinstance(client, AlgodClient):
+        return client
+    if isinstance(client, AlgodIndexerCombo):
+        return client.algod
+    raise ValueError("msgpack response format requires algod (or AlgodIndexerCombo)")
+
+
+def _algod_msgpack_request(algod: AlgodClient, path: str) -> dict:
+    data = algod.algod_request(
+        "GET", path, {"format": "msgpack"}, response_format="msgpack"
+    )
+    # keys are kept raw: state keys need not be utf-8, app and asset ids are ints
+    return msgpack.unpackb(data, raw=True, strict_map_key=False)
+
+
+# app id -> creator address (immutable), to read global state as msgpack
+_app_creators: dict[int, str] = {}
+
+
+def _app_creator(algod: AlgodClient, app_id: int) -> str:
+    creator = _app_creators.get(app_id)
+    if creator is None:
+        creator = algod.application_info(app_id)["params"]["creator"]
+        _app_creators[app_id] = creator
+    return creator
+
+
+def get_local_states(
+    indexer, address, decode_byte_values=False, block=None, response_format="json"
+):
     """Get local state of user for all opted in apps.
 
     :param indexer: algorand indexer
@@ -86,12 +243,26 @@ def get_local_states(indexer, address, decode_byte_values=False, block=None):
     :type address: str
     :param decode_byte_values: whether to base64 decode bytes values
     :type decode_byte_values: bool
-    :param block: block at which to query local state
+    :param block: block at which to query local state (json only)
     :type block: int, optional
+    :param response_format: "json" or "msgpack" (algod only, latest round). With
+        msgpack, bytes values are raw bytes instead of base64 strings, so must not be
+        base64 decoded
+    :type response_format: str
     :return: formatted local state dict
     :rtype: dict
     """
 
+    if response_format == "msgpack":
+        algod = _msgpack_algod(indexer, block)
+        account_data = _algod_msgpack_request(algod, f"/accounts/{address}")
+        return {
+            app_id: format_teal_key_value(
+                local_state.get(b"tkv", {}), decode_byte_values=decode_byte_values
+            )
+            for app_id, local_state in account_data.get(b"appl", {}).items()
+        }
+
     try:
         results = indexer.account_info(
             address, round_num=block, exclude="assets,created-apps,created-assets"
@@ -109,7 +280,12 @@ def get_local_states(indexer, address, decode_byte_values=False, block=None):
 
 
 def get_local_state_at_app(
-    indexer, app_id, address, decode_byte_values=False, block=None
+    indexer,
+    app_id,
+    address,
+    decode_byte_values=False,
+    block=None,
+    response_format="json",
 ):
     """Get local state of user for given app.
 
@@ -121,12 +297,33 @@ def get_local_state_at_app(
     :type address: str
     :param decode_byte_values: whether to base64 decode bytes values
     :type decode_byte_values: bool
-    :param block: block at which to query local state
+    :param block: block at which to query local state (json only)
     :type block: int, optional
+    :param response_format: "json" or "msgpack" (algod only, latest round). With
+        msgpack, bytes values are raw bytes instead of base64 strings, so must not be
+        base64 decoded
+    :type response_format: str
     :return: formatted local state dict
     :rtype: dict
     """
 
+    if response_format == "msgpack":
+        algod = _msgpack_algod(indexer, block)
+        try:
+            app_info = _algod_msgpack_request(
+                algod, f"/accounts/{address}/applications/{app_id}"
+            )
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        local_state = app_info.get(b"app-local-state")
+        if local_state is None:
+            return None
+        return format_teal_key_value(
+            local_state.get(b"tkv", {}), decode_byte_values=decode_byte_values
+        )
+
     local_states = get_local_states(
         indexer, address, decode_byte_values=decode_byte_values, block=block
     )
@@ -142,6 +339,8 @@ def get_global_state(
     decode_byte_values: bool = False,
     decode_byte_keys: bool = True,
     block: int | None = None,
+    response_format: str = "json",
+    creator: str | None = None,
 ):
     """Get global state of a given application.
 
@@ -150,12 +349,37 @@ def get_global_state(
     :type app_id: int
     :param decode_byte_values: whether to base64 decode bytes values
     :type decode_byte_values: bool
-    :param block: block at which to query global state
+    :param block: block at which to query global state (json only)
     :type block: int, optional
+    :param response_format: "json" or "msgpack" (algod only, latest round). With
+        msgpack, bytes values are raw bytes instead of base64 strings, so must not be
+        base64 decoded
+    :type response_format: str
+    :param creator: creator address of the app for msgpack reads, if not given it is
+        looked up with an extra json request on the first read of the app
+    :type creator: str, optional
     :return: formatted global state dict
     :rtype: dict
     """
 
+    if response_format == "msgpack":
+        algod = _msgpack_algod(client, block)
+        try:
+            if creator is None:
+                creator = _app_creator(algod, app_id)
+            app_info = _algod_msgpack_request(
+                algod, f"/accounts/{creator}/applications/{app_id}"
+            )
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                raise Exception("Application does not exist.") from e
+            raise
+        return format_teal_key_value(
+            app_info.get(b"app-params", {}).get(b"gs", {}),
+            decode_byte_values=decode_byte_values,
+            decode_byte_keys=decode_byte_keys,
+        )
+
     try:
         if isinstance(client, AlgodClient):
             application_info = client.application_info(app_id)
@@ -178,20 +402,30 @@ def get_application_box(
     return client.application_box_by_name(app_id, box_name)
 
 
-def get_balances(indexer, address, block=None):
+def get_balances(indexer, address, block=None, response_format="json"):
     """Get balances for a given user.
 
     :param indexer: algorand indexer client
     :type indexer: :class:`IndexerClient`
     :param address: user address
     :type address: str
-    :param block: block at which to query balances
+    :param block: block at which to query balances (json only)
     :type block: int, optional
+    :param response_format: "json" or "msgpack" (algod only, latest round)
+    :type response_format: str
     :return: dict of asset id -> amount
     :rtype: dict
     """
 
     balances = {}
+    if response_format == "msgpack":
+        algod = _msgpack_algod(indexer, block)
+        account_data = _algod_msgpack_request(algod, f"/accounts/{address}")
+        balances[ALGO_ASSET_ID] = account_data.get(b"algo", 0)
+        for asset_id, holding in account_data.get(b"asset", {}).items():
+            balances[asset_id] = holding.get(b"a", 0)
+        return balances
+
     account_info = indexer.account_info(address, round_num=block)["account"]
     balances[ALGO_ASSET_ID] = account_info["amount"]
     if "assets" in account_info:
@@ -224,19 +458,16 @@ def get_accounts_opted_into_app(indexer, app_id, exclude=None):
 
 
 def parse_uint64s(base64_value: str) -> list[int]:
-    value = b64decode(base64_value).hex()
+    value = b64decode(base64_value)
     # uint64s are 8 bytes each
-    uint64s: list[int] = []
-    i = 0
-    while i < len(value):
-        uint64s.append(int(value[i : i + 16], base=16))
-        i += 16
+    n, rem = divmod(len(value), 8)
+    uint64s: list[int] = list(unpack_from(f">{n}Q", value))
+    if rem:
+        uint64s.append(int.from_bytes(value[8 * n :], "big"))
     return uint64s
 
 
 def parse_bits_as_booleans(base64_value: str) -> list[bool]:
-    value = b64decode(base64_value).hex()
+    value = int.from_bytes(b64decode(base64_value), "big")
     # bits = ("00000000" + Number("0x" + value).toString(2)).slice(-8);
-    bits = f"{int(value, base=16):08b}"[-8:]
-    bools = [bool(int(c)) for c in bits]
-    return bools
+    return [bool(value >> i & 1) for i in range(7, -1, -1)]
@@ -0,0 +1,122 @@
+import threading
+from copy import copy
+from time import monotonic
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+from .transaction_utils import sp_fee
+
+
+class SuggestedParamsProvider:
+    """
+    Thread-safe cache of the algod suggested params shared by all transaction builders.
+
+    The validity window [first, last] is moved forward locally when a new round is
+    reported with `notify_round`, without a network request. Otherwise the current round
+    is estimated from the elapsed time: the params are refetched in the background when
+    the window is near expiry or older than max_age, and the caller only blocks on the
+    network when the cached params have expired.
+    """
+
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        refresh_margin: int = 100,
+        round_time: float = 2.8,
+        max_age: float = 300.0,
+    ):
+        """
+        :param algod_client: algod client to fetch the suggested params from
+        :param refresh_margin: refresh when fewer rounds than this remain in the validity window
+        :param round_time: expected seconds per round, used to estimate the current round
+        :param max_age: seconds after which the params (fee) are refreshed anyway
+        """
+        self.algod = algod_client
+        self.refresh_margin = refresh_margin
+        self.round_time = round_time
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._params: SuggestedParams | None = None
+        self._validity = 0  # number of rounds between first and last valid round
+        self._round = 0  # last known round
+        self._round_time = 0.0  # monotonic time the last known round was seen
+        self._fetched_time = 0.0  # monotonic time the params were fetched
+        self._refreshing = False
+
+    def refresh(self) -> SuggestedParams:
+        """Fetches the suggested params from algod (blocking)"""
+        params = self.algod.suggested_params()
+        now = monotonic()
+        with self._lock:
+            self._params = params
+            self._validity = params.last - params.first
+            if params.first >= self._round:
+                self._round = params.first
+                self._round_time = now
+            self._fetched_time = now
+            self._shift_window(self._round)
+            return copy(self._params)
+
+    def notify_round(self, round: int) -> None:
+        """Reports a new round (e.g. from a block watcher), moving the validity window"""
+        with self._lock:
+            if round <= self._round:
+                return
+            self._round = round
+            self._round_time = monotonic()
+            if self._params is not None:
+                self._shift_window(round)
+
+    def _shift_window(self, round: int) -> None:
+        # replace rather than modify the cached params, they may be read outside the lock
+        if self._params.first != round:
+            params = copy(self._params)
+            params.first = round
+            params.last = round + self._validity
+            self._params = params
+
+    def current_round(self) -> int:
+        """Returns the estimated current round"""
+        with self._lock:
+            return self._estimated_round(monotonic())
+
+    def _estimated_round(self, now: float) -> int:
+        return self._round + int((now - self._round_time) / self.round_time)
+
+    def get(self) -> SuggestedParams:
+        """Returns a copy of the cached suggested params, refreshing them if needed"""
+        return copy(self._cached())
+
+    def _cached(self) -> SuggestedParams:
+        # the cached params are never modified, so they can be copied outside the lock
+        now = monotonic()
+        with self._lock:
+            params = self._params
+            if params is not None:
+                estimated = self._estimated_round(now)
+                if estimated >= params.last:
+                    params = None  # expired, refetch before returning
+                elif (
+                    estimated + self.refresh_margin >= params.last
+                    or now - self._fetched_time > self.max_age
+                ) and not self._refreshing:
+                    self._refreshing = True
+                    threading.Thread(
+                        target=self._background_refresh, daemon=True
+                    ).start()
+        if params is None:
+            return self.refresh()
+        return params
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            pass  # retried on next get
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def sp_fee(self, fee: int, flat_fee: bool = True) -> SuggestedParams:
+        """Returns a copy of the cached suggested params but with a different fee"""
+        return sp_fee(self._cached(), fee, flat_fee)
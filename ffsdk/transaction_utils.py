@@ -1,13 +1,34 @@
+from base64 import b64decode, b64encode
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from copy import copy
-from algosdk.atomic_transaction_composer import TransactionWithSigner, EmptySigner
-from algosdk.encoding import decode_address, encode_as_bytes
+from dataclasses import dataclass
+from algosdk.atomic_transaction_composer import (
+    EmptySigner,
+    LogicSigTransactionSigner,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.account import address_from_private_key
+from algosdk.constants import key_len_bytes
+from algosdk.encoding import decode_address, encode_as_bytes, msgpack_encode
 from algosdk.logic import get_application_address
 from algosdk.transaction import (
+    GenericSignedTransaction,
+    LogicSigAccount,
+    SignedTransaction,
     SuggestedParams,
     Transaction,
     PaymentTxn,
     AssetTransferTxn,
+    assign_group_id,
 )
+from algosdk.v2client.algod import AlgodClient
+from nacl.signing import SigningKey
 
 
 signer = EmptySigner()
@@ -71,3 +92,174 @@ def removeEscrowNoteTransaction(
     return PaymentTxn(
         escrowAddr, params, userAddr, 0, close_remainder_to=userAddr, note=note
     )
+
+
+class KeySigner(TransactionSigner):
+    """
+    Transaction signer for a private key, with the signing key and address derived once
+    instead of on every signature. Signs like AccountTransactionSigner.
+    """
+
+    def __init__(self, private_key: str):
+        self.private_key = private_key
+        self.address = address_from_private_key(private_key)
+        self._signing_key = SigningKey(b64decode(private_key)[:key_len_bytes])
+
+    def sign_transactions(
+        self, txn_group: list[Transaction], indexes: list[int]
+    ) -> list[GenericSignedTransaction]:
+        stxns = []
+        for i in indexes:
+            txn = txn_group[i]
+            sig = self._signing_key.sign(txn.bytes_to_sign()).signature
+            authorizing_address = None if txn.sender == self.address else self.address
+            stxns.append(
+                SignedTransaction(txn, b64encode(sig).decode(), authorizing_address)
+            )
+        return stxns
+
+
+def encode_signed_group(stxns: list[GenericSignedTransaction]) -> str:
+    """Returns the signed transaction group encoded for algod.send_raw_transaction"""
+    raw = b"".join(b64decode(msgpack_encode(stxn)) for stxn in stxns)
+    return b64encode(raw).decode()
+
+
+def _transaction_signer(key: str | LogicSigAccount) -> TransactionSigner:
+    if isinstance(key, LogicSigAccount):
+        return LogicSigTransactionSigner(key)
+    return KeySigner(key)
+
+
+def _sign_groups_chunk(
+    groups: list[list[Transaction]],
+    keys: dict[str, str | LogicSigAccount],
+    auth_addrs: dict[str, str],
+    assign_group: bool,
+) -> list[list[GenericSignedTransaction]]:
+    signers = {addr: _transaction_signer(key) for addr, key in keys.items()}
+    signed_groups = []
+    for group in groups:
+        if assign_group and len(group) > 1:
+            group = [copy(txn) for txn in group]
+            for txn in group:
+                txn.group = None
+            group = assign_group_id(group)
+        stxns = []
+        for i, txn in enumerate(group):
+            addr = auth_addrs.get(txn.sender, txn.sender)
+            signer = signers.get(addr)
+            if signer is None:
+                raise KeyError(f"No signing key for {addr} (sender {txn.sender})")
+            stxns += signer.sign_transactions(group, [i])
+        signed_groups.append(stxns)
+    return signed_groups
+
+
+def sign_groups(
+    groups: list[list[Transaction]],
+    keys: dict[str, str | LogicSigAccount],
+    auth_addrs: dict[str, str] | None = None,
+    assign_group: bool = True,
+    max_workers: int | None = None,
+    chunk_size: int = 64,
+) -> list[list[GenericSignedTransaction]]:
+    """
+    Signs many transaction groups, spreading the work across a process pool.
+
+    :param groups: transaction groups, e.g. returned by the prepare* functions
+    :param keys: signing address -> private key or logic sig account (e.g. from getDistributorLogicSig)
+    :param auth_addrs: sender address -> authorized address of rekeyed senders,
+        whose transactions are signed with the key of the authorized address
+    :param assign_group: whether to (re)assign the group id to each group before signing
+        (the given transactions are not modified)
+    :param max_workers: number of processes, defaults to the number of CPUs; 1 signs in this process
+    :param chunk_size: number of groups signed per task
+    :return: signed groups, e.g. for submit_and_confirm_groups
+        (encode_signed_group encodes one for algod.send_raw_transaction)
+    """
+    auth_addrs = auth_addrs or {}
+    chunks = [groups[i : i + chunk_size] for i in range(0, len(groups), chunk_size)]
+    if max_workers == 1 or len(chunks) <= 1:
+        return _sign_groups_chunk(groups, keys, auth_addrs, assign_group)
+
+    signed_groups = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            _sign_groups_chunk,
+            chunks,
+            [keys] * len(chunks),
+            [auth_addrs] * len(chunks),
+            [assign_group] * len(chunks),
+        )
+        for signed_chunk in results:
+            signed_groups += signed_chunk
+    return signed_groups
+
+
+@dataclass
+class GroupSubmitResult:
+    index: int  # index of the group in the submitted groups
+    txid: str | None  # id of the first transaction in the group
+    confirmedRound: int | None = None  # None if rejected
+    error: str | None = None  # rejection reason
+
+
+def submit_and_confirm_groups(
+    algod: AlgodClient,
+    signed_groups: list[list[GenericSignedTransaction]],
+    max_workers: int = 8,
+    on_round: Callable[[int], None] | None = None,
+) -> Iterator[GroupSubmitResult]:
+    """
+    Submits many signed transaction groups concurrently and yields their results as
+    they land: rejections by the node first, then confirmations round by round.
+
+    All pending groups are tracked together, with one status_after_block and one
+    block txids request per round instead of polling per transaction. Groups which
+    are not confirmed by their last valid round are yielded as expired.
+
+    :param algod: algod client
+    :param signed_groups: signed transaction groups to submit
+    :param max_workers: max number of concurrent submissions
+    :param on_round: optional callback receiving each new round, e.g. SuggestedParamsProvider.notify_round
+    :return: iterator of results, one per group
+    """
+    # scan blocks from the round the submission started at
+    lastRound = algod.status()["last-round"]
+
+    pending: dict[str, tuple[int, int]] = {}  # txid -> (group index, last valid round)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(algod.send_transactions, group): i
+            for i, group in enumerate(signed_groups)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                txid = future.result()
+            except Exception as e:
+                yield GroupSubmitResult(i, None, error=str(e))
+                continue
+            lastValid = min(
+                stxn.transaction.last_valid_round for stxn in signed_groups[i]
+            )
+            pending[txid] = (i, lastValid)
+
+    while pending:
+        status = algod.status_after_block(lastRound)
+        currentRound = status["last-round"]
+        for rnd in range(lastRound + 1, currentRound + 1):
+            for txid in algod.get_block_txids(rnd)["blockTxids"]:
+                entry = pending.pop(txid, None)
+                if entry is not None:
+                    yield GroupSubmitResult(entry[0], txid, confirmedRound=rnd)
+        lastRound = currentRound
+        if on_round is not None:
+            on_round(currentRound)
+
+        # groups past their validity window can no longer be confirmed
+        for txid, (i, lastValid) in list(pending.items()):
+            if lastValid <= currentRound:
+                del pending[txid]
+                yield GroupSubmitResult(i, txid, error="expired")
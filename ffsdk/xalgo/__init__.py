@@ -1,7 +1,14 @@
-# imports
-from . import abi_contracts
-from . import client
-from . import constants
-from . import datatypes
-from . import formulae
-from . import consensus
+# imports (submodules are imported on first access)
+from ..lazy import lazy_submodules
+
+__getattr__, __dir__ = lazy_submodules(
+    __name__,
+    [
+        "abi_contracts",
+        "client",
+        "constants",
+        "datatypes",
+        "formulae",
+        "consensus",
+    ],
+)
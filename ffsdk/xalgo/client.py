@@ -1,5 +1,7 @@
 from ffsdk.config import Network
+from ffsdk.readonly_calls import ReadOnlyCaller
 from .constants import MainnetConsensusConfig, TestnetConsensusConfig
+from .constants.mainnet_constants import MAINNET_RESERVE_ADDRESS
 from .datatypes import ConsensusConfig
 
 
@@ -17,3 +19,8 @@ class XAlgoLiquidStakingClient:
             self.consensus_config: ConsensusConfig = TestnetConsensusConfig
         else:
             raise ValueError("Unsupported network.")
+
+        # read-only calls (xALGO rate) cached per round
+        self.readonly = ReadOnlyCaller(
+            self.algod, MAINNET_RESERVE_ADDRESS, ff_client.suggested_params
+        )
@@ -1,21 +1,16 @@
+import threading
 from base64 import b64encode, b64decode
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from algosdk.v2client.algod import AlgodClient
-from algosdk.v2client.models import SimulateRequest
 from algosdk.logic import get_application_address
 from algosdk.encoding import encode_address, decode_address
 from algosdk.transaction import SuggestedParams, Transaction, ApplicationCallTxn
 from algosdk.box_reference import BoxReference
-from algosdk.atomic_transaction_composer import (
-    AtomicTransactionComposer,
-    TransactionWithSigner,
-    EmptySigner,
-)
-from ..transaction_utils import (
-    signer,
-    sp_fee,
-    remove_signer_and_group,
-    transferAlgoOrAsset,
-)
+from ..method_templates import method_template
+from ..readonly_calls import ReadOnlyCall, ReadOnlyCaller, call_readonly
+from ..transaction_utils import sp_fee, transferAlgoOrAsset
 from ..config import PAYOUTS_GO_ONLINE_FEE
 from ..state_utils import get_global_state, get_application_box, parse_uint64s
 from .constants.mainnet_constants import MAINNET_RESERVE_ADDRESS
@@ -25,50 +20,64 @@ from ..lend.datatypes import Pool
 
 
 def getConsensusState(
-    algodClient: AlgodClient, consensusConfig: ConsensusConfig
+    algodClient: AlgodClient,
+    consensusConfig: ConsensusConfig,
+    params: SuggestedParams | None = None,
+    readOnlyCaller: ReadOnlyCaller | None = None,
+    localRate: bool = False,
 ) -> ConsensusState:
     """
     Returns information regarding the given consensus application.
 
     @param algodClient - Algorand client to query
     @param consensusConfig - consensus application and xALGO config
+    @param params - suggested params for the xALGO rate simulation, fetched if not given
+    @param readOnlyCaller - optional caller caching the xALGO rate for the current round
+    @param localRate - whether to compute the xALGO rate from the account balances instead of simulating it
     @returns ConsensusState current state of the consensus application
     """
     consensusAppId = consensusConfig.consensusAppId
 
-    state = get_global_state(algodClient, consensusAppId)
-    box = get_application_box(algodClient, consensusAppId, b"pr")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stateFuture = executor.submit(get_global_state, algodClient, consensusAppId)
+        box = get_application_box(algodClient, consensusAppId, b"pr")
+        state = stateFuture.result()
     current_round = box["round"]
     boxValue = b64decode(box["value"])
-    params = algodClient.suggested_params()
     if not state:
         raise ValueError("Could not find xAlgo application")
 
     # xALGO rate
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
-        sender=MAINNET_RESERVE_ADDRESS,
-        signer=EmptySigner(),
-        app_id=consensusAppId,
-        method=xAlgoABIContract.get_method_by_name("get_xalgo_rate"),
-        method_args=[],
-        sp=params,
-    )
-    simReq = SimulateRequest(
-        txn_groups=[],
-        allow_empty_signatures=True,
-        allow_unnamed_resources=True,
-        extra_opcode_budget=70000,
-    )
-    methodResults = atc.simulate(algodClient, simReq).abi_results
-    returnValue = methodResults[0].return_value
-    algoBalance, xAlgoCirculatingSupply, balances = returnValue
-
-    # proposers
-    proposersBalances = [
-        ProposerBalance(encode_address(boxValue[i * 32 : (i + 1) * 32]), balance)
-        for i, balance in enumerate(parse_uint64s(b64encode(bytes(balances))))
-    ]
+    if localRate:
+        proposers = [
+            encode_address(boxValue[i * 32 : (i + 1) * 32])
+            for i in range(int(state.get("num_proposers", 0)))
+        ]
+        algoBalance, xAlgoCirculatingSupply, proposersBalances = getXAlgoRateLocal(
+            algodClient,
+            consensusConfig,
+            proposers,
+            int(state.get("total_pending_stake", 0)),
+            int(state.get("total_unclaimed_fees", 0)),
+            current_round,
+        )
+    else:
+        rateCall = ReadOnlyCall(xAlgoABIContract, consensusAppId, "get_xalgo_rate")
+        if readOnlyCaller is not None:
+            (returnValue,) = readOnlyCaller.call([rateCall])
+        else:
+            if params is None:
+                params = algodClient.suggested_params()
+            (returnValue,) = call_readonly(
+                algodClient, MAINNET_RESERVE_ADDRESS, [rateCall], params
+            )
+        algoBalance, xAlgoCirculatingSupply, balances = returnValue
+
+        # proposers
+        proposersBalances = [
+            ProposerBalance(encode_address(boxValue[i * 32 : (i + 1) * 32]), balance)
+            for i, balance in enumerate(parse_uint64s(b64encode(bytes(balances))))
+        ]
 
     # global state
     adminAddress = encode_address(b64decode(state.get("admin")))
@@ -106,21 +115,110 @@ def getConsensusState(
     )
 
 
+# xALGO total supply, immutable
+_xAlgoTotals: dict[int, int] = {}
+
+
+def getXAlgoRateLocal(
+    algodClient: AlgodClient,
+    consensusConfig: ConsensusConfig,
+    proposers: list[str],
+    totalPendingStake: int,
+    totalUnclaimedFees: int,
+    round: int | None = None,
+) -> tuple[int, int, list[ProposerBalance]]:
+    """
+    Computes the xALGO rate as the get_xalgo_rate method of the consensus application,
+    from the proposers balances and the xALGO held by the application, fetched concurrently.
+    Raises ValueError if the balances were not all read at the same round.
+
+    @param algodClient - Algorand client to query
+    @param consensusConfig - consensus application and xALGO config
+    @param proposers - proposer addresses
+    @param totalPendingStake - total pending stake of the consensus application
+    @param totalUnclaimedFees - total unclaimed fees of the consensus application
+    @param round - round the pending stake and unclaimed fees were read at, if known
+    @returns (algoBalance, xAlgoCirculatingSupply, proposersBalances)
+    """
+    xAlgoId = consensusConfig.xAlgoId
+    appAddr = get_application_address(consensusConfig.consensusAppId)
+
+    with ThreadPoolExecutor(max_workers=min(len(proposers) + 2, 16)) as executor:
+        accountFutures = [
+            executor.submit(algodClient.account_info, addr, exclude="all")
+            for addr in proposers
+        ]
+        holdingFuture = executor.submit(
+            algodClient.account_asset_info, appAddr, xAlgoId
+        )
+        if xAlgoId not in _xAlgoTotals:
+            assetInfo = executor.submit(algodClient.asset_info, xAlgoId).result()
+            _xAlgoTotals[xAlgoId] = assetInfo["params"]["total"]
+        accounts = [future.result() for future in accountFutures]
+        holding = holdingFuture.result()
+
+    # algod reads the accounts at its latest round, which may move between requests
+    rounds = {account["round"] for account in accounts} | {holding["round"]}
+    if round is not None:
+        rounds.add(round)
+    if len(rounds) > 1:
+        raise ValueError(
+            f"Round changed while reading the balances {sorted(rounds)}, retry"
+        )
+    appHolding = holding["asset-holding"]["amount"]
+
+    # proposer balance excludes the locked min balance
+    proposersBalances = [
+        ProposerBalance(addr, account["amount"] - account["min-balance"])
+        for addr, account in zip(proposers, accounts)
+    ]
+    algoBalance = (
+        sum(pb.algoBalance for pb in proposersBalances)
+        - totalPendingStake
+        - totalUnclaimedFees
+    )
+    xAlgoCirculatingSupply = _xAlgoTotals[xAlgoId] - appHolding
+    return algoBalance, xAlgoCirculatingSupply, proposersBalances
+
+
+def checkXAlgoRateParity(
+    algodClient: AlgodClient,
+    consensusConfig: ConsensusConfig,
+    params: SuggestedParams | None = None,
+):
+    """
+    Checks that the locally computed xALGO rate equals the simulated one.
+    Raises ValueError listing the differing fields.
+
+    @param algodClient - Algorand client to query
+    @param consensusConfig - consensus application and xALGO config
+    @param params - suggested params for the xALGO rate simulation, fetched if not given
+    """
+    simulated = getConsensusState(algodClient, consensusConfig, params)
+    local = getConsensusState(algodClient, consensusConfig, localRate=True)
+    if simulated.currentRound != local.currentRound:
+        raise ValueError("Round changed during the check, retry")
+    diffs = [
+        f"{name}: simulated {getattr(simulated, name)}, local {getattr(local, name)}"
+        for name in ("algoBalance", "xAlgoCirculatingSupply", "proposersBalances")
+        if getattr(simulated, name) != getattr(local, name)
+    ]
+    if diffs:
+        raise ValueError("xALGO rate mismatch: " + "; ".join(diffs))
+
+
 def prepareDummyTransaction(
     consensusConfig: ConsensusConfig,
     senderAddr: str,
     params: SuggestedParams,
 ) -> Transaction:
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        xAlgoABIContract, consensusConfig.consensusAppId, "dummy"
+    ).build(
         sender=senderAddr,
-        signer=signer,
-        app_id=consensusConfig.consensusAppId,
-        method=xAlgoABIContract.get_method_by_name("dummy"),
         method_args=[],
         sp=sp_fee(params, fee=1000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -137,6 +235,89 @@ def add_box_to_appcall(txn: ApplicationCallTxn, box: tuple[int, bytes]):
     )
 
 
+# max number of foreign accounts of an app call
+MAX_FOREIGN_ACCOUNT_PER_TXN = 4
+
+
+class _ResourceAllocation:
+    """Proposer account chunks and dummy transactions precomputed for a consensus state"""
+
+    __slots__ = ("proposers", "chunks", "dummies")
+
+    def __init__(self, consensusState: ConsensusState):
+        self.proposers = dict.fromkeys(
+            proposer.address for proposer in consensusState.proposersBalances
+        )
+        self.chunks: dict[tuple, list[list[str]]] = {}
+        self.dummies: dict[tuple, Transaction] = {}
+
+    def accountChunks(
+        self, additionalAddresses: list[str], senderAddr: str
+    ) -> list[list[str]]:
+        key = (tuple(additionalAddresses), senderAddr)
+        chunks = self.chunks.get(key)
+        if chunks is None:
+            # get all accounts we need to add
+            uniqueAddresses = dict.fromkeys(additionalAddresses)
+            uniqueAddresses |= self.proposers
+            uniqueAddresses.pop(senderAddr, None)
+            accounts = list(uniqueAddresses)
+            chunks = [
+                accounts[i : i + MAX_FOREIGN_ACCOUNT_PER_TXN]
+                for i in range(0, len(accounts), MAX_FOREIGN_ACCOUNT_PER_TXN)
+            ]
+            if len(self.chunks) >= MAX_CACHED_ALLOCATIONS:
+                self.chunks.clear()
+            self.chunks[key] = chunks
+        return chunks
+
+    def dummyTransaction(
+        self,
+        consensusConfig: ConsensusConfig,
+        senderAddr: str,
+        params: SuggestedParams,
+    ) -> Transaction:
+        key = (
+            consensusConfig.consensusAppId,
+            senderAddr,
+            params.first,
+            params.last,
+            params.gh,
+            params.gen,
+        )
+        txn = self.dummies.get(key)
+        if txn is None:
+            if len(self.dummies) >= MAX_CACHED_ALLOCATIONS:
+                self.dummies.clear()
+            txn = prepareDummyTransaction(consensusConfig, senderAddr, params)
+            self.dummies[key] = txn
+        # deep copy, the dummy's lists are shared with the cached template
+        return deepcopy(txn)
+
+
+# resource allocations of recent consensus states: id -> (state, allocation)
+MAX_CACHED_ALLOCATIONS = 16
+_allocations: OrderedDict[int, tuple[ConsensusState, _ResourceAllocation]] = (
+    OrderedDict()
+)
+_allocationsLock = threading.Lock()
+
+
+def _resourceAllocation(consensusState: ConsensusState) -> _ResourceAllocation:
+    key = id(consensusState)
+    with _allocationsLock:
+        entry = _allocations.get(key)
+        # check identity, the id of a collected state may be reused
+        if entry is not None and entry[0] is consensusState:
+            _allocations.move_to_end(key)
+            return entry[1]
+        allocation = _ResourceAllocation(consensusState)
+        _allocations[key] = (consensusState, allocation)
+        if len(_allocations) > MAX_CACHED_ALLOCATIONS:
+            _allocations.popitem(last=False)
+        return allocation
+
+
 def getTxnsAfterResourceAllocation(
     consensusConfig: ConsensusConfig,
     consensusState: ConsensusState,
@@ -156,26 +337,21 @@ def getTxnsAfterResourceAllocation(
     txns[appCallTxnIndex].foreign_assets = [xAlgoId]
     add_box_to_appcall(txns[appCallTxnIndex], (consensusAppId, b"pr"))
 
-    # get all accounts we need to add
-    uniqueAddresses = dict.fromkeys(additionalAddresses)
-    uniqueAddresses |= dict.fromkeys(
-        proposer.address for proposer in consensusState.proposersBalances
-    )
-    uniqueAddresses.pop(senderAddr, None)
-    accounts = list(uniqueAddresses)
-
-    # add accounts in groups of 4
-    MAX_FOREIGN_ACCOUNT_PER_TXN = 4
-    for i in range(0, len(accounts), MAX_FOREIGN_ACCOUNT_PER_TXN):
+    # add accounts in groups of 4, precomputed per consensus state
+    allocation = _resourceAllocation(consensusState)
+    chunks = allocation.accountChunks(additionalAddresses, senderAddr)
+    for i, chunk in enumerate(chunks):
         # which txn to use and check to see if we need to add a dummy call
-        if (i // MAX_FOREIGN_ACCOUNT_PER_TXN) == 0:
+        if i == 0:
             txnIndex = appCallTxnIndex
         else:
-            txns.insert(0, prepareDummyTransaction(consensusConfig, senderAddr, params))
+            txns.insert(
+                0, allocation.dummyTransaction(consensusConfig, senderAddr, params)
+            )
             txnIndex = 0
 
         # add proposer accounts
-        txns[txnIndex].accounts = accounts[i : i + 4]
+        txns[txnIndex].accounts = chunk.copy()
 
     return txns
 
@@ -219,14 +395,10 @@ def prepareImmediateStakeTransactions(
     )
     fee = 1000 * (3 + len(consensusState.proposersBalances))
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(xAlgoABIContract, consensusAppId, "immediate_mint").build(
         sender=senderAddr,
-        signer=signer,
-        app_id=consensusAppId,
-        method=xAlgoABIContract.get_method_by_name("immediate_mint"),
         method_args=[
-            TransactionWithSigner(sendAlgo, signer),
+            sendAlgo,
             receiverAddr,
             minReceivedAmount,
         ],
@@ -235,7 +407,6 @@ def prepareImmediateStakeTransactions(
     )
 
     # allocate resources
-    txns = remove_signer_and_group(atc.build_group())
     return getTxnsAfterResourceAllocation(
         consensusConfig, consensusState, txns, [receiverAddr], senderAddr, params
     )
@@ -287,14 +458,12 @@ def prepareImmediateStakeAndDepositTransactions(
     )
     fee = 1000 * (9 + len(consensusState.proposersBalances))
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        stakeAndDepositABIContract, stakeAndDepositAppId, "stake_and_deposit"
+    ).build(
         sender=senderAddr,
-        signer=signer,
-        app_id=stakeAndDepositAppId,
-        method=stakeAndDepositABIContract.get_method_by_name("stake_and_deposit"),
         method_args=[
-            TransactionWithSigner(sendAlgo, signer),
+            sendAlgo,
             consensusAppId,
             poolAppId,
             poolManagerAppId,
@@ -307,8 +476,6 @@ def prepareImmediateStakeAndDepositTransactions(
         note=note,
     )
 
-    txns = remove_signer_and_group(atc.build_group())
-
     # allocate resources, add accounts in groups of 4
     MAX_FOREIGN_ACCOUNT_PER_TXN = 4
     accounts = [proposer.address for proposer in consensusState.proposersBalances]
@@ -360,22 +527,17 @@ def prepareDelayedStakeTransactions(
     )
     fee = 1000 * (2 + len(consensusState.proposersBalances))
 
-    atc = AtomicTransactionComposer()
     boxName = b"dm" + decode_address(senderAddr) + nonce
 
-    atc.add_method_call(
+    txns = method_template(xAlgoABIContract, consensusAppId, "delayed_mint").build(
         sender=senderAddr,
-        signer=signer,
-        app_id=consensusAppId,
-        method=xAlgoABIContract.get_method_by_name("delayed_mint"),
-        method_args=[TransactionWithSigner(sendAlgo, signer), receiverAddr, nonce],
+        method_args=[sendAlgo, receiverAddr, nonce],
         boxes=[(consensusAppId, boxName)],
         sp=sp_fee(params, fee=fee),
         note=note,
     )
 
     # allocate resources
-    txns = remove_signer_and_group(atc.build_group())
     txns = getTxnsAfterResourceAllocation(
         consensusConfig, consensusState, txns, [], senderAddr, params
     )
@@ -412,21 +574,18 @@ def prepareClaimDelayedStakeTransactions(
     """
     consensusAppId = consensusConfig.consensusAppId
 
-    atc = AtomicTransactionComposer()
     boxName = b"dm" + decode_address(minterAddr) + nonce
 
-    atc.add_method_call(
+    txns = method_template(
+        xAlgoABIContract, consensusAppId, "claim_delayed_mint"
+    ).build(
         sender=senderAddr,
-        signer=signer,
-        app_id=consensusAppId,
-        method=xAlgoABIContract.get_method_by_name("claim_delayed_mint"),
         method_args=[minterAddr, nonce],
         boxes=[(consensusAppId, boxName)],
         sp=sp_fee(params, fee=3000),
     )
 
     # allocate resources
-    txns = remove_signer_and_group(atc.build_group())
     return getTxnsAfterResourceAllocation(
         consensusConfig, consensusState, txns, [receiverAddr], senderAddr, params
     )
@@ -467,14 +626,10 @@ def prepareUnstakeTransactions(
     )
     fee = 1000 * (3 + len(consensusState.proposersBalances))
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(xAlgoABIContract, consensusAppId, "burn").build(
         sender=senderAddr,
-        signer=signer,
-        app_id=consensusAppId,
-        method=xAlgoABIContract.get_method_by_name("burn"),
         method_args=[
-            TransactionWithSigner(sendXAlgo, signer),
+            sendXAlgo,
             receiverAddr,
             minReceivedAmount,
         ],
@@ -483,7 +638,6 @@ def prepareUnstakeTransactions(
     )
 
     # allocate resources
-    txns = remove_signer_and_group(atc.build_group())
     return getTxnsAfterResourceAllocation(
         consensusConfig, consensusState, txns, [receiverAddr], senderAddr, params
     )
@@ -510,18 +664,13 @@ def prepareClaimConsensusFeesTransactions(
 
     fee = 1000 * (2 + len(consensusState.proposersBalances))
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(xAlgoABIContract, consensusAppId, "claim_fee").build(
         sender=senderAddr,
-        signer=signer,
-        app_id=consensusAppId,
-        method=xAlgoABIContract.get_method_by_name("claim_fee"),
         method_args=[],
         sp=sp_fee(params, fee=fee),
     )
 
     # allocate resources
-    txns = remove_signer_and_group(atc.build_group())
     return getTxnsAfterResourceAllocation(
         consensusConfig, consensusState, txns, [receiverAddr], senderAddr, params
     )
@@ -550,12 +699,10 @@ def prepareSetProposerAdminTransaction(
     consensusAppId = consensusConfig.consensusAppId
     proposerIndex = getProposerIndex(consensusState, proposerAddr)
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(
+        xAlgoABIContract, consensusAppId, "set_proposer_admin"
+    ).build(
         sender=senderAddr,
-        signer=signer,
-        app_id=consensusAppId,
-        method=xAlgoABIContract.get_method_by_name("set_proposer_admin"),
         method_args=[proposerIndex, newProposerAdminAddr],
         boxes=[
             (consensusAppId, b"pr"),
@@ -563,7 +710,6 @@ def prepareSetProposerAdminTransaction(
         ],
         sp=sp_fee(params, fee=1000),
     )
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
 
 
@@ -604,14 +750,10 @@ def prepareRegisterProposerOnlineTransactions(
         0, senderAddr, proposerAddr, PAYOUTS_GO_ONLINE_FEE, sp_fee(params, fee=0)
     )
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    return method_template(xAlgoABIContract, consensusAppId, "register_online").build(
         sender=senderAddr,
-        signer=signer,
-        app_id=consensusAppId,
-        method=xAlgoABIContract.get_method_by_name("register_online"),
         method_args=[
-            TransactionWithSigner(sendAlgo, signer),
+            sendAlgo,
             proposerIndex,
             encode_address(voteKey),
             encode_address(selectionKey),
@@ -627,7 +769,6 @@ def prepareRegisterProposerOnlineTransactions(
         ],
         sp=sp_fee(params, fee=3000),
     )
-    return remove_signer_and_group(atc.build_group())
 
 
 def prepareRegisterProposerOfflineTransaction(
@@ -651,12 +792,8 @@ def prepareRegisterProposerOfflineTransaction(
     consensusAppId = consensusConfig.consensusAppId
     proposerIndex = getProposerIndex(consensusState, proposerAddr)
 
-    atc = AtomicTransactionComposer()
-    atc.add_method_call(
+    txns = method_template(xAlgoABIContract, consensusAppId, "register_offline").build(
         sender=senderAddr,
-        signer=signer,
-        app_id=consensusAppId,
-        method=xAlgoABIContract.get_method_by_name("register_offline"),
         method_args=[proposerIndex],
         accounts=[proposerAddr],
         boxes=[
@@ -666,5 +803,4 @@ def prepareRegisterProposerOfflineTransaction(
         sp=sp_fee(params, fee=2000),
     )
 
-    txns = remove_signer_and_group(atc.build_group())
     return txns[0]
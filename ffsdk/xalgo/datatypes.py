@@ -1,20 +1,20 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConsensusConfig:
     consensusAppId: int
     xAlgoId: int
     stakeAndDepositAppId: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ProposerBalance:
     address: str
     algoBalance: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsensusState:
     currentRound: int  # round the data was read at
     algoBalance: int
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from ..mathlib import mulScale, ONE_16_DP
 from .datatypes import ConsensusState
 
@@ -25,3 +26,68 @@ def convertXAlgoToAlgo(xAlgoAmount: int, consensusState: ConsensusState) -> int:
     algoBalance = consensusState.algoBalance
     xAlgoCirculatingSupply = consensusState.xAlgoCirculatingSupply
     return mulScale(xAlgoAmount, algoBalance, xAlgoCirculatingSupply)
+
+
+def _int_list(amounts: Sequence[int]) -> list[int]:
+    # python ints, so that products do not overflow for numpy integer arrays
+    return [int(amount) for amount in amounts]
+
+
+def convertAlgoToXAlgoWhenImmediateBatch(
+    algoAmounts: Sequence[int], consensusStates: Sequence[ConsensusState]
+) -> list[list[int]]:
+    """
+    Batch version of convertAlgoToXAlgoWhenImmediate, with identical rounding.
+
+    @param algoAmounts - algo amounts to convert
+    @param consensusStates - consensus states to convert with
+    @returns list[list[int]] xALGO amounts, one list per consensus state
+    """
+    amounts = _int_list(algoAmounts)
+    res = []
+    for cs in consensusStates:
+        supply = cs.xAlgoCirculatingSupply
+        balance = cs.algoBalance
+        factor = ONE_16_DP - cs.premium
+        res.append(
+            [amount * supply // balance * factor // ONE_16_DP for amount in amounts]
+        )
+    return res
+
+
+def convertAlgoToXAlgoWhenDelayBatch(
+    algoAmounts: Sequence[int], consensusStates: Sequence[ConsensusState]
+) -> list[list[int]]:
+    """
+    Batch version of convertAlgoToXAlgoWhenDelay, with identical rounding.
+
+    @param algoAmounts - algo amounts to convert
+    @param consensusStates - consensus states to convert with
+    @returns list[list[int]] xALGO amounts, one list per consensus state
+    """
+    amounts = _int_list(algoAmounts)
+    res = []
+    for cs in consensusStates:
+        supply = cs.xAlgoCirculatingSupply
+        balance = cs.algoBalance
+        res.append([amount * supply // balance for amount in amounts])
+    return res
+
+
+def convertXAlgoToAlgoBatch(
+    xAlgoAmounts: Sequence[int], consensusStates: Sequence[ConsensusState]
+) -> list[list[int]]:
+    """
+    Batch version of convertXAlgoToAlgo, with identical rounding.
+
+    @param xAlgoAmounts - xALGO amounts to convert
+    @param consensusStates - consensus states to convert with
+    @returns list[list[int]] algo amounts, one list per consensus state
+    """
+    amounts = _int_list(xAlgoAmounts)
+    res = []
+    for cs in consensusStates:
+        supply = cs.xAlgoCirculatingSupply
+        balance = cs.algoBalance
+        res.append([amount * balance // supply for amount in amounts])
+    return res
@@ -0,0 +1,322 @@
+"""
+Local stand-in for the Folks Router API, for load testing offline.
+
+Quotes come from deterministic synthetic constant product pools and the prepared
+swap transactions pass `checkSwapTransactions`. Latency and errors can be injected.
+
+Usage (with ffsdk installed):
+    python tests/standin_server.py --port 8080 --latency 0.05 --error-rate 0.01
+and FolksRouterClient(network, base_url="http://127.0.0.1:8080").
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from base64 import b64decode, b64encode
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from algosdk.encoding import is_valid_address, msgpack_encode
+from algosdk.logic import get_application_address
+from algosdk.transaction import (
+    ApplicationNoOpTxn,
+    AssetTransferTxn,
+    PaymentTxn,
+    SuggestedParams,
+    assign_group_id,
+)
+from ffsdk.config import Network
+from ffsdk.mathlib import mulScale, ONE_4_DP
+from ffsdk.router.checks import swapTransactionsValidator
+from ffsdk.router.datatypes import SwapMode
+
+GENESIS = {
+    "mainnet": ("mainnet-v1.0", "wGHE2Pwdvd7S12BL5FaOP20EGYesN73ktiC1qzkkit8="),
+    "testnet": ("testnet-v1.0", "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI="),
+}
+NETWORKS = {"mainnet": Network.MAINNET, "testnet": Network.TESTNET}
+SWAP_FEE_BPS = 30
+DISCOUNT_ASSET_ID = 3203964481
+
+
+def _pairSeed(fromAssetId: int, toAssetId: int) -> int:
+    pair = f"{min(fromAssetId, toAssetId)}:{max(fromAssetId, toAssetId)}"
+    return int.from_bytes(sha256(pair.encode()).digest()[:8], "big")
+
+
+def syntheticPool(fromAssetId: int, toAssetId: int) -> tuple[int, int, int]:
+    """Returns the (fromReserve, toReserve, numSwaps) of the synthetic pool of a pair"""
+    seed = _pairSeed(fromAssetId, toAssetId)
+    reserveA = 10**12 + seed % 10**13
+    reserveB = 10**12 + (seed >> 20) % 10**13
+    numSwaps = 1 + seed % 3
+    if fromAssetId <= toAssetId:
+        return reserveA, reserveB, numSwaps
+    return reserveB, reserveA, numSwaps
+
+
+def syntheticQuote(
+    fromAssetId: int, toAssetId: int, amount: int, swapMode: SwapMode
+) -> tuple[int, float, int]:
+    """Returns the (quoteAmount, priceImpact, numSwaps) of a swap in the synthetic pool"""
+    fromReserve, toReserve, numSwaps = syntheticPool(fromAssetId, toAssetId)
+    keep = ONE_4_DP - SWAP_FEE_BPS
+    if swapMode == SwapMode.FIXED_INPUT:
+        amountIn = mulScale(amount, keep, ONE_4_DP)
+        quoteAmount = amountIn * toReserve // (fromReserve + amountIn)
+        spotAmount = amount * toReserve / fromReserve
+        priceImpact = 1 - quoteAmount / spotAmount if spotAmount else 0.0
+    else:
+        if amount >= toReserve:
+            raise ValueError("Insufficient liquidity")
+        amountIn = -(-fromReserve * amount // (toReserve - amount))
+        quoteAmount = -(-amountIn * ONE_4_DP // keep)
+        spotAmount = amount * fromReserve / toReserve
+        priceImpact = quoteAmount / spotAmount - 1 if spotAmount else 0.0
+    return quoteAmount, round(priceImpact, 6), numSwaps
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "RouterStandInServer"
+    protocol_version = "HTTP/1.1"
+    # small keep-alive responses would otherwise wait for delayed ACKs
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        route = url.path.split("/v2", 1)[-1].removeprefix("/pro")
+        handler = {
+            "/fetch/quote": server.fetchQuote,
+            "/prepare/swap": server.prepareSwap,
+            "/fetch/tiers": server.fetchTiers,
+            "/fetch/discount": server.fetchDiscount,
+        }.get(route)
+
+        server.countRequest(route)
+        if server.latency:
+            time.sleep(server.latency)
+        if handler is None:
+            return self._send(404, {"error": f"Unknown route {url.path}"})
+        if server.injectError():
+            return self._send(503, {"error": "Injected error"})
+        try:
+            result = handler(query)
+        except (KeyError, ValueError, OverflowError) as e:
+            return self._send(400, {"error": str(e)})
+        self._send(200, {"result": result})
+
+    def _send(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class RouterStandInServer(ThreadingHTTPServer):
+    """Local HTTP server implementing the Folks Router API endpoints used by the SDK"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        :param host: host to listen on
+        :param port: port to listen on, 0 picks a free port
+        :param latency: seconds added to each response
+        :param error_rate: fraction of requests failing with HTTP 503
+        :param seed: seed of the injected errors
+        """
+        super().__init__((host, port), _Handler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.requests: dict[str, int] = {}  # route -> number of requests
+        self.errors = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def countRequest(self, route: str) -> None:
+        with self._lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+
+    def injectError(self) -> bool:
+        with self._lock:
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.errors += 1
+                return True
+            return False
+
+    def start(self) -> "RouterStandInServer":
+        """Serves in a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "RouterStandInServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # endpoints
+
+    def fetchQuote(self, query: dict) -> dict:
+        network = query["network"]
+        fromAssetId = int(query["fromAsset"])
+        toAssetId = int(query["toAsset"])
+        amount = int(query["amount"])
+        swapMode = SwapMode(query["type"])
+        if network not in NETWORKS:
+            raise ValueError(f"Unknown network {network}")
+        if not 0 < amount < 2**64 or fromAssetId == toAssetId:
+            raise ValueError("Invalid swap")
+
+        quoteAmount, priceImpact, numSwaps = syntheticQuote(
+            fromAssetId, toAssetId, amount, swapMode
+        )
+        maxGroupSize = int(query.get("maxGroupSize", 16))
+        numSwaps = max(1, min(numSwaps, maxGroupSize - 2))
+        payload = {
+            "network": network,
+            "fromAsset": fromAssetId,
+            "toAsset": toAssetId,
+            "amount": amount,
+            "type": swapMode.value,
+            "quoteAmount": quoteAmount,
+            "data": {"paths": [{"swaps": [{"pool": i} for i in range(numSwaps)]}]},
+        }
+        return {
+            "quoteAmount": str(quoteAmount),
+            "priceImpact": priceImpact,
+            "microalgoTxnsFee": 1000 * (3 + numSwaps),
+            "txnPayload": b64encode(json.dumps(payload).encode()).decode(),
+        }
+
+    def prepareSwap(self, query: dict) -> list[str]:
+        userAddress = query["userAddress"]
+        slippageBps = int(query["slippageBps"])
+        payload = json.loads(b64decode(query["txnPayload"]))
+
+        network = payload["network"]
+        fromAssetId = payload["fromAsset"]
+        toAssetId = payload["toAsset"]
+        amount = payload["amount"]
+        swapMode = SwapMode(payload["type"])
+        quoteAmount = payload["quoteAmount"]
+        numSwaps = len(payload["data"]["paths"][0]["swaps"])
+
+        validator = swapTransactionsValidator(NETWORKS[network])
+        appId = validator.folksRouterAppId
+        slippageAmount = mulScale(quoteAmount, slippageBps, ONE_4_DP)
+        if swapMode == SwapMode.FIXED_INPUT:
+            sendAmount = amount
+            receiveAmount = quoteAmount - slippageAmount
+            endSelector = validator.fiEndSwapSelector
+        else:
+            sendAmount = quoteAmount + slippageAmount
+            receiveAmount = amount
+            endSelector = validator.foEndSwapSelector
+        if not is_valid_address(userAddress):
+            raise ValueError(f"Invalid user address {userAddress}")
+        if not 0 <= slippageBps <= ONE_4_DP:
+            raise ValueError(f"Invalid slippage {slippageBps}")
+        if not (0 < sendAmount < 2**64 and 0 <= receiveAmount < 2**64):
+            raise ValueError("Invalid swap amounts")
+
+        gen, gh = GENESIS[network]
+        sp = SuggestedParams(0, 1, 1001, gh, gen, flat_fee=True)
+        routerAddr = get_application_address(appId)
+        if fromAssetId == 0:
+            sendTxn = PaymentTxn(userAddress, sp, routerAddr, sendAmount)
+        else:
+            sendTxn = AssetTransferTxn(
+                userAddress, sp, routerAddr, sendAmount, fromAssetId
+            )
+        forwardTxns = [
+            ApplicationNoOpTxn(
+                userAddress,
+                sp,
+                appId,
+                [validator.swapForwardSelector, i.to_bytes(8, "big")],
+            )
+            for i in range(numSwaps)
+        ]
+        endTxn = ApplicationNoOpTxn(
+            userAddress,
+            SuggestedParams(1000 * (2 + numSwaps), 1, 1001, gh, gen, flat_fee=True),
+            appId,
+            [
+                endSelector,
+                toAssetId.to_bytes(8, "big"),
+                receiveAmount.to_bytes(8, "big"),
+            ],
+            foreign_assets=[toAssetId] if toAssetId else None,
+        )
+        txns = assign_group_id([sendTxn, *forwardTxns, endTxn])
+        return [msgpack_encode(txn) for txn in txns]
+
+    def fetchTiers(self, query: dict) -> dict:
+        return {
+            "assetId": DISCOUNT_ASSET_ID,
+            "tiers": [
+                {"amount": "1000000000", "discount": "10"},
+                {"amount": "10000000000", "discount": "20"},
+                {"amount": "100000000000", "discount": "30"},
+            ],
+        }
+
+    def fetchDiscount(self, query: dict) -> int:
+        # deterministic discount tier of the user
+        digest = sha256(query["userAddress"].encode()).digest()
+        return (0, 10, 20, 30)[digest[0] % 4]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = RouterStandInServer(
+        args.host, args.port, args.latency, args.error_rate, args.seed
+    )
+    print(f"Folks Router stand-in listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
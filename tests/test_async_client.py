@@ -0,0 +1,124 @@
+import asyncio
+from base64 import b64decode
+import pytest
+import requests
+from algosdk.account import generate_account
+from algosdk.v2client.algod import AlgodClient
+from ffsdk.config import Network
+from ffsdk.router.async_client import AsyncFolksRouterClient
+from ffsdk.router.client import FolksRouterClient
+from ffsdk.router.datatypes import SwapMode, SwapParams
+from ffsdk.transaction_utils import KeySigner
+from standin_server import DISCOUNT_ASSET_ID, RouterStandInServer
+
+FROM_ASSET, TO_ASSET = 0, 31566704
+SWAP = SwapParams(FROM_ASSET, TO_ASSET, 1_000_000, SwapMode.FIXED_INPUT)
+
+
+class FakeAlgod(AlgodClient):
+    """Algod recording the submitted groups"""
+
+    def __init__(self):
+        super().__init__("", "http://localhost")
+        self.submitted = []
+
+    def send_raw_transaction(self, txn, **kwargs):
+        self.submitted.append(b64decode(txn))
+        return f"TXID{len(self.submitted)}"
+
+
+@pytest.fixture(scope="module")
+def server():
+    with RouterStandInServer() as server:
+        yield server
+
+
+def run(server, coroutine_function):
+    """Runs coroutine_function(client) with an async client of the stand-in server"""
+
+    async def main():
+        client = AsyncFolksRouterClient(Network.MAINNET, base_url=server.url)
+        try:
+            return await coroutine_function(client)
+        finally:
+            client.close()
+
+    return asyncio.run(main())
+
+
+def sync_client(server) -> FolksRouterClient:
+    return FolksRouterClient(Network.MAINNET, base_url=server.url)
+
+
+def test_same_results_as_the_sync_client(server):
+    addr = generate_account()[1]
+
+    async def fetch(client):
+        return await asyncio.gather(
+            client.fetchDiscountTiers(),
+            client.fetchUserDiscount(addr),
+            client.fetchSwapQuote(SWAP),
+        )
+
+    tiers, discount, quote = run(server, fetch)
+    sync = sync_client(server)
+    assert tiers.assetId == DISCOUNT_ASSET_ID
+    assert tiers == sync.fetchDiscountTiers()
+    assert discount == sync.fetchUserDiscount(addr)
+    assert quote == sync.fetchSwapQuote(SWAP)
+
+
+def test_fetch_swap_quotes(server):
+    params = [
+        SwapParams(FROM_ASSET, TO_ASSET, amount, SwapMode.FIXED_INPUT)
+        for amount in (10**5, 10**6, 10**7)
+    ]
+    quotes = run(server, lambda client: client.fetchSwapQuotes(params))
+    sync = sync_client(server)
+    assert quotes == [sync.fetchSwapQuote(p) for p in params]
+
+
+def test_fetch_swap_quotes_with_failures(server):
+    params = [SWAP, SwapParams(FROM_ASSET, FROM_ASSET, 10**6, SwapMode.FIXED_INPUT)]
+    quote, error = run(
+        server, lambda client: client.fetchSwapQuotes(params, return_exceptions=True)
+    )
+    assert quote.quoteAmount > 0
+    assert isinstance(error, requests.HTTPError)
+    with pytest.raises(requests.HTTPError):
+        run(server, lambda client: client.fetchSwapQuotes(params))
+
+
+def test_fetch_price_impact_curve(server):
+    curve = run(
+        server,
+        lambda client: client.fetchPriceImpactCurve(
+            FROM_ASSET, TO_ASSET, SwapMode.FIXED_INPUT, 10**5, 10**8, numPoints=8
+        ),
+    )
+    assert len(curve.points) == 8
+    assert curve.amounts[0] == 10**5 and curve.amounts[-1] == 10**8
+    last = SwapParams(FROM_ASSET, TO_ASSET, 10**8, SwapMode.FIXED_INPUT)
+    assert (
+        curve.quoteAmount(10**8) == sync_client(server).fetchSwapQuote(last).quoteAmount
+    )
+
+
+def test_prepare_and_execute_swap(server):
+    key, addr = generate_account()
+    algod = FakeAlgod()
+
+    async def swap(client):
+        quote = await client.fetchSwapQuote(SWAP)
+        txns = await client.prepareSwapTransactions(SWAP, addr, 50, quote)
+        execution = await client.executeSwap(
+            algod, SWAP, addr, 50, KeySigner(key), swapQuote=quote
+        )
+        return quote, txns, execution
+
+    quote, txns, execution = run(server, swap)
+    assert len(txns) >= 3
+    assert execution.quote == quote
+    assert execution.txId == "TXID1"
+    assert "quote" not in execution.timings
+    assert len(algod.submitted) == 1
@@ -0,0 +1,123 @@
+import pytest
+from ffsdk.config import Network
+from ffsdk.router import curve as curve_module
+from ffsdk.router.client import FolksRouterClient
+from ffsdk.router.curve import (
+    CurvePoint,
+    PriceImpactCurve,
+    fetchPriceImpactCurve,
+    geometricLadder,
+)
+from ffsdk.router.datatypes import SwapMode, SwapParams
+from standin_server import RouterStandInServer
+
+FROM_ASSET, TO_ASSET = 0, 31566704
+POINTS = [
+    CurvePoint(100, 1000, 0.001, 2000),
+    CurvePoint(200, 1990, 0.005, 2000),
+    CurvePoint(400, 3930, 0.02, 4000),
+]
+
+
+def make_curve(swapMode: SwapMode = SwapMode.FIXED_INPUT, ttl: float = 2.8):
+    return PriceImpactCurve(SwapParams(FROM_ASSET, TO_ASSET, 0, swapMode), POINTS, ttl)
+
+
+@pytest.fixture(scope="module")
+def server():
+    with RouterStandInServer() as server:
+        yield server
+
+
+def test_geometric_ladder():
+    assert geometricLadder(1, 1000, 4) == [1, 10, 100, 1000]
+    assert geometricLadder(5, 500, 1) == [500]
+    # rounding duplicates are dropped
+    assert geometricLadder(1, 3, 8) == [1, 2, 3]
+    for args in ((0, 10, 2), (10, 5, 2), (1, 10, 0)):
+        with pytest.raises(ValueError, match="Invalid ladder bounds"):
+            geometricLadder(*args)
+
+
+def test_sampled_points_are_exact():
+    curve = make_curve()
+    for p in POINTS:
+        assert curve.quoteAmount(p.amount) == p.quoteAmount
+        assert curve.priceImpact(p.amount) == p.priceImpact
+    # a sampled amount starts the next segment, whose larger route pays the fee
+    assert [curve.microalgoTxnsFee(p.amount) for p in POINTS] == [2000, 4000, 4000]
+
+
+def test_interpolation_within_a_segment():
+    curve = make_curve()
+    assert curve.quoteAmount(150) == 1495
+    assert curve.priceImpact(300) == pytest.approx(0.0125)
+    # fee of the larger route of the segment
+    assert curve.microalgoTxnsFee(150) == 2000
+    assert curve.microalgoTxnsFee(300) == 4000
+
+
+def test_interpolation_below_the_first_point():
+    curve = make_curve()
+    assert curve.quoteAmount(50) == 500
+    assert curve.quoteAmount(0) == 0
+    assert curve.priceImpact(50) == POINTS[0].priceImpact
+    assert curve.microalgoTxnsFee(50) == POINTS[0].microalgoTxnsFee
+
+
+def test_amount_above_the_sampled_range():
+    curve = make_curve()
+    for method in (curve.quoteAmount, curve.priceImpact, curve.microalgoTxnsFee):
+        with pytest.raises(ValueError, match="above the sampled range"):
+            method(401)
+
+
+def test_rounding_is_unfavourable():
+    # 1000 + 990 * 33 / 100 = 1326.7
+    assert make_curve(SwapMode.FIXED_INPUT).quoteAmount(133) == 1326
+    assert make_curve(SwapMode.FIXED_OUTPUT).quoteAmount(133) == 1327
+
+
+def test_max_amount_for_price_impact():
+    curve = make_curve()
+    assert curve.maxAmountForPriceImpact(0.0005) == 0
+    assert curve.maxAmountForPriceImpact(0.001) == 100
+    assert curve.maxAmountForPriceImpact(0.003) == 150
+    assert curve.maxAmountForPriceImpact(0.0125) == 300
+    assert curve.maxAmountForPriceImpact(0.5) == 400
+
+
+def test_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(curve_module, "monotonic", lambda: now[0])
+    curve = make_curve(ttl=2.8)
+    assert not curve.expired
+    now[0] += 2.7
+    assert not curve.expired
+    now[0] += 0.1
+    assert curve.expired
+
+
+def test_no_points():
+    with pytest.raises(ValueError, match="No curve points"):
+        PriceImpactCurve(SwapParams(FROM_ASSET, TO_ASSET, 0, SwapMode.FIXED_INPUT), [])
+
+
+@pytest.mark.parametrize("swapMode", [SwapMode.FIXED_INPUT, SwapMode.FIXED_OUTPUT])
+def test_fetch_price_impact_curve(server, swapMode):
+    client = FolksRouterClient(Network.MAINNET, base_url=server.url)
+    curve = fetchPriceImpactCurve(
+        client, FROM_ASSET, TO_ASSET, swapMode, 10**4, 10**8, numPoints=5
+    )
+    assert curve.amounts == geometricLadder(10**4, 10**8, 5)
+    assert curve.params == SwapParams(FROM_ASSET, TO_ASSET, 0, swapMode)
+    # sampled amounts are quoted exactly, others lie between their neighbours
+    for amount in curve.amounts:
+        quote = client.fetchSwapQuote(
+            SwapParams(FROM_ASSET, TO_ASSET, amount, swapMode)
+        )
+        assert curve.quoteAmount(amount) == quote.quoteAmount
+        assert curve.priceImpact(amount) == quote.priceImpact
+    low, high = curve.points[1], curve.points[2]
+    middle = (low.amount + high.amount) // 2
+    assert low.quoteAmount <= curve.quoteAmount(middle) <= high.quoteAmount
@@ -0,0 +1,160 @@
+from base64 import b64decode, b64encode
+import msgpack
+import pytest
+from algosdk.account import generate_account
+from algosdk.encoding import msgpack_decode
+from algosdk.v2client.algod import AlgodClient
+from ffsdk.config import Network
+from ffsdk.router.client import FolksRouterClient
+from ffsdk.router.datatypes import SwapMode, SwapParams
+from ffsdk.router.quote_cache import QuoteCache
+from standin_server import RouterStandInServer
+from ffsdk.transaction_utils import KeySigner
+
+SWAP = SwapParams(0, 31566704, 1_000_000, SwapMode.FIXED_INPUT)
+NEARBY_SWAP = SwapParams(0, 31566704, 1_004_000, SwapMode.FIXED_INPUT)
+
+
+class FakeAlgod(AlgodClient):
+    """Algod recording the submitted groups"""
+
+    def __init__(self):
+        super().__init__("", "http://localhost")
+        self.submitted = []
+
+    def send_raw_transaction(self, txn, **kwargs):
+        raw = b64decode(txn)
+        self.submitted.append(raw)
+        return f"TXID{len(self.submitted)}"
+
+
+@pytest.fixture(scope="module")
+def server():
+    with RouterStandInServer() as server:
+        yield server
+
+
+@pytest.fixture
+def account():
+    key, addr = generate_account()
+    return key, addr
+
+
+def router(server, quote_cache=None) -> FolksRouterClient:
+    return FolksRouterClient(
+        Network.MAINNET, base_url=server.url, quote_cache=quote_cache
+    )
+
+
+def test_execute_swap(server, account):
+    key, addr = account
+    algod = FakeAlgod()
+    execution = router(server).executeSwap(algod, SWAP, addr, 50, KeySigner(key))
+    assert execution.txId == "TXID1"
+    assert execution.confirmedRound is None
+    assert execution.quote.txnPayload is not None
+    assert set(execution.timings) == {
+        "quote",
+        "prepare",
+        "decode",
+        "check",
+        "sign",
+        "submit",
+    }
+    assert len(algod.submitted) == 1
+
+
+def test_execute_swap_uses_cached_exact_quote(server, account):
+    key, addr = account
+    client = router(server, QuoteCache())
+    quote = client.fetchSwapQuote(SWAP)
+    before = server.requests.get("/fetch/quote", 0)
+    execution = client.executeSwap(FakeAlgod(), SWAP, addr, 50, KeySigner(key))
+    assert server.requests.get("/fetch/quote", 0) == before
+    assert execution.quote == quote
+
+
+def test_execute_swap_refetches_approximate_quote(server, account):
+    key, addr = account
+    cache = QuoteCache(amount_bucket_bps=100)
+    client = router(server, cache)
+    client.fetchSwapQuote(SWAP)
+    approx = client.fetchSwapQuote(NEARBY_SWAP)
+    assert approx.txnPayload is None
+
+    before = server.requests.get("/fetch/quote", 0)
+    execution = client.executeSwap(FakeAlgod(), NEARBY_SWAP, addr, 50, KeySigner(key))
+    assert server.requests.get("/fetch/quote", 0) == before + 1
+    assert execution.quote.txnPayload is not None
+    assert "quote" in execution.timings
+
+    # an approximate quote given by the caller is replaced too
+    execution = client.executeSwap(
+        FakeAlgod(), NEARBY_SWAP, addr, 50, KeySigner(key), swapQuote=approx
+    )
+    assert execution.quote.txnPayload is not None
+
+
+def test_execute_swap_caches_refetched_exact_quote(server, account):
+    key, addr = account
+    cache = QuoteCache(amount_bucket_bps=100)
+    client = router(server, cache)
+    client.fetchSwapQuote(SWAP)
+    assert client.fetchSwapQuote(NEARBY_SWAP).txnPayload is None
+
+    execution = client.executeSwap(FakeAlgod(), NEARBY_SWAP, addr, 50, KeySigner(key))
+    before = server.requests.get("/fetch/quote", 0)
+    # the exact quote replaced the one nearby quotes were scaled from
+    assert client.fetchSwapQuote(NEARBY_SWAP) == execution.quote
+    again = client.executeSwap(FakeAlgod(), NEARBY_SWAP, addr, 50, KeySigner(key))
+    assert again.quote == execution.quote
+    assert server.requests.get("/fetch/quote", 0) == before
+
+
+def test_quote_without_payload_never_prepares_transactions(server, account):
+    key, addr = account
+    client = router(server, QuoteCache(amount_bucket_bps=100))
+    client.fetchSwapQuote(SWAP)
+    approx = client.fetchSwapQuote(NEARBY_SWAP)
+    assert approx.txnPayload is None
+
+    before = server.requests.get("/prepare/swap", 0)
+    with pytest.raises(ValueError, match="Approximate swap quote"):
+        client.prepareSwapTransactions(NEARBY_SWAP, addr, 50, approx)
+    assert server.requests.get("/prepare/swap", 0) == before
+
+    # executeSwap prepares the transactions of a refetched exact quote
+    algod = FakeAlgod()
+    execution = client.executeSwap(
+        algod, NEARBY_SWAP, addr, 50, KeySigner(key), swapQuote=approx
+    )
+    assert execution.quote.txnPayload is not None
+    assert (
+        execution.quote.quoteAmount != approx.quoteAmount or execution.quote != approx
+    )
+    assert server.requests.get("/prepare/swap", 0) == before + 1
+    assert len(algod.submitted) == 1
+
+
+def test_execute_swap_with_signers_by_sender(server, account):
+    key, addr = account
+    algod = FakeAlgod()
+    router(server).executeSwap(algod, SWAP, addr, 50, {addr: KeySigner(key)})
+    with pytest.raises(KeyError):
+        router(server).executeSwap(
+            algod, SWAP, addr, 50, {generate_account()[1]: KeySigner(key)}
+        )
+    assert len(algod.submitted) == 1
+
+
+def test_execute_swap_signs_whole_group(server, account):
+    key, addr = account
+    algod = FakeAlgod()
+    router(server).executeSwap(algod, SWAP, addr, 50, KeySigner(key))
+    # the submitted group decodes to signed transactions of the user
+    raw = algod.submitted[0]
+    unpacker = msgpack.Unpacker(raw=False)
+    unpacker.feed(raw)
+    stxns = [msgpack_decode(b64encode(msgpack.packb(obj)).decode()) for obj in unpacker]
+    assert len(stxns) >= 3
+    assert all(stxn.transaction.sender == addr and stxn.signature for stxn in stxns)
@@ -0,0 +1,145 @@
+import pytest
+from algosdk.account import generate_account
+from algosdk.transaction import ApplicationNoOpTxn, PaymentTxn, SuggestedParams
+from ffsdk.fee_sizing import (
+    APP_CALL_BUDGET,
+    OPUP_BASE_BUDGET,
+    OPUP_INNER_BUDGET,
+    FeeSizer,
+    group_shape_key,
+)
+from ffsdk.lend.datatypes import OpUp
+
+GENESIS_HASH = "wGHE2Pwdvd7S12BL5FaOP20EGYesN73ktiC1qzkkit8="
+APP_ID = 1234
+OPUP = OpUp(callerAppId=11, baseAppId=12)
+USER = generate_account()[1]
+
+
+def inner(type: str, fee: int = 0, inner_txns: list | None = None) -> dict:
+    txn = {"type": type}
+    if fee:
+        txn["fee"] = fee
+    result = {"txn": {"txn": txn}}
+    if inner_txns:
+        result["inner-txns"] = inner_txns
+    return result
+
+
+# inner txns of the app call: an asset transfer and an app call paid from the fee
+# pool, the latter issuing a payment paying its own fee
+INNER_TXNS = [
+    inner("axfer"),
+    inner("appl", inner_txns=[inner("pay", fee=1000)]),
+]
+
+
+class FakeAlgod:
+    """Algod answering simulate requests with a canned group result"""
+
+    def __init__(self, budgetConsumed: int, failure: str | None = None):
+        self.budgetConsumed = budgetConsumed
+        self.failure = failure
+        self.requests = []
+
+    def simulate_transactions(self, request):
+        self.requests.append(request)
+        txns = [stxn.transaction for stxn in request.txn_groups[0].txns]
+        assert len({txn.group for txn in txns}) == 1 and txns[0].group
+        results = [
+            {"txn-result": {"inner-txns": INNER_TXNS} if txn.type == "appl" else {}}
+            for txn in txns
+        ]
+        group = {"txn-results": results, "app-budget-consumed": self.budgetConsumed}
+        if self.failure is not None:
+            group["failure-message"] = self.failure
+        return {"txn-groups": [group]}
+
+
+@pytest.fixture
+def params():
+    return SuggestedParams(1000, 1000, 2000, GENESIS_HASH, flat_fee=True)
+
+
+def make_group(params, amount: int = 1, method: bytes = b"call") -> list:
+    escrow = generate_account()[1]
+    pay = PaymentTxn(escrow, params, USER, amount)
+    pay.fee = 0  # sent by an escrow, paid by the app call
+    call = ApplicationNoOpTxn(USER, params, APP_ID, [method])
+    call.fee = 10_000
+    return [pay, call]
+
+
+def test_fees_from_simulated_inner_txns(params):
+    algod = FakeAlgod(budgetConsumed=2 * APP_CALL_BUDGET)
+    txns = make_group(params)
+    sized = FeeSizer(algod).size(txns)
+    # app call: itself, two pooled inner txns and the escrow payment
+    assert [txn.fee for txn in sized] == [0, 4000]
+    assert all(txn.group is None for txn in sized)
+    assert [txn.fee for txn in txns] == [0, 10_000]  # given txns are not modified
+    assert len(algod.requests) == 1
+
+
+def test_min_fee(params):
+    algod = FakeAlgod(budgetConsumed=0)
+    sized = FeeSizer(algod, min_fee=2000).size(make_group(params))
+    assert [txn.fee for txn in sized] == [0, 8000]
+
+
+def test_opup_sized_from_the_budget_deficit(params):
+    deficit = OPUP_BASE_BUDGET + OPUP_INNER_BUDGET + 1  # needs 2 opup inner txns
+    algod = FakeAlgod(budgetConsumed=2 * APP_CALL_BUDGET + deficit)
+    sized = FeeSizer(algod).size(make_group(params), OPUP, USER)
+    assert len(sized) == 3
+    opupTxn = sized[0]
+    assert (opupTxn.index, opupTxn.sender, opupTxn.fee) == (
+        OPUP.callerAppId,
+        USER,
+        3000,
+    )
+    assert [txn.fee for txn in sized[1:]] == [0, 4000]
+
+
+def test_opup_base_budget_covers_small_deficits(params):
+    algod = FakeAlgod(budgetConsumed=2 * APP_CALL_BUDGET + OPUP_BASE_BUDGET)
+    sized = FeeSizer(algod).size(make_group(params), OPUP, USER)
+    assert len(sized) == 3
+    assert sized[0].fee == 1000  # opup call without inner txns
+
+
+def test_budget_deficit_without_opup(params):
+    algod = FakeAlgod(budgetConsumed=2 * APP_CALL_BUDGET + 1)
+    with pytest.raises(ValueError, match="1 more opcode budget"):
+        FeeSizer(algod).size(make_group(params))
+
+
+def test_opup_requires_user(params):
+    algod = FakeAlgod(budgetConsumed=2 * APP_CALL_BUDGET + 1)
+    with pytest.raises(ValueError, match="userAddr required"):
+        FeeSizer(algod).size(make_group(params), OPUP)
+
+
+def test_failed_simulation(params):
+    algod = FakeAlgod(budgetConsumed=0, failure="logic eval error")
+    with pytest.raises(ValueError, match="logic eval error"):
+        FeeSizer(algod).size(make_group(params))
+
+
+def test_sizing_is_cached_per_group_shape(params):
+    algod = FakeAlgod(budgetConsumed=0)
+    sizer = FeeSizer(algod)
+    sizer.size(make_group(params, amount=1))
+    sizer.size(make_group(params, amount=2))  # same shape
+    assert len(algod.requests) == 1
+    sizer.size(make_group(params, method=b"other"))
+    assert len(algod.requests) == 2
+    sizer.clear()
+    sizer.size(make_group(params, amount=3))
+    assert len(algod.requests) == 3
+
+
+def test_group_shape_key(params):
+    first, second = make_group(params, amount=1), make_group(params, amount=2)
+    assert group_shape_key(first) == group_shape_key(second)
+    assert group_shape_key(first) != group_shape_key(make_group(params, method=b"x"))
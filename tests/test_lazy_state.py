@@ -0,0 +1,79 @@
+import random
+from base64 import b64encode
+import pytest
+from ffsdk.state_utils import LazyState, format_state
+
+
+def b64(data: bytes) -> str:
+    return b64encode(data).decode()
+
+
+def bytes_value(data: bytes) -> dict:
+    return {"type": 1, "bytes": b64(data), "uint": 0}
+
+
+def uint_value(value: int) -> dict:
+    return {"type": 2, "bytes": "", "uint": value}
+
+
+rng = random.Random(48)
+STATE = [
+    {"key": b64(b"pm"), "value": bytes_value(rng.randbytes(8))},
+    {"key": b64(b"num_proposers"), "value": uint_value(4)},
+    {"key": b64(b"zero"), "value": uint_value(0)},
+    {"key": b64(b"name"), "value": bytes_value(b"Folks Finance")},
+    {"key": b64(b"empty"), "value": bytes_value(b"")},
+    {"key": b64(b"\xff\xfe"), "value": uint_value(2**64 - 1)},
+    {"key": b64(b"\x00" * 8 + b"\x01"), "value": bytes_value(b"\xff" * 32)},
+    {"key": b64("ключ".encode()), "value": bytes_value("значение".encode())},
+] + [
+    {"key": b64(rng.randbytes(rng.randrange(1, 64))), "value": value}
+    for value in [bytes_value(rng.randbytes(32)) for _ in range(20)]
+    + [uint_value(rng.randrange(2**64)) for _ in range(20)]
+]
+FLAGS = [
+    {"decode_byte_values": values, "decode_byte_keys": keys}
+    for values in (False, True)
+    for keys in (False, True)
+]
+
+
+@pytest.mark.parametrize("flags", FLAGS)
+def test_equals_format_state(flags):
+    expected = format_state(STATE, **flags)
+    lazy = LazyState(STATE, **flags)
+    assert dict(lazy) == expected
+    assert list(lazy) == list(expected)
+    assert len(lazy) == len(expected)
+    for key, value in expected.items():
+        assert lazy[key] == value
+        assert key in lazy
+        assert lazy.get(key) == value
+
+
+@pytest.mark.parametrize("flags", FLAGS)
+def test_missing_keys(flags):
+    lazy = LazyState(STATE, **flags)
+    expected = format_state(STATE, **flags)
+    for key in ["missing", b"missing", "pm", b"pm", b"\xff\xfe", 1, None]:
+        if key in expected:
+            continue
+        assert key not in lazy
+        assert lazy.get(key, "default") == "default"
+        with pytest.raises(KeyError):
+            lazy[key]
+
+
+def test_empty_state():
+    lazy = LazyState([])
+    assert dict(lazy) == {} == format_state([])
+    assert len(lazy) == 0
+    assert "pm" not in lazy
+
+
+def test_duplicate_keys_keep_the_last_value():
+    state = [
+        {"key": b64(b"a"), "value": uint_value(1)},
+        {"key": b64(b"a"), "value": uint_value(2)},
+    ]
+    assert dict(LazyState(state)) == format_state(state) == {"a": 2}
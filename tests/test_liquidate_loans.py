@@ -0,0 +1,91 @@
+import pytest
+from algosdk.account import generate_account
+from algosdk.transaction import SuggestedParams
+from ffsdk.config import Network
+from ffsdk.lend.datatypes import LoanLiquidation, LoanType
+from ffsdk.lend.lending_config import LENDING_CONFIGS
+from ffsdk.lend.loan import prepareLiquidateLoan, prepareLiquidateLoans
+
+CONFIG = LENDING_CONFIGS[Network.MAINNET]
+LOAN_APP_ID = CONFIG.loans[LoanType.GENERAL]
+
+
+@pytest.fixture
+def params():
+    return SuggestedParams(
+        1000, 1000, 2000, "wGHE2Pwdvd7S12BL5FaOP20EGYesN73ktiC1qzkkit8=", flat_fee=True
+    )
+
+
+@pytest.fixture
+def liquidations() -> list[LoanLiquidation]:
+    pools = CONFIG.pools
+
+    def liquidation(collateral, borrow, assets, amount, isStable):
+        return LoanLiquidation(
+            generate_account()[1],
+            pools[collateral],
+            pools[borrow],
+            [],
+            [pools[name].assetId for name in assets],
+            amount,
+            amount // 2,
+            isStable,
+        )
+
+    return [
+        liquidation("ALGO", "USDC", ["ALGO", "USDC"], 10**6, False),
+        liquidation("USDC", "ALGO", ["USDC", "ALGO"], 2 * 10**6, True),
+        liquidation("gALGO", "USDt", ["gALGO", "USDt", "ALGO"], 3 * 10**6, False),
+        # same assets as the first one: refresh prices built once
+        liquidation("ALGO", "USDC", ["ALGO", "USDC"], 4 * 10**6, False),
+        liquidation("WBTC_NTT", "WETH_NTT", ["WBTC_NTT", "WETH_NTT"], 5, True),
+    ]
+
+
+def prepare(liquidations, params, liquidatorAddr):
+    return prepareLiquidateLoans(
+        LOAN_APP_ID,
+        CONFIG.pool_manager_app_id,
+        liquidatorAddr,
+        CONFIG.reserve_address,
+        CONFIG.oracle,
+        liquidations,
+        params,
+    )
+
+
+def test_groups_match_single_liquidations(liquidations, params):
+    liquidatorAddr = generate_account()[1]
+    groups = prepare(liquidations, params, liquidatorAddr)
+    assert len(groups) == len(liquidations)
+    for group, liquidation in zip(groups, liquidations):
+        expected = prepareLiquidateLoan(
+            LOAN_APP_ID,
+            CONFIG.pool_manager_app_id,
+            liquidatorAddr,
+            liquidation.escrowAddr,
+            CONFIG.reserve_address,
+            liquidation.collateralPool,
+            liquidation.borrowPool,
+            CONFIG.oracle,
+            liquidation.lpAssets,
+            liquidation.baseAssetIds,
+            liquidation.repayAmount,
+            liquidation.minCollateralAmount,
+            liquidation.isStable,
+            params,
+        )
+        assert [txn.dictify() for txn in group] == [txn.dictify() for txn in expected]
+
+
+def test_groups_share_no_transactions(liquidations, params):
+    liquidatorAddr = generate_account()[1]
+    groups = prepare(liquidations, params, liquidatorAddr)
+    expected = [[txn.dictify() for txn in group] for group in groups]
+
+    first, same_assets = groups[0], groups[3]
+    assert first[0] is not same_assets[0]
+    first[0].app_args.append(b"x")
+    first[0].foreign_apps.append(1)
+    assert [txn.dictify() for txn in same_assets] == expected[3]
@@ -0,0 +1,200 @@
+import json
+import pytest
+from algosdk import abi
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.encoding import msgpack_encode
+from algosdk.transaction import (
+    ApplicationNoOpTxn,
+    AssetTransferTxn,
+    OnComplete,
+    PaymentTxn,
+    SuggestedParams,
+)
+from ffsdk.lend.abi_contracts import (
+    depositsABIContract,
+    depositStakingABIContract,
+    loanABIContract,
+    lpTokenOracleABIContract,
+    oracleAdapterABIContract,
+    poolABIContract,
+)
+from ffsdk.method_templates import MethodCallTemplate, method_selector, method_template
+from ffsdk.router.abi_contracts import routerABIContract
+from ffsdk.transaction_utils import remove_signer_and_group, signer
+from ffsdk.xalgo.abi_contracts import stakeAndDepositABIContract, xAlgoABIContract
+
+APP_ID = 971368268
+SP = SuggestedParams(
+    1000, 1, 1001, "wGHE2Pwdvd7S12BL5FaOP20EGYesN73ktiC1qzkkit8=", "mainnet-v1.0"
+)
+SENDER = generate_account()[1]
+OTHERS = [generate_account()[1] for _ in range(8)]
+TXN_TYPES = (PaymentTxn, AssetTransferTxn, ApplicationNoOpTxn)
+
+CONTRACTS = [
+    depositsABIContract,
+    depositStakingABIContract,
+    loanABIContract,
+    lpTokenOracleABIContract,
+    oracleAdapterABIContract,
+    poolABIContract,
+    routerABIContract,
+    stakeAndDepositABIContract,
+    xAlgoABIContract,
+]
+
+
+def value(abi_type: abi.ABIType, i: int):
+    """Returns a sample value of the given ABI type"""
+    if isinstance(abi_type, abi.UintType):
+        return (i * 7919) % (1 << abi_type.bit_size)
+    if isinstance(abi_type, abi.BoolType):
+        return i % 2 == 0
+    if isinstance(abi_type, abi.AddressType):
+        return OTHERS[i % len(OTHERS)]
+    if isinstance(abi_type, abi.ByteType):
+        return i % 256
+    if isinstance(abi_type, abi.StringType):
+        return f"note {i}"
+    if isinstance(abi_type, abi.ArrayStaticType):
+        return [
+            value(abi_type.child_type, i + j) for j in range(abi_type.static_length)
+        ]
+    if isinstance(abi_type, abi.ArrayDynamicType):
+        return [value(abi_type.child_type, i + j) for j in range(3)]
+    if isinstance(abi_type, abi.TupleType):
+        return [value(t, i + j) for j, t in enumerate(abi_type.child_types)]
+    raise NotImplementedError(str(abi_type))
+
+
+def method_args(method: abi.Method) -> list:
+    """Returns sample arguments of a method, repeating references on purpose"""
+    args = []
+    for i, arg in enumerate(method.args):
+        if arg.type in (abi.ABITransactionType.PAY, abi.ABITransactionType.ANY):
+            args.append(PaymentTxn(SENDER, SP, OTHERS[0], 10_000 + i))
+        elif arg.type == abi.ABITransactionType.AXFER:
+            args.append(AssetTransferTxn(SENDER, SP, OTHERS[0], 10 + i, 31566704))
+        elif arg.type == abi.ABITransactionType.APPL:
+            args.append(ApplicationNoOpTxn(SENDER, SP, 1_000 + i))
+        elif arg.type == abi.ABIReferenceType.ACCOUNT:
+            args.append([SENDER, OTHERS[1], OTHERS[2]][i % 3])
+        elif arg.type == abi.ABIReferenceType.ASSET:
+            args.append([0, 31566704, 386192725][i % 3])
+        elif arg.type == abi.ABIReferenceType.APPLICATION:
+            args.append([APP_ID, 971372237, 971368268][i % 3])
+        else:
+            args.append(value(arg.type, i))
+    return args
+
+
+def with_composer(contract, method, args, **kwargs) -> list[bytes]:
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        sender=SENDER,
+        signer=signer,
+        app_id=APP_ID,
+        method=method,
+        # the composer takes transaction arguments with their signer
+        method_args=[
+            TransactionWithSigner(a, signer) if isinstance(a, TXN_TYPES) else a
+            for a in args
+        ],
+        sp=SP,
+        **kwargs,
+    )
+    return [msgpack_encode(txn) for txn in remove_signer_and_group(atc.build_group())]
+
+
+@pytest.mark.parametrize(
+    "contract, method",
+    [(c, m) for c in CONTRACTS for m in c.methods],
+    ids=lambda x: getattr(x, "name", None),
+)
+def test_template_matches_composer(contract, method):
+    args = method_args(method)
+    template = MethodCallTemplate(contract, APP_ID, method.name)
+    built = [msgpack_encode(txn) for txn in template.build(SENDER, SP, args)]
+    assert built == with_composer(contract, method, args)
+
+
+def test_template_matches_composer_with_extra_references():
+    method = loanABIContract.get_method_by_name("add_collateral")
+    args = method_args(method)
+    kwargs = dict(
+        accounts=[OTHERS[3]],
+        foreign_apps=[12345],
+        foreign_assets=[31566704],
+        boxes=[(APP_ID, b"box")],
+        note=b"note",
+        lease=bytes(32),
+        rekey_to=OTHERS[4],
+    )
+    template = MethodCallTemplate(loanABIContract, APP_ID, method.name)
+    built = [msgpack_encode(txn) for txn in template.build(SENDER, SP, args, **kwargs)]
+    assert built == with_composer(loanABIContract, method, args, **kwargs)
+
+
+def test_template_compacts_more_than_fifteen_arguments():
+    contract = abi.Contract(
+        "many",
+        [abi.Method("many", [abi.Argument("uint64")] * 18, abi.Returns("void"))],
+    )
+    method = contract.get_method_by_name("many")
+    args = list(range(18))
+    template = MethodCallTemplate(contract, APP_ID, "many")
+    built = [msgpack_encode(txn) for txn in template.build(SENDER, SP, args)]
+    assert built == with_composer(contract, method, args)
+
+
+def test_template_on_complete():
+    method = xAlgoABIContract.methods[0]
+    args = method_args(method)
+    template = MethodCallTemplate(
+        xAlgoABIContract, APP_ID, method.name, OnComplete.OptInOC
+    )
+    built = [msgpack_encode(txn) for txn in template.build(SENDER, SP, args)]
+    assert built == with_composer(
+        xAlgoABIContract, method, args, on_complete=OnComplete.OptInOC
+    )
+
+
+def test_template_rejects_wrong_arguments():
+    template = method_template(loanABIContract, APP_ID, "add_collateral")
+    with pytest.raises(ValueError):
+        template.build(SENDER, SP, [])
+
+    # a payment argument given as an application call
+    method = next(
+        m
+        for m in loanABIContract.methods
+        if any(a.type == abi.ABITransactionType.PAY for a in m.args)
+    )
+    args = method_args(method)
+    for i, arg in enumerate(method.args):
+        if arg.type == abi.ABITransactionType.PAY:
+            args[i] = ApplicationNoOpTxn(SENDER, SP, 1)
+    template = method_template(loanABIContract, APP_ID, method.name)
+    with pytest.raises(ValueError):
+        template.build(SENDER, SP, args)
+
+
+def test_caches_check_contract_identity():
+    template = method_template(loanABIContract, APP_ID, "add_collateral")
+    assert method_template(loanABIContract, APP_ID, "add_collateral") is template
+    assert (
+        method_template(loanABIContract, APP_ID + 1, "add_collateral") is not template
+    )
+
+    # an equal but distinct contract gets its own template and selector
+    contract = abi.Contract.from_json(json.dumps(loanABIContract.dictify()))
+    other = method_template(contract, APP_ID, "add_collateral")
+    assert other is not template
+    assert other.selector == template.selector
+    assert method_selector(contract, "add_collateral") == method_selector(
+        loanABIContract, "add_collateral"
+    )
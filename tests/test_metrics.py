@@ -0,0 +1,117 @@
+import json
+import pytest
+from algosdk.error import AlgodHTTPError, AlgodResponseError
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+from ffsdk.metrics import RequestMetrics, endpoint_name, instrument
+
+ADDRESS = "A" * 58
+ACCOUNT = {"address": ADDRESS, "amount": 5}
+
+
+class FakeAlgod(AlgodClient):
+    """Algod serving canned bodies, json decoded like algod_request does"""
+
+    def __init__(self, bodies: dict[str, bytes]):
+        super().__init__("", "http://localhost")
+        self.bodies = bodies
+
+    def algod_request(
+        self, method, requrl, params=None, data=None, headers=None,
+        response_format="json", timeout=30
+    ):  # fmt: skip
+        body = self.bodies.get(requrl)
+        if body is None:
+            raise AlgodHTTPError("not found", 404)
+        if response_format == "json":
+            return json.loads(body) if body else {}
+        return body
+
+
+class FakeIndexer(IndexerClient):
+    def __init__(self):
+        super().__init__("", "http://localhost")
+
+    def indexer_request(self, method, requrl, params=None, data=None, timeout=30):
+        return {"account": ACCOUNT, "current-round": 7}
+
+
+@pytest.fixture
+def metrics():
+    return RequestMetrics()
+
+
+@pytest.fixture
+def algod(metrics):
+    body = json.dumps(ACCOUNT).encode()
+    algod = FakeAlgod({f"/accounts/{ADDRESS}": body, "/status": b""})
+    return instrument(algod, metrics)
+
+
+def test_endpoint_name():
+    assert endpoint_name("GET", f"/v2/accounts/{ADDRESS}/applications/12?x=1") == (
+        "GET /v2/accounts/{address}/applications/{id}"
+    )
+
+
+def test_algod_counters(algod, metrics):
+    assert algod.account_info(ADDRESS) == ACCOUNT
+    assert algod.status() == {}
+    raw = algod.account_info(ADDRESS, response_format="msgpack")
+    assert raw == json.dumps(ACCOUNT).encode()
+    with pytest.raises(AlgodHTTPError):
+        algod.send_raw_transaction("AAAA")  # 3 bytes once decoded
+
+    received = 2 * len(raw)
+    assert metrics.total.requests == 4
+    assert metrics.total.errors == 1  # POST /transactions is not served
+    assert metrics.total.bytesReceived == received
+    assert metrics.total.bytesSent == 3
+    accounts = metrics.byEndpoint["algod GET /accounts/{address}"]
+    assert (accounts.requests, accounts.bytesReceived) == (2, received)
+    assert metrics.byCaller["<external>"].requests == 4
+
+
+def test_algod_json_errors(algod, metrics):
+    algod.bodies["/status"] = b"{"
+    with pytest.raises(AlgodResponseError):
+        algod.status()
+    assert (metrics.total.requests, metrics.total.errors) == (1, 1)
+
+
+def test_indexer_counters(metrics):
+    indexer = instrument(FakeIndexer(), metrics)
+    result = indexer.account_info(ADDRESS)
+    assert result["account"] == ACCOUNT
+    encoded = json.dumps(result, separators=(",", ":")).encode()
+    assert metrics.total.requests == 1
+    assert metrics.total.bytesReceived == len(encoded)
+    assert list(metrics.byEndpoint) == ["indexer GET /accounts/{address}"]
+
+
+def test_budget(algod, metrics):
+    algod.account_info(ADDRESS)
+    with metrics.budget() as used:
+        algod.status()
+    algod.status()
+    assert used.total.requests == 1
+    assert list(used.byEndpoint) == ["algod GET /status"]
+    assert metrics.total.requests == 3
+
+
+def test_only_the_given_client_is_instrumented(algod, metrics):
+    other = FakeAlgod(algod.bodies)
+    other.account_info(ADDRESS)
+    assert metrics.total.requests == 0
+    # instrumenting twice with the same metrics records each request once
+    assert instrument(algod, metrics) is algod
+    algod.account_info(ADDRESS)
+    assert metrics.total.requests == 1
+
+
+def test_reset(algod, metrics):
+    algod.account_info(ADDRESS)
+    metrics.reset()
+    assert metrics.total.requests == 0
+    assert metrics.byEndpoint == {}
+    assert "endpoint" in metrics.report()
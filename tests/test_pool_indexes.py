@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+import pytest
+from ffsdk.config import Network
+from ffsdk.lend.datatypes import PoolIndexes
+from ffsdk.lend.lending_config import LENDING_CONFIGS
+from ffsdk.lend.loan import getUserLoanAssets
+
+CONFIG = LENDING_CONFIGS[Network.MAINNET]
+
+
+@pytest.fixture
+def built(monkeypatch):
+    """Counts the pool indexes built"""
+    counter = []
+    fromPools = PoolIndexes.fromPools.__func__
+
+    def countingFromPools(cls, pools):
+        counter.append(pools)
+        return fromPools(cls, pools)
+
+    monkeypatch.setattr(PoolIndexes, "fromPools", classmethod(countingFromPools))
+    return counter
+
+
+def make_loan(pools) -> SimpleNamespace:
+    pools = list(pools.values())
+    return SimpleNamespace(
+        collaterals=[SimpleNamespace(poolAppId=pool.appId) for pool in pools[:5]],
+        borrows=[SimpleNamespace(poolAppId=pool.appId) for pool in pools[3:8]],
+    )
+
+
+def expected_asset_ids(pools, loan) -> list[int]:
+    appIds = {c.poolAppId for c in loan.collaterals + loan.borrows}
+    return sorted(pool.assetId for pool in pools.values() if pool.appId in appIds)
+
+
+def test_indexes_match_pools():
+    indexes = CONFIG.pool_indexes
+    for pool in CONFIG.pools.values():
+        assert indexes.by_app_id[pool.appId] is pool
+        assert pool in indexes.by_fasset_id[pool.fAssetId]
+    assert len(indexes.by_app_id) == len(CONFIG.pools)
+
+
+def test_user_loan_assets_builds_indexes_once(built):
+    pools = dict(CONFIG.pools)
+    loan = make_loan(pools)
+    lpAssets, baseAssetIds = getUserLoanAssets(pools, loan)
+    assert lpAssets == []
+    assert sorted(baseAssetIds) == expected_asset_ids(pools, loan)
+    assert built == [pools]
+
+
+def test_user_loan_assets_uses_given_indexes(built):
+    loan = make_loan(CONFIG.pools)
+    _, baseAssetIds = getUserLoanAssets(CONFIG.pools, loan, CONFIG.pool_indexes)
+    assert sorted(baseAssetIds) == expected_asset_ids(CONFIG.pools, loan)
+    assert built == []
+
+
+def test_user_loan_assets_unknown_pool():
+    loan = SimpleNamespace(collaterals=[SimpleNamespace(poolAppId=1)], borrows=[])
+    with pytest.raises(LookupError, match="pool app id 1"):
+        getUserLoanAssets(CONFIG.pools, loan)
@@ -0,0 +1,109 @@
+import pytest
+from ffsdk.router import quote_cache as quote_cache_module
+from ffsdk.router.datatypes import SwapMode, SwapParams, SwapQuote
+from ffsdk.router.quote_cache import QuoteCache
+
+
+def params(amount: int, swapMode: SwapMode = SwapMode.FIXED_INPUT) -> SwapParams:
+    return SwapParams(0, 31566704, amount, swapMode)
+
+
+def quote(quoteAmount: int) -> SwapQuote:
+    return SwapQuote(quoteAmount, 0.01, 5000, "payload")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(quote_cache_module, "monotonic", lambda: now[0])
+    return now
+
+
+def test_exact_hit_and_miss(clock):
+    cache = QuoteCache()
+    p = params(1_000_000)
+    key = cache.key("mainnet", p)
+    assert cache.get(key, p) is None
+    cache.put(key, p, quote(500))
+    assert cache.get(key, p) == quote(500)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_ratio == 0.5
+
+
+def test_key_includes_quote_options():
+    cache = QuoteCache()
+    p = params(1_000_000)
+    keys = {
+        cache.key("mainnet", p),
+        cache.key("testnet", p),
+        cache.key("mainnet", params(1_000_000, SwapMode.FIXED_OUTPUT)),
+        cache.key("mainnet", p, maxGroupSize=8),
+        cache.key("mainnet", p, feeBps=10),
+        cache.key("mainnet", p, userFeeDiscount=20),
+        cache.key("mainnet", p, referrer="R"),
+    }
+    assert len(keys) == 7
+
+
+def test_exact_amounts_without_buckets():
+    cache = QuoteCache()
+    assert cache.key("mainnet", params(1_000_000)) != cache.key(
+        "mainnet", params(1_000_001)
+    )
+
+
+def test_bucketed_quote_is_scaled_and_approximate(clock):
+    cache = QuoteCache(amount_bucket_bps=100)
+    cached, nearby = params(1_000_000), params(1_005_000)
+    key = cache.key("mainnet", cached)
+    assert cache.key("mainnet", nearby) == key
+    assert cache.key("mainnet", params(1_100_000)) != key
+    cache.put(key, cached, quote(500_000))
+
+    approx = cache.get(key, nearby)
+    assert approx.quoteAmount == 500_000 * 1_005_000 // 1_000_000
+    assert approx.txnPayload is None
+    # the exact amount still gets the exact quote
+    assert cache.get(key, cached).txnPayload == "payload"
+
+
+def test_bucketed_fixed_output_rounds_up(clock):
+    cache = QuoteCache(amount_bucket_bps=100)
+    cached, nearby = (
+        params(1_000_000, SwapMode.FIXED_OUTPUT),
+        params(1_000_003, SwapMode.FIXED_OUTPUT),
+    )
+    key = cache.key("mainnet", cached)
+    cache.put(key, cached, quote(333_333))
+    assert cache.get(key, nearby).quoteAmount == -(-333_333 * 1_000_003 // 1_000_000)
+
+
+def test_ttl_and_round_invalidation(clock):
+    cache = QuoteCache(ttl=2.8)
+    p = params(1_000_000)
+    key = cache.key("mainnet", p)
+    cache.put(key, p, quote(500))
+    clock[0] += 2.7
+    assert cache.get(key, p) is not None
+    clock[0] += 0.2
+    assert cache.get(key, p) is None
+
+    cache.put(key, p, quote(500))
+    cache.notify_round(10)
+    assert cache.get(key, p) is None
+    cache.put(key, p, quote(500))
+    cache.notify_round(10)  # same round keeps the quotes
+    assert cache.get(key, p) is not None
+
+
+def test_lru_eviction(clock):
+    cache = QuoteCache(maxsize=2)
+    ps = [params(amount) for amount in (1, 2, 3)]
+    keys = [cache.key("mainnet", p) for p in ps]
+    cache.put(keys[0], ps[0], quote(1))
+    cache.put(keys[1], ps[1], quote(2))
+    cache.get(keys[0], ps[0])  # most recently used
+    cache.put(keys[2], ps[2], quote(3))
+    assert cache.get(keys[1], ps[1]) is None
+    assert cache.get(keys[0], ps[0]) is not None
+    assert cache.get(keys[2], ps[2]) is not None
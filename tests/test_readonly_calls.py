@@ -0,0 +1,80 @@
+from base64 import b64encode
+import pytest
+from algosdk import abi
+from algosdk.account import generate_account
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+from ffsdk.readonly_calls import RETURN_PREFIX, ReadOnlyCall, ReadOnlyCaller
+
+APP_ID = 1234
+CONTRACT = abi.Contract(
+    "Views",
+    [
+        abi.Method.from_signature("balance(account,asset)uint64"),
+        abi.Method.from_signature("pool(application)uint64"),
+    ],
+)
+UINT64 = abi.UintType(64)
+
+
+class FakeAlgod(AlgodClient):
+    """Algod simulating views whose values depend on their reference args"""
+
+    def __init__(self, balances: dict[tuple[str, int], int]):
+        super().__init__("", "http://localhost")
+        self.balances = balances
+        self.simulated = 0
+
+    def suggested_params(self, **kwargs):
+        return SuggestedParams(
+            1000, 1000, 2000, "wGHE2Pwdvd7S12BL5FaOP20EGYesN73ktiC1qzkkit8=", True
+        )
+
+    def simulate_transactions(self, request, **kwargs):
+        results = []
+        for stxn in request.txn_groups[0].txns:
+            txn = stxn.transaction
+            if txn.accounts or txn.foreign_assets:
+                account = ([txn.sender] + (txn.accounts or []))[txn.app_args[1][0]]
+                asset = txn.foreign_assets[txn.app_args[2][0]]
+                value = self.balances[account, asset]
+            else:
+                value = txn.foreign_apps[txn.app_args[1][0] - 1]
+            log = b64encode(RETURN_PREFIX + UINT64.encode(value)).decode()
+            results.append({"txn-result": {"logs": [log]}})
+        self.simulated += 1
+        return {"last-round": 1000, "txn-groups": [{"txn-results": results}]}
+
+
+@pytest.fixture
+def accounts():
+    return [generate_account()[1] for _ in range(2)]
+
+
+@pytest.fixture
+def algod(accounts):
+    a, b = accounts
+    return FakeAlgod({(a, 7): 10, (b, 7): 20, (a, 8): 30})
+
+
+def balance(account: str, asset: int) -> ReadOnlyCall:
+    return ReadOnlyCall(CONTRACT, APP_ID, "balance", [account, asset])
+
+
+def test_calls_differing_in_references_are_cached_apart(algod, accounts):
+    a, b = accounts
+    caller = ReadOnlyCaller(algod, a)
+    calls = [balance(b, 7), balance(a, 8), balance(a, 7)]
+    assert caller.call(calls) == [20, 30, 10]
+    assert caller.call_one(CONTRACT, APP_ID, "balance", [b, 7]) == 20
+    assert caller.call_one(CONTRACT, APP_ID, "pool", [55]) == 55
+    assert caller.call_one(CONTRACT, APP_ID, "pool", [66]) == 66
+    assert algod.simulated == 3
+
+
+def test_repeated_calls_are_cached(algod, accounts):
+    a, b = accounts
+    caller = ReadOnlyCaller(algod, a)
+    assert caller.call([balance(a, 7), balance(b, 7)]) == [10, 20]
+    assert caller.call([balance(b, 7), balance(a, 7), balance(a, 7)]) == [20, 10, 10]
+    assert algod.simulated == 1
@@ -0,0 +1,166 @@
+import multiprocessing as mp
+from time import sleep
+from multiprocessing.shared_memory import SharedMemory
+import pytest
+from ffsdk.lend.datatypes import (
+    LLSCollateral,
+    LoanLocalState,
+    OraclePrice,
+    PoolManagerInfo,
+    PoolMetadataFromManager,
+    PoolStateFromManager,
+    ProtocolSnapshot,
+)
+from ffsdk.lend.snapshot import (
+    _HEADER,
+    LAYOUT_VERSION,
+    MAGIC,
+    SnapshotPublisher,
+    SnapshotReader,
+)
+
+ROUND = 1000
+
+
+def make_snapshot(round: int, loans: int = 100) -> ProtocolSnapshot:
+    pool = PoolStateFromManager(
+        round, round, round, round, round, round, PoolMetadataFromManager(1, 2, 3)
+    )
+    book = [
+        LoanLocalState("USER", f"ESCROW{i}", [LLSCollateral(1, round)], [])
+        for i in range(loans)
+    ]
+    return ProtocolSnapshot(
+        round,
+        PoolManagerInfo("ADMIN", {1: pool}),
+        {},
+        {0: OraclePrice(round, round)},
+        {7: book},
+    )
+
+
+def read_in_process(name, queue):
+    with SnapshotReader(name) as reader:
+        queue.put(reader.wait(timeout=10))
+
+
+def check_reads_in_process(name, queue, last):
+    """Reports the reads whose snapshot is not the one of their generation"""
+    reads, mismatches = 0, []
+    with SnapshotReader(name) as reader:
+        queue.put("attached")
+        generation = 0
+        while generation < last:
+            result = reader.wait(generation, timeout=10, poll_interval=0)
+            if result is None:
+                break
+            generation, snapshot = result
+            reads += 1
+            if snapshot.round != ROUND + generation:
+                mismatches.append((generation, snapshot.round))
+    queue.put((generation, reads, mismatches))
+
+
+@pytest.fixture
+def publisher():
+    with SnapshotPublisher(slot_size=2**20) as publisher:
+        yield publisher
+
+
+def test_round_trip(publisher):
+    with SnapshotReader(publisher.name) as reader:
+        assert reader.generation == 0
+        assert reader.round is None
+        with pytest.raises(LookupError):
+            reader.read()
+
+        for round in (10, 11, 12):
+            snapshot = make_snapshot(round)
+            assert publisher.publish(snapshot) == round - 9
+            assert reader.generation == round - 9
+            assert reader.round == round
+            assert reader.read() == snapshot
+
+
+def test_read_is_cached_per_generation(publisher):
+    publisher.publish(make_snapshot(10))
+    with SnapshotReader(publisher.name) as reader:
+        first = reader.read()
+        assert reader.read() is first
+        publisher.publish(make_snapshot(11))
+        assert reader.read() is not first
+        assert reader.read().round == 11
+
+
+def test_wait(publisher):
+    with SnapshotReader(publisher.name) as reader:
+        assert reader.wait(timeout=0.05, poll_interval=0.01) is None
+        publisher.publish(make_snapshot(10))
+        generation, snapshot = reader.wait(timeout=1)
+        assert (generation, snapshot.round) == (1, 10)
+        assert reader.wait(generation, timeout=0.05, poll_interval=0.01) is None
+
+
+def test_snapshot_exceeding_slot_size():
+    with SnapshotPublisher(slot_size=1024) as publisher:
+        with pytest.raises(ValueError, match="exceeds the slot size"):
+            publisher.publish(make_snapshot(10))
+        assert publisher.generation == 0
+
+
+def test_rejects_other_blocks():
+    shm = SharedMemory(create=True, size=1024)
+    try:
+        with pytest.raises(ValueError, match="Not a protocol snapshot block"):
+            SnapshotReader(shm.name)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_read_from_another_process(publisher):
+    context = mp.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=read_in_process, args=(publisher.name, queue))
+    process.start()
+    snapshot = make_snapshot(10)
+    publisher.publish(snapshot)
+    assert queue.get(timeout=30) == (1, snapshot)
+    process.join(timeout=30)
+    assert process.exitcode == 0
+
+
+def test_concurrent_publisher_and_reader(publisher):
+    last = 500
+    context = mp.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(
+        target=check_reads_in_process, args=(publisher.name, queue, last)
+    )
+    process.start()
+    snapshots = [
+        make_snapshot(ROUND + generation, 10) for generation in range(1, last + 1)
+    ]
+    assert queue.get(timeout=30) == "attached"
+    for snapshot in snapshots:
+        publisher.publish(snapshot)
+        sleep(0.0002)
+    generation, reads, mismatches = queue.get(timeout=30)
+    assert (generation, mismatches) == (last, [])
+    assert reads > 1
+    process.join(timeout=30)
+    assert process.exitcode == 0
+
+
+def test_half_updated_header_is_not_read(publisher):
+    publisher.publish(make_snapshot(10))
+    publisher.publish(make_snapshot(11))
+    with SnapshotReader(publisher.name, max_retries=3) as reader:
+        # new generation with the active slot of the previous snapshot
+        _HEADER.pack_into(
+            publisher._shm.buf, 0, MAGIC, LAYOUT_VERSION, publisher.slot_size, 3, 0
+        )
+        with pytest.raises(RuntimeError, match="consistent"):
+            reader.read()
+        with pytest.raises(RuntimeError, match="consistent"):
+            reader.round
@@ -0,0 +1,82 @@
+import json
+from base64 import b64encode
+import pytest
+import requests
+from algosdk.account import generate_account
+from standin_server import RouterStandInServer
+
+USER = generate_account()[1]
+
+
+@pytest.fixture(scope="module")
+def server():
+    with RouterStandInServer() as server:
+        yield server
+
+
+def quote(server, amount, **query):
+    query = {
+        "network": "mainnet",
+        "fromAsset": 0,
+        "toAsset": 31566704,
+        "amount": amount,
+        "type": "FIXED_INPUT",
+        **query,
+    }
+    return requests.get(server.url + "/v2/fetch/quote", params=query, timeout=5)
+
+
+def prepare(server, slippageBps, userAddress=USER, **payload):
+    payload = {
+        "network": "mainnet",
+        "fromAsset": 0,
+        "toAsset": 31566704,
+        "amount": 1_000_000,
+        "type": "FIXED_INPUT",
+        "quoteAmount": 500_000,
+        "data": {"paths": [{"swaps": [{"pool": 0}]}]},
+        **payload,
+    }
+    query = {
+        "userAddress": userAddress,
+        "slippageBps": slippageBps,
+        "txnPayload": b64encode(json.dumps(payload).encode()).decode(),
+    }
+    return requests.get(server.url + "/v2/prepare/swap", params=query, timeout=5)
+
+
+def test_quote_and_prepare(server):
+    r = quote(server, 1_000_000)
+    assert r.status_code == 200
+    assert int(r.json()["result"]["quoteAmount"]) > 0
+    assert prepare(server, 50).status_code == 200
+
+
+@pytest.mark.parametrize("amount", [0, -5, 2**64, "abc"])
+def test_invalid_quote_amounts(server, amount):
+    r = quote(server, amount)
+    assert r.status_code == 400
+    assert "error" in r.json()
+
+
+@pytest.mark.parametrize(
+    "slippageBps, payload",
+    [
+        (-10, {}),
+        (10_001, {}),
+        (50, {"amount": -5}),
+        (50, {"quoteAmount": -3}),
+        (50, {"quoteAmount": 2**65}),
+        (50, {"userAddress": "A" * 58}),
+        (50, {"type": "FIXED_OUTPUT", "quoteAmount": 2**64}),
+    ],
+)
+def test_invalid_prepare_requests(server, slippageBps, payload):
+    r = prepare(server, slippageBps, **payload)
+    assert r.status_code == 400
+    assert "error" in r.json()
+
+
+def test_unknown_route(server):
+    r = requests.get(server.url + "/v2/fetch/unknown", timeout=5)
+    assert r.status_code == 404
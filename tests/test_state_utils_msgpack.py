@@ -0,0 +1,92 @@
+import msgpack
+import pytest
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+from ffsdk.state_utils import (
+    _app_creators,
+    get_balances,
+    get_global_state,
+    get_local_state_at_app,
+    get_local_states,
+)
+
+APP_ID = 1234
+CREATOR = "CREATOR"
+GLOBAL_STATE = {b"k": {b"tt": 2, b"ui": 5}, b"b": {b"tt": 1, b"tb": b"\x01"}}
+
+
+class FakeAlgod(AlgodClient):
+    def __init__(self):
+        super().__init__("", "http://localhost")
+        self.paths = []
+        self.app_info_calls = 0
+        self.error = None
+
+    def algod_request(self, method, path, params=None, *args, **kwargs):
+        self.paths.append(path)
+        if self.error is not None:
+            raise self.error
+        return msgpack.packb({b"app-params": {b"gs": GLOBAL_STATE}}, use_bin_type=True)
+
+    def application_info(self, app_id, **kwargs):
+        self.app_info_calls += 1
+        return {"params": {"creator": CREATOR}}
+
+
+@pytest.fixture
+def algod():
+    _app_creators.pop(APP_ID, None)
+    yield FakeAlgod()
+    _app_creators.pop(APP_ID, None)
+
+
+def test_global_state_looks_up_creator_once(algod):
+    for _ in range(2):
+        state = get_global_state(algod, APP_ID, response_format="msgpack")
+        assert state == {"k": 5, "b": b"\x01"}
+    assert algod.app_info_calls == 1
+    assert algod.paths == [f"/accounts/{CREATOR}/applications/{APP_ID}"] * 2
+
+
+def test_global_state_with_creator_skips_lookup(algod):
+    state = get_global_state(algod, APP_ID, response_format="msgpack", creator="OTHER")
+    assert state == {"k": 5, "b": b"\x01"}
+    assert algod.app_info_calls == 0
+    assert algod.paths == [f"/accounts/OTHER/applications/{APP_ID}"]
+
+
+def test_global_state_of_missing_app(algod):
+    algod.error = AlgodHTTPError("application does not exist", 404)
+    with pytest.raises(Exception, match="Application does not exist"):
+        get_global_state(algod, APP_ID, response_format="msgpack")
+
+
+@pytest.mark.parametrize(
+    "error", [AlgodHTTPError("internal error", 500), ConnectionError("reset")]
+)
+def test_global_state_errors_propagate(algod, error):
+    algod.error = error
+    with pytest.raises(type(error)) as info:
+        get_global_state(algod, APP_ID, response_format="msgpack")
+    assert info.value is error
+
+
+@pytest.mark.parametrize(
+    "read",
+    [
+        lambda algod: get_global_state(
+            algod, APP_ID, block=10, response_format="msgpack"
+        ),
+        lambda algod: get_local_states(
+            algod, "ADDR", block=10, response_format="msgpack"
+        ),
+        lambda algod: get_local_state_at_app(
+            algod, APP_ID, "ADDR", block=10, response_format="msgpack"
+        ),
+        lambda algod: get_balances(algod, "ADDR", block=10, response_format="msgpack"),
+    ],
+)
+def test_msgpack_rejects_block(algod, read):
+    with pytest.raises(ValueError, match="latest round"):
+        read(algod)
+    assert algod.paths == []
@@ -0,0 +1,111 @@
+import threading
+import pytest
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import PaymentTxn, SuggestedParams
+from ffsdk.transaction_utils import GroupSubmitResult, submit_and_confirm_groups
+
+GENESIS_HASH = "wGHE2Pwdvd7S12BL5FaOP20EGYesN73ktiC1qzkkit8="
+START_ROUND = 1000
+
+
+class FakeAlgod:
+    """Algod confirming the submitted groups at scheduled rounds"""
+
+    def __init__(self, confirmations: dict[int, int], rejected: set[int]):
+        self.round = START_ROUND
+        self.confirmations = confirmations  # amount of group -> confirmation round
+        self.rejected = rejected  # amounts of groups rejected by the node
+        self.blocks: dict[int, list[str]] = {}
+        self.lock = threading.Lock()
+        self.status_after_block_calls = 0
+        self.block_requests = []
+
+    def status(self):
+        return {"last-round": self.round}
+
+    def send_transactions(self, group):
+        amount = group[0].transaction.amt
+        if amount in self.rejected:
+            raise AlgodHTTPError("overspend", 400)
+        txid = group[0].get_txid()
+        with self.lock:
+            if amount in self.confirmations:
+                rnd = self.confirmations[amount]
+                self.blocks.setdefault(rnd, []).extend(
+                    stxn.get_txid() for stxn in group
+                )
+        return txid
+
+    def status_after_block(self, round):
+        assert round == self.round
+        self.status_after_block_calls += 1
+        self.round += 2  # two blocks per wait, both scanned
+        return {"last-round": self.round}
+
+    def get_block_txids(self, round):
+        self.block_requests.append(round)
+        return {"blockTxids": self.blocks.get(round, [])}
+
+
+def make_group(amount: int, lastValid: int, size: int = 2):
+    sk, addr = generate_account()
+    params = SuggestedParams(1000, START_ROUND, lastValid, GENESIS_HASH, flat_fee=True)
+    txns = [
+        PaymentTxn(addr, params, addr, amount, note=bytes([i])) for i in range(size)
+    ]
+    return AccountTransactionSigner(sk).sign_transactions(txns, list(range(size)))
+
+
+@pytest.fixture
+def groups():
+    return [
+        make_group(0, START_ROUND + 100),  # confirmed at START_ROUND + 1
+        make_group(1, START_ROUND + 100),  # rejected by the node
+        make_group(2, START_ROUND + 100),  # confirmed at START_ROUND + 4
+        make_group(3, START_ROUND + 3),  # never confirmed, expires
+        make_group(4, START_ROUND + 100),  # confirmed at START_ROUND + 4
+    ]
+
+
+@pytest.fixture
+def algod():
+    confirmations = {0: START_ROUND + 1, 2: START_ROUND + 4, 4: START_ROUND + 4}
+    return FakeAlgod(confirmations, rejected={1})
+
+
+def test_results(algod, groups):
+    rounds = []
+    results = list(
+        submit_and_confirm_groups(algod, groups, max_workers=3, on_round=rounds.append)
+    )
+    byIndex = {result.index: result for result in results}
+    assert len(results) == len(groups) == len(byIndex)
+
+    # rejections first, then confirmations round by round, expired groups last
+    assert results[0] == GroupSubmitResult(1, None, error="overspend")
+    assert results[1].index == 0
+    assert {r.index for r in results[2:4]} == {2, 4}
+    assert results[4].index == 3
+    for i, rnd in ((0, START_ROUND + 1), (2, START_ROUND + 4), (4, START_ROUND + 4)):
+        assert byIndex[i] == GroupSubmitResult(i, groups[i][0].get_txid(), rnd)
+    assert byIndex[3] == GroupSubmitResult(3, groups[3][0].get_txid(), error="expired")
+
+    # one wait and one block request per round
+    assert rounds == [START_ROUND + 2, START_ROUND + 4]
+    assert algod.status_after_block_calls == 2
+    assert algod.block_requests == list(range(START_ROUND + 1, START_ROUND + 5))
+
+
+def test_all_rejected(algod, groups):
+    algod.rejected = set(range(len(groups)))
+    results = list(submit_and_confirm_groups(algod, groups))
+    assert sorted(r.index for r in results) == list(range(len(groups)))
+    assert all(r.txid is None and r.error == "overspend" for r in results)
+    assert algod.status_after_block_calls == 0
+
+
+def test_nothing_to_submit(algod):
+    assert list(submit_and_confirm_groups(algod, [])) == []
+    assert algod.status_after_block_calls == 0
@@ -0,0 +1,147 @@
+import threading
+import time
+import pytest
+from algosdk.transaction import SuggestedParams
+from ffsdk import suggested_params as suggested_params_module
+from ffsdk.suggested_params import SuggestedParamsProvider
+
+GENESIS_HASH = "wGHE2Pwdvd7S12BL5FaOP20EGYesN73ktiC1qzkkit8="
+VALIDITY = 1000
+
+
+class StubAlgod:
+    """Serves suggested params valid from its current round"""
+
+    def __init__(self, round: int = 1000):
+        self.round = round
+        self.fetches = 0
+        self.fetched = threading.Event()
+        self.error = None
+
+    def suggested_params(self):
+        self.fetches += 1
+        self.fetched.set()
+        if self.error is not None:
+            raise self.error
+        return SuggestedParams(
+            1000, self.round, self.round + VALIDITY, GENESIS_HASH, flat_fee=True
+        )
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(suggested_params_module, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def algod():
+    return StubAlgod()
+
+
+@pytest.fixture
+def provider(algod, clock):
+    return SuggestedParamsProvider(
+        algod, refresh_margin=100, round_time=2.0, max_age=300.0
+    )
+
+
+def wait_background_refresh(provider: SuggestedParamsProvider):
+    deadline = time.monotonic() + 5
+    while provider._refreshing:
+        assert time.monotonic() < deadline, "background refresh still running"
+        time.sleep(0.001)
+
+
+def test_params_are_cached(provider, algod):
+    params = provider.get()
+    params.fee = 1
+    params = provider.get()
+    assert (params.first, params.last, params.fee) == (1000, 2000, 1000)
+    assert provider.sp_fee(3000).fee == 3000
+    assert algod.fetches == 1
+
+
+def test_current_round_is_estimated_from_the_elapsed_time(provider, clock):
+    provider.get()
+    clock.now += 21
+    assert provider.current_round() == 1010
+
+
+def test_expired_params_are_refetched(provider, algod, clock):
+    provider.get()
+    algod.round = 2000
+    clock.now += 2 * VALIDITY
+    params = provider.get()
+    assert (params.first, params.last) == (2000, 3000)
+    assert algod.fetches == 2
+
+
+def test_notify_round_moves_the_window(provider, algod, clock):
+    provider.get()
+    clock.now += 20
+    provider.notify_round(1050)
+    params = provider.get()
+    assert (params.first, params.last) == (1050, 1050 + VALIDITY)
+    assert provider.current_round() == 1050
+    # older rounds are ignored
+    provider.notify_round(1040)
+    assert provider.get().first == 1050
+    assert algod.fetches == 1
+
+
+def test_notify_round_before_the_first_fetch(provider, algod):
+    provider.notify_round(1200)
+    params = provider.get()
+    assert (params.first, params.last) == (1200, 1200 + VALIDITY)
+    assert algod.fetches == 1
+
+
+def test_window_near_expiry_is_refreshed_in_the_background(provider, algod, clock):
+    provider.get()
+    algod.fetched.clear()
+    algod.round = 1950
+    clock.now += 2 * (VALIDITY - 50)  # estimated round 1950, within the margin
+    params = provider.get()
+    assert (params.first, params.last) == (1000, 2000)  # served from the cache
+    assert algod.fetched.wait(timeout=5)
+    wait_background_refresh(provider)
+    params = provider.get()
+    assert (params.first, params.last) == (1950, 1950 + VALIDITY)
+    assert algod.fetches == 2
+
+
+def test_old_params_are_refreshed_in_the_background(provider, algod, clock):
+    provider.get()
+    algod.fetched.clear()
+    clock.now += 301
+    provider.get()
+    assert algod.fetched.wait(timeout=5)
+    wait_background_refresh(provider)
+    assert algod.fetches == 2
+
+
+def test_failed_background_refresh_is_retried(provider, algod, clock):
+    provider.get()
+    algod.fetched.clear()
+    algod.error = ConnectionError("reset")
+    clock.now += 301
+    assert provider.get().first == 1000
+    assert algod.fetched.wait(timeout=5)
+    wait_background_refresh(provider)
+
+    algod.fetched.clear()
+    algod.error = None
+    provider.get()
+    assert algod.fetched.wait(timeout=5)
+    wait_background_refresh(provider)
+    assert algod.fetches == 3
@@ -0,0 +1,166 @@
+from copy import deepcopy
+from dataclasses import replace
+import pytest
+from algosdk.account import generate_account
+from algosdk.encoding import msgpack_decode
+from ffsdk.config import Network
+from ffsdk.router.checks import (
+    SwapTransactionsValidator,
+    checkSwapTransactions,
+    swapTransactionsValidator,
+)
+from ffsdk.router.datatypes import SwapMode, SwapParams, SwapQuote
+from standin_server import RouterStandInServer
+
+USER = generate_account()[1]
+OTHER = generate_account()[1]
+SLIPPAGE_BPS = 50
+USDC = 31566704
+
+
+@pytest.fixture(scope="module")
+def server():
+    # endpoints are called directly, the server is never started
+    server = RouterStandInServer()
+    yield server
+    server.server_close()
+
+
+def prepare(server, params: SwapParams, network: str = "mainnet"):
+    """Returns the arguments of validate for a swap prepared by the stand-in server"""
+    quote = server.fetchQuote(
+        {
+            "network": network,
+            "fromAsset": params.fromAssetId,
+            "toAsset": params.toAssetId,
+            "amount": params.amount,
+            "type": params.swapMode.value,
+        }
+    )
+    swapQuote = SwapQuote(
+        int(quote["quoteAmount"]),
+        quote["priceImpact"],
+        quote["microalgoTxnsFee"],
+        quote["txnPayload"],
+    )
+    txns = server.prepareSwap(
+        {
+            "userAddress": USER,
+            "slippageBps": SLIPPAGE_BPS,
+            "txnPayload": swapQuote.txnPayload,
+        }
+    )
+    return [msgpack_decode(txn) for txn in txns], params, USER, SLIPPAGE_BPS, swapQuote
+
+
+SWAPS = [
+    SwapParams(0, USDC, 1_000_000, SwapMode.FIXED_INPUT),
+    SwapParams(USDC, 0, 1_000_000, SwapMode.FIXED_INPUT),
+    SwapParams(0, USDC, 1_000_000, SwapMode.FIXED_OUTPUT),
+    SwapParams(USDC, 0, 1_000_000, SwapMode.FIXED_OUTPUT),
+]
+
+
+@pytest.mark.parametrize("params", SWAPS)
+@pytest.mark.parametrize(
+    "network, name", [(Network.MAINNET, "mainnet"), (Network.TESTNET, "testnet")]
+)
+def test_valid_swaps(server, params, network, name):
+    swap = prepare(server, params, name)
+    swapTransactionsValidator(network).validate(*swap)
+    checkSwapTransactions(network, *swap)
+
+
+def set_attr(index, name, value):
+    def tamper(txns, params, quote):
+        setattr(txns[index], name, value)
+        return txns, params, quote
+
+    return tamper
+
+
+def set_app_arg(index, arg, value):
+    def tamper(txns, params, quote):
+        txns[index].app_args[arg] = value
+        return txns, params, quote
+
+    return tamper
+
+
+def change_params(**changes):
+    def tamper(txns, params, quote):
+        return txns, replace(params, **changes), quote
+
+    return tamper
+
+
+def change_quote(quoteAmount):
+    def tamper(txns, params, quote):
+        return txns, params, SwapQuote(quoteAmount, 0.0, 0, quote.txnPayload)
+
+    return tamper
+
+
+def drop_forward(txns, params, quote):
+    return [txns[0], txns[-1]], params, quote
+
+
+TAMPERINGS = [
+    (set_attr(0, "rekey_to", OTHER), "Unexpected rekey"),
+    (set_attr(0, "sender", OTHER), "Incorrect sender"),
+    (set_attr(0, "receiver", OTHER), "Incorrect receiver"),
+    (set_attr(0, "close_remainder_to", OTHER), "Unexpected close remainder to"),
+    (set_attr(0, "amt", 1), "Sending incorrect fixed input amount"),
+    (change_params(fromAssetId=USDC), "Sending algo instead of the asset"),
+    (set_attr(1, "sender", OTHER), r"Incorrect sender \(swap_forward\)"),
+    (set_attr(1, "index", 1), "Incorrect application index: 1"),
+    (set_app_arg(1, 0, b"\0\0\0\0"), "Incorrect selector"),
+    (set_attr(-1, "sender", OTHER), r"Incorrect sender \(end_swap\)"),
+    (set_attr(-1, "index", 1), "Incorrect application index"),
+    (set_app_arg(-1, 0, b"\0\0\0\0"), "Incorrect swap end selector"),
+    (change_params(swapMode=SwapMode.FIXED_OUTPUT), "Incorrect swap end selector"),
+    (set_app_arg(-1, 1, (1).to_bytes(8, "big")), "Receiving incorrect algo/asset"),
+    (change_quote(1), "Receiving incorrect fixed input amount"),
+    (drop_forward, "Missing swap forward transactions"),
+]
+
+
+@pytest.mark.parametrize("tamper, message", TAMPERINGS)
+def test_invalid_swaps(server, tamper, message):
+    txns, params, user, slippage, quote = prepare(server, SWAPS[0])
+    txns, params, quote = tamper(deepcopy(txns), params, quote)
+    with pytest.raises(ValueError, match=message):
+        checkSwapTransactions(Network.MAINNET, txns, params, user, slippage, quote)
+
+
+def test_invalid_asset_transfer(server):
+    txns, params, user, slippage, quote = prepare(server, SWAPS[1])
+    txns[0].index = 1
+    with pytest.raises(ValueError, match="Sending incorrect asset"):
+        checkSwapTransactions(Network.MAINNET, txns, params, user, slippage, quote)
+
+
+def test_invalid_fixed_output_amounts(server):
+    txns, params, user, slippage, quote = prepare(server, SWAPS[2])
+    txns[0].amt += 1
+    with pytest.raises(ValueError, match="Sending incorrect fixed output amount"):
+        checkSwapTransactions(Network.MAINNET, txns, params, user, slippage, quote)
+
+
+def test_validate_many(server):
+    swaps = [prepare(server, params) for params in SWAPS]
+    swaps[1][0][0].sender = OTHER
+    swaps.append(([], *swaps[0][1:]))
+    results = swapTransactionsValidator(Network.MAINNET).validateMany(swaps)
+    assert [r.index for r in results] == [0, 1, 2, 3, 4]
+    assert [r.valid for r in results] == [True, False, True, True, False]
+    assert results[1].error == "Incorrect sender"
+    assert results[0].error is None
+
+
+def test_validators_are_cached_per_network():
+    mainnet = swapTransactionsValidator(Network.MAINNET)
+    assert swapTransactionsValidator(Network.MAINNET) is mainnet
+    assert swapTransactionsValidator(Network.TESTNET) is not mainnet
+    with pytest.raises(ValueError, match="Unknown network type"):
+        SwapTransactionsValidator("devnet")
@@ -0,0 +1,58 @@
+import pytest
+from algosdk.account import generate_account
+from algosdk.box_reference import BoxReference
+from algosdk.transaction import SuggestedParams
+from ffsdk.xalgo.consensus import (
+    MAX_CACHED_ALLOCATIONS,
+    _resourceAllocation,
+    getTxnsAfterResourceAllocation,
+    prepareDummyTransaction,
+)
+from ffsdk.xalgo.constants.mainnet_constants import MainnetConsensusConfig
+from ffsdk.xalgo.datatypes import ConsensusState, ProposerBalance
+
+CONFIG = MainnetConsensusConfig
+
+
+@pytest.fixture
+def params():
+    return SuggestedParams(
+        1000, 1000, 2000, "wGHE2Pwdvd7S12BL5FaOP20EGYesN73ktiC1qzkkit8=", flat_fee=True
+    )
+
+
+@pytest.fixture
+def state():
+    proposers = [ProposerBalance(generate_account()[1], 10**9) for _ in range(10)]
+    admin = proposers[0].address
+    return ConsensusState(
+        1000, 10**10, 10**10, proposers, admin, admin, admin, 0, 10, 0, 0, 0, 0, 0, 0,
+        True, True
+    )  # fmt: skip
+
+
+def allocate(state, sender, params):
+    txns = [prepareDummyTransaction(CONFIG, sender, params)]
+    return getTxnsAfterResourceAllocation(CONFIG, state, txns, [], sender, params)
+
+
+def test_dummies_do_not_share_lists(state, params):
+    sender = generate_account()[1]
+    first = allocate(state, sender, params)
+    second = allocate(state, sender, params)
+    # 10 proposers in chunks of 4: two dummy calls before the allocated call
+    assert len(first) == len(second) == 3
+    expected = (list(second[0].app_args), list(second[0].boxes))
+
+    dummy = first[0]
+    dummy.app_args.append(b"x")
+    dummy.boxes.append(BoxReference(0, b"x"))
+    third = allocate(state, sender, params)[0]
+    assert (third.app_args, third.boxes) == expected
+
+
+def test_chunks_are_capped(state):
+    allocation = _resourceAllocation(state)
+    for _ in range(3 * MAX_CACHED_ALLOCATIONS):
+        allocation.accountChunks([], generate_account()[1])
+    assert len(allocation.chunks) <= MAX_CACHED_ALLOCATIONS
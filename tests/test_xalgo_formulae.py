@@ -0,0 +1,74 @@
+import random
+import pytest
+from ffsdk.mathlib import ONE_16_DP
+from ffsdk.xalgo.datatypes import ConsensusState
+from ffsdk.xalgo.formulae import (
+    convertAlgoToXAlgoWhenDelay,
+    convertAlgoToXAlgoWhenDelayBatch,
+    convertAlgoToXAlgoWhenImmediate,
+    convertAlgoToXAlgoWhenImmediateBatch,
+    convertXAlgoToAlgo,
+    convertXAlgoToAlgoBatch,
+)
+
+ADDR = "A" * 58
+
+
+def consensus_state(algoBalance: int, supply: int, premium: int) -> ConsensusState:
+    return ConsensusState(
+        1,
+        algoBalance,
+        supply,
+        [],
+        ADDR,
+        ADDR,
+        ADDR,
+        0,
+        0,
+        0,
+        0,
+        premium,
+        0,
+        0,
+        0,
+        True,
+        True,
+    )
+
+
+rng = random.Random(36)
+STATES = [
+    consensus_state(1, 1, 0),
+    consensus_state(10**15, 10**15, 0),
+    consensus_state(10**16 + 7, 9 * 10**15 + 3, ONE_16_DP // 1000),
+] + [
+    consensus_state(
+        rng.randrange(1, 2**64), rng.randrange(1, 2**64), rng.randrange(0, ONE_16_DP)
+    )
+    for _ in range(20)
+]
+AMOUNTS = [0, 1, 999, 10**6, 2**64 - 1] + [rng.randrange(0, 2**64) for _ in range(200)]
+
+
+@pytest.mark.parametrize(
+    "batch, scalar",
+    [
+        (convertAlgoToXAlgoWhenImmediateBatch, convertAlgoToXAlgoWhenImmediate),
+        (convertAlgoToXAlgoWhenDelayBatch, convertAlgoToXAlgoWhenDelay),
+        (convertXAlgoToAlgoBatch, convertXAlgoToAlgo),
+    ],
+)
+def test_batch_matches_scalar(batch, scalar):
+    res = batch(AMOUNTS, STATES)
+    assert len(res) == len(STATES)
+    for cs, amounts in zip(STATES, res):
+        assert amounts == [scalar(amount, cs) for amount in AMOUNTS]
+
+
+def test_batch_accepts_any_int_sequence():
+    cs = STATES[2]
+    assert convertXAlgoToAlgoBatch(range(5), [cs]) == [
+        [convertXAlgoToAlgo(amount, cs) for amount in range(5)]
+    ]
+    assert convertAlgoToXAlgoWhenDelayBatch((), [cs]) == [[]]
+    assert convertAlgoToXAlgoWhenDelayBatch([1], []) == []
@@ -0,0 +1,142 @@
+from base64 import b64encode
+import pytest
+from algosdk.account import generate_account
+from algosdk.encoding import decode_address
+from algosdk.logic import get_application_address
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+from ffsdk.readonly_calls import RETURN_PREFIX
+from ffsdk.xalgo.abi_contracts import xAlgoABIContract
+from ffsdk.xalgo.consensus import (
+    checkXAlgoRateParity,
+    getConsensusState,
+    getXAlgoRateLocal,
+)
+from ffsdk.xalgo.constants.mainnet_constants import MainnetConsensusConfig
+
+CONFIG = MainnetConsensusConfig
+APP_ADDR = get_application_address(CONFIG.consensusAppId)
+XALGO_TOTAL = 10_000_000_000_000_000
+MIN_BALANCE = 100_000
+PENDING_STAKE = 7_000_000
+UNCLAIMED_FEES = 3_000_000
+
+
+def uint(key: str, value: int) -> dict:
+    return {
+        "key": b64encode(key.encode()).decode(),
+        "value": {"type": 2, "uint": value},
+    }
+
+
+def address(key: str, addr: str) -> dict:
+    return {
+        "key": b64encode(key.encode()).decode(),
+        "value": {"type": 1, "bytes": b64encode(decode_address(addr)).decode()},
+    }
+
+
+class FakeLedger(AlgodClient):
+    """Algod serving the consensus app, its proposers and xALGO from in-memory state"""
+
+    def __init__(self, balances: list[int], appHolding: int):
+        super().__init__("", "http://localhost")
+        self.proposers = [generate_account()[1] for _ in balances]
+        self.balances = dict(zip(self.proposers, balances))
+        self.appHolding = appHolding
+        self.round = 1000
+        self.account_rounds = {}  # address -> round the account is read at
+
+    def application_info(self, app_id, **kwargs):
+        admin = self.proposers[0]
+        return {
+            "params": {
+                "global-state": [
+                    address("admin", admin),
+                    address("register_admin", admin),
+                    address("xgov_admin", admin),
+                    uint("num_proposers", len(self.proposers)),
+                    uint("total_pending_stake", PENDING_STAKE),
+                    uint("total_unclaimed_fees", UNCLAIMED_FEES),
+                ]
+            }
+        }
+
+    def application_box_by_name(self, app_id, box_name, **kwargs):
+        value = b"".join(decode_address(addr) for addr in self.proposers)
+        return {"round": self.round, "name": "", "value": b64encode(value).decode()}
+
+    def account_info(self, address, **kwargs):
+        return {
+            "round": self.account_rounds.get(address, self.round),
+            "amount": self.balances[address] + MIN_BALANCE,
+            "min-balance": MIN_BALANCE,
+        }
+
+    def account_asset_info(self, address, asset_id, **kwargs):
+        assert address == APP_ADDR and asset_id == CONFIG.xAlgoId
+        return {"round": self.round, "asset-holding": {"amount": self.appHolding}}
+
+    def asset_info(self, asset_id, **kwargs):
+        return {"params": {"total": XALGO_TOTAL}}
+
+    def suggested_params(self, **kwargs):
+        raise AssertionError("params are given")
+
+    def simulate_transactions(self, request, **kwargs):
+        # get_xalgo_rate of the consensus application
+        balances = [self.balances[addr] for addr in self.proposers]
+        value = (
+            sum(balances) - PENDING_STAKE - UNCLAIMED_FEES,
+            XALGO_TOTAL - self.appHolding,
+            b"".join(b.to_bytes(8, "big") for b in balances),
+        )
+        rate = xAlgoABIContract.get_method_by_name("get_xalgo_rate").returns.type
+        log = b64encode(RETURN_PREFIX + rate.encode(value)).decode()
+        return {
+            "last-round": self.round,
+            "txn-groups": [{"txn-results": [{"txn-result": {"logs": [log]}}]}],
+        }
+
+
+@pytest.fixture
+def ledger():
+    return FakeLedger([5_000_000_000, 7_500_000_000, 123_456_789], 9_000_000_000)
+
+
+@pytest.fixture
+def params():
+    return SuggestedParams(
+        1000, 1000, 2000, "wGHE2Pwdvd7S12BL5FaOP20EGYesN73ktiC1qzkkit8=", flat_fee=True
+    )
+
+
+def test_local_rate_formula(ledger):
+    algoBalance, supply, proposersBalances = getXAlgoRateLocal(
+        ledger, CONFIG, ledger.proposers, PENDING_STAKE, UNCLAIMED_FEES, ledger.round
+    )
+    # proposer balances exclude the min balance, pending stake and fees are not staked
+    assert [pb.algoBalance for pb in proposersBalances] == [
+        5_000_000_000,
+        7_500_000_000,
+        123_456_789,
+    ]
+    assert algoBalance == 12_623_456_789 - PENDING_STAKE - UNCLAIMED_FEES
+    assert supply == XALGO_TOTAL - 9_000_000_000
+
+
+def test_local_rate_matches_simulated(ledger, params):
+    simulated = getConsensusState(ledger, CONFIG, params)
+    local = getConsensusState(ledger, CONFIG, localRate=True)
+    assert local == simulated
+    checkXAlgoRateParity(ledger, CONFIG, params)
+
+
+def test_round_change_is_reported(ledger, params):
+    ledger.account_rounds[ledger.proposers[1]] = ledger.round + 1
+    with pytest.raises(ValueError, match="Round changed"):
+        getXAlgoRateLocal(
+            ledger, CONFIG, ledger.proposers, PENDING_STAKE, UNCLAIMED_FEES
+        )
+    with pytest.raises(ValueError, match="Round changed"):
+        checkXAlgoRateParity(ledger, CONFIG, params)